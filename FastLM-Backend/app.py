@@ -1,31 +1,471 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Blueprint, Response, request, jsonify, current_app, g, has_request_context, stream_with_context
+import click
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager, jwt_required, create_access_token, get_jwt_identity
 from werkzeug.security import generate_password_hash, check_password_hash
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import os
 from apscheduler.schedulers.background import BackgroundScheduler
-import requests
+from apscheduler.jobstores.base import JobLookupError
+from apscheduler.executors.pool import ThreadPoolExecutor as SchedulerThreadPoolExecutor
+from apscheduler.events import EVENT_JOB_MISSED
 import json
+import csv
+import io
+import logging
+from logging.handlers import QueueHandler, QueueListener
+import re
+import sys
+import atexit
+import copy
+import sqlite3
+from collections import OrderedDict, deque
+from contextlib import closing
+import threading
+import time
+import zlib
+import socket
+import uuid
+import queue
+from concurrent.futures import ThreadPoolExecutor
 
-app = Flask(__name__)
+# 기본 설정 (create_app에서 환경 변수/인자로 덮어씀)
+DEFAULT_CONFIG = {
+    'SECRET_KEY': 'your-secret-key-change-this-in-production',
+    'SQLALCHEMY_DATABASE_URI': 'sqlite:///fastlm.db',
+    'SQLALCHEMY_TRACK_MODIFICATIONS': False,
+    'JWT_SECRET_KEY': 'jwt-secret-string-change-this-in-production',
+    'JWT_ACCESS_TOKEN_EXPIRES': timedelta(days=1),
+    'JWT_QUERY_STRING_NAME': 'token',  # EventSource는 헤더를 보낼 수 없어 SSE에서만 ?token= 허용
+    'ARCHIVE_AFTER_DAYS': 90,       # 전송 완료 공지 보관 기간
+    'SCHEDULER_ENABLED': False,     # 백그라운드 스케줄러 실행 여부 (서버 실행 시에만 켬)
+    'SCHEDULER_LEADER_ELECTION': False,  # 다중 워커 실행 시 DB 임대로 스케줄러 리더 1개만 선출
+    'SCHEDULER_LEASE_TTL': 30,      # 리더 임대 유효 시간 (초), 리더가 죽으면 이 시간 후 다른 워커가 승계
+    'SCHEDULER_SYNC_INTERVAL': 5,   # 리더가 다른 워커에서 등록된 예약 작업을 가져오는 주기 (초)
+    'SCHEDULER_RECONCILE_INTERVAL': 300,  # 스케줄러/DB 예약 작업 정합성 점검 주기 (초)
+    'SCHEDULER_EXECUTOR_WORKERS': 20,     # 동시에 실행할 수 있는 예약 작업 수 (같은 시각 몰리는 전송량에 맞춰 조정)
+    'SCHEDULER_MISFIRE_GRACE_TIME': 300,  # 예약 시간보다 이 시간(초) 이상 늦게 실행될 작업은 misfire로 처리
+    'SCHEDULER_COALESCE': True,           # 밀린 실행을 한 번으로 합칠지 여부
+    'SCHEDULER_MAX_INSTANCES': 1,         # 같은 작업의 동시 실행 수
+    'SCHEDULER_ON_MISFIRE': 'send',       # misfire 작업 처리: send(늦게라도 전송), fail(실패로 기록)
+    'SCHEDULER_LATE_THRESHOLD': 60,       # 이 시간(초) 이상 늦게 전송되면 지연 경고 로그
+    'SCHEDULER_JOB_POLICIES': {},         # 공지 유형별 덮어쓰기 (예: {'attendance': {'misfire_grace_time': 600, 'on_misfire': 'fail'}})
+    'DISPATCH_LANES': {'high': 6, 'normal': 3, 'low': 1},  # 전송 레인과 가중치 (앞쪽이 가장 높은 우선순위)
+    'DISPATCH_TYPE_LANES': {'attendance': 'high', 'satisfaction': 'normal', 'thread': 'normal', 'custom': 'low'},
+    'DISPATCH_DEFAULT_LANE': 'normal',
+    'DISPATCH_WORKERS': 8,                # 모든 레인을 가중치대로 처리하는 전송 워커 수
+    'DISPATCH_RESERVED_WORKERS': 2,       # 가장 높은 레인만 처리하는 전송 워커 수
+    'BACKUP_DIR': 'backups',        # 온라인 백업 저장 위치 (instance 폴더 기준)
+    'BACKUP_INTERVAL_HOURS': 24,    # 자동 백업 주기 (0이면 자동 백업 안 함)
+    'BACKUP_KEEP': 7,               # 남겨 둘 백업 개수 (0이면 삭제하지 않음)
+    'BACKUP_PAGES_PER_STEP': 256,   # 온라인 백업 한 단계에서 복사할 페이지 수
+    'BACKUP_STEP_SLEEP': 0.05,      # 백업/증분 VACUUM 단계 사이 쉬는 시간 (초), 이 동안 다른 연결이 쓰기를 진행
+    'MAINTENANCE_INTERVAL_HOURS': 24,  # ANALYZE/증분 VACUUM 주기 (0이면 자동 실행 안 함)
+    'ANALYZE_LIMIT': 1000,          # ANALYZE 때 인덱스당 살펴볼 대략의 행 수 (0이면 전체)
+    'VACUUM_PAGES_PER_STEP': 500,   # 증분 VACUUM 한 번에 반환할 빈 페이지 수
+    'DB_BUSY_TIMEOUT': 15,          # SQLite 잠금 대기 시간 (초). gevent 워커에서는 기다리는 동안 워커 전체가 멈추므로 wsgi.py가 짧게 설정
+    'LOG_LEVEL': 'INFO',            # fastlm 로거 기본 레벨
+    'LOG_LEVELS': '',               # 로거별 레벨 (예: 'fastlm.access=WARNING,fastlm.auth=ERROR')
+    'LOG_FILE': None,               # 지정하지 않으면 표준 출력
+    'LOG_QUEUE_SIZE': 10000,        # 출력 대기 레코드 수, 넘치면 버리고 건수만 기록
+    'LOG_RATE_LIMIT': 20,           # 같은 종류 로그를 구간당 최대 몇 건까지 남길지 (0이면 제한 없음)
+    'LOG_RATE_WINDOW': 10,          # 샘플링 구간 (초)
+    'CACHE_ENABLED': True,          # 워크스페이스/카테고리/템플릿 조회 캐시
+    'CACHE_BACKEND': 'memory',      # memory: 프로세스 내 LRU, sqlite: 워커 간 공유 로컬 파일
+    'CACHE_SQLITE_PATH': 'cache.db',  # instance 폴더 기준 공유 캐시 파일
+    'CACHE_MAX_ENTRIES': 2048,      # 프로세스 내 LRU 최대 항목 수
+    'CACHE_TTL': 300,               # 캐시 항목 유효 시간 (초)
+    'CACHE_LOCAL_TTL': 300,         # 프로세스 내 LRU 항목 유효 시간 (초)
+}
 
-# 설정
-app.config['SECRET_KEY'] = 'your-secret-key-change-this-in-production'
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///fastlm.db'
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-app.config['JWT_SECRET_KEY'] = 'jwt-secret-string-change-this-in-production'
-app.config['JWT_ACCESS_TOKEN_EXPIRES'] = timedelta(days=1)
+# 환경 변수로 덮어쓸 수 있는 설정 (FASTLM_<키>)
+ENV_CONFIG_TYPES = {
+    'SECRET_KEY': str,
+    'SQLALCHEMY_DATABASE_URI': str,
+    'JWT_SECRET_KEY': str,
+    'ARCHIVE_AFTER_DAYS': int,
+    'DB_BUSY_TIMEOUT': float,
+    'SCHEDULER_LEASE_TTL': int,
+    'SCHEDULER_SYNC_INTERVAL': int,
+    'SCHEDULER_RECONCILE_INTERVAL': int,
+    'SCHEDULER_EXECUTOR_WORKERS': int,
+    'SCHEDULER_MISFIRE_GRACE_TIME': int,
+    'SCHEDULER_MAX_INSTANCES': int,
+    'SCHEDULER_ON_MISFIRE': str,
+    'SCHEDULER_LATE_THRESHOLD': int,
+    'SCHEDULER_JOB_POLICIES': json.loads,
+    'DISPATCH_LANES': json.loads,
+    'DISPATCH_TYPE_LANES': json.loads,
+    'DISPATCH_DEFAULT_LANE': str,
+    'DISPATCH_WORKERS': int,
+    'DISPATCH_RESERVED_WORKERS': int,
+    'BACKUP_DIR': str,
+    'BACKUP_INTERVAL_HOURS': int,
+    'BACKUP_KEEP': int,
+    'BACKUP_PAGES_PER_STEP': int,
+    'BACKUP_STEP_SLEEP': float,
+    'MAINTENANCE_INTERVAL_HOURS': int,
+    'ANALYZE_LIMIT': int,
+    'VACUUM_PAGES_PER_STEP': int,
+    'LOG_LEVEL': str,
+    'LOG_LEVELS': str,
+    'LOG_FILE': str,
+    'LOG_QUEUE_SIZE': int,
+    'LOG_RATE_LIMIT': int,
+    'LOG_RATE_WINDOW': int,
+    'CACHE_BACKEND': str,
+    'CACHE_SQLITE_PATH': str,
+    'CACHE_MAX_ENTRIES': int,
+    'CACHE_TTL': int,
+    'CACHE_LOCAL_TTL': int,
+}
 
-# 확장 초기화
-db = SQLAlchemy(app)
-jwt = JWTManager(app)
-CORS(app)
+# 확장 (create_app에서 애플리케이션에 바인딩)
+db = SQLAlchemy()
+jwt = JWTManager()
+cors = CORS()
 
-# 스케줄러 초기화
+# 스케줄러 (start_scheduler 호출 전까지 스레드를 만들지 않음)
 scheduler = BackgroundScheduler()
-scheduler.start()
+
+# API 라우트
+api = Blueprint('api', __name__, cli_group=None)
+
+# 구조화 로깅
+# 요청 스레드는 레코드를 큐에 넣기만 하고, 직렬화와 출력은 QueueListener 스레드에서 처리합니다.
+# 로그 메시지는 f-string 대신 %s 인자를 사용해야 같은 종류의 이벤트로 묶여 샘플링됩니다.
+logger = logging.getLogger('fastlm')
+auth_logger = logging.getLogger('fastlm.auth')
+access_logger = logging.getLogger('fastlm.access')
+scheduler_logger = logging.getLogger('fastlm.scheduler')
+
+def log_fields(**fields):
+    """logger.info(..., extra=log_fields(userId=1)) 형태로 구조화 필드 전달"""
+    return {'fields': fields}
+
+class JsonLogFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            'ts': datetime.utcfromtimestamp(record.created).isoformat() + 'Z',
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        if getattr(record, 'request_id', None):
+            entry['requestId'] = record.request_id
+        entry.update(getattr(record, 'fields', None) or {})
+        if getattr(record, 'suppressed', 0):
+            entry['suppressed'] = record.suppressed
+        if getattr(record, 'dropped', 0):
+            entry['dropped'] = record.dropped
+        if record.exc_info:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class RequestIdFilter(logging.Filter):
+    """요청 처리 중 남긴 로그에 요청 ID 부여 (호출 스레드에서 실행)"""
+    def filter(self, record):
+        if has_request_context():
+            record.request_id = g.get('request_id')
+        return True
+
+class RateLimitFilter(logging.Filter):
+    """같은 로거/메시지 템플릿의 WARNING은 window초마다 limit건까지만 통과시키고 나머지는 건수만 집계
+    
+    인증 실패, 웹훅 실패처럼 반복되는 경고가 대상입니다. 건너뛴 건수는 다음 구간의 첫 레코드에
+    suppressed로 붙습니다. INFO 이하는 로거별 레벨로 조절하고, ERROR 이상은 항상 통과합니다.
+    """
+    def __init__(self, limit, window):
+        super().__init__()
+        self.limit = limit
+        self.window = window
+        self.lock = threading.Lock()
+        self.buckets = {}  # (로거, 메시지 템플릿) -> [구간 시작, 통과 건수, 건너뛴 건수]
+    
+    def filter(self, record):
+        if self.limit <= 0 or record.levelno != logging.WARNING:
+            return True
+        
+        now = time.monotonic()
+        key = (record.name, record.msg)
+        with self.lock:
+            bucket = self.buckets.get(key)
+            if bucket is None or now - bucket[0] >= self.window:
+                suppressed = bucket[2] if bucket else 0
+                self.buckets[key] = [now, 1, 0]
+                if suppressed:
+                    record.suppressed = suppressed
+                return True
+            if bucket[1] < self.limit:
+                bucket[1] += 1
+                return True
+            bucket[2] += 1
+            return False
+
+class NonBlockingQueueHandler(QueueHandler):
+    """큐가 가득 차면 기다리지 않고 버린 뒤, 버린 건수를 다음 레코드에 기록"""
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def prepare(self, record):
+        # 메시지 인자와 예외만 문자열로 확정하고 JSON 직렬화는 출력 스레드에 맡김
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        if self.dropped:
+            record.dropped, self.dropped = self.dropped, 0
+        return record
+    
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+def parse_log_levels(value):
+    """'fastlm.access=WARNING,apscheduler=ERROR' 형식의 로거별 레벨 설정 파싱"""
+    if isinstance(value, dict):
+        return value
+    levels = {}
+    for item in (value or '').split(','):
+        if '=' in item:
+            name, level = item.split('=', 1)
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+_log_pipeline = None  # (프로세스 ID, 큐 핸들러, 리스너)
+
+def configure_logging(app):
+    """fastlm 로거에 큐 핸들러를 연결하고 출력 스레드 시작 (프로세스당 한 번, fork 후에는 다시 생성)"""
+    global _log_pipeline
+    
+    if _log_pipeline is None or _log_pipeline[0] != os.getpid():
+        if _log_pipeline is not None:
+            logger.removeHandler(_log_pipeline[1])
+        
+        if app.config['LOG_FILE']:
+            output = logging.FileHandler(app.config['LOG_FILE'], encoding='utf-8')
+        else:
+            output = logging.StreamHandler(sys.stdout)
+        output.setFormatter(JsonLogFormatter())
+        
+        log_queue = queue.Queue(app.config['LOG_QUEUE_SIZE'])
+        handler = NonBlockingQueueHandler(log_queue)
+        handler.addFilter(RequestIdFilter())
+        handler.addFilter(RateLimitFilter(app.config['LOG_RATE_LIMIT'], app.config['LOG_RATE_WINDOW']))
+        logger.addHandler(handler)
+        logger.propagate = False
+        
+        listener = QueueListener(log_queue, output)
+        listener.start()
+        atexit.register(listener.stop)
+        _log_pipeline = (os.getpid(), handler, listener)
+    
+    logger.setLevel(app.config['LOG_LEVEL'].upper())
+    for name, level in parse_log_levels(app.config['LOG_LEVELS']).items():
+        logging.getLogger(name).setLevel(level)
+
+@api.before_request
+def assign_request_id():
+    g.request_id = request.headers.get('X-Request-ID') or uuid.uuid4().hex
+    g.request_started = time.perf_counter()
+
+@api.after_request
+def log_request(response):
+    response.headers['X-Request-ID'] = g.request_id
+    access_logger.info('%s %s', request.method, request.path, extra=log_fields(
+        method=request.method,
+        path=request.path,
+        status=response.status_code,
+        durationMs=round((time.perf_counter() - g.request_started) * 1000, 1)
+    ))
+    return response
+
+# 읽기 캐시
+# 자주 바뀌지 않는 조회 결과(워크스페이스, 카테고리, 템플릿)를 엔티티별 버전 키로 캐시합니다.
+# 쓰기 핸들러가 커밋 후 cache.bump(엔티티)로 버전을 올리면 이전 버전의 항목은 더 이상 조회되지 않고 TTL이 지나면 사라집니다.
+class LRUCache:
+    """프로세스 내 LRU + TTL 캐시 (스레드 안전)"""
+    def __init__(self, max_entries=2048, ttl=300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # 키 -> (만료 시각, 값)
+    
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return entry[1]
+    
+    def set(self, key, value, ttl=None):
+        with self.lock:
+            self.entries[key] = (time.monotonic() + (ttl or self.ttl), value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+    
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+class SQLiteCacheBackend:
+    """여러 워커 프로세스가 함께 쓰는 로컬 파일 캐시 (버전 카운터와 항목을 공유)"""
+    PRUNE_EVERY = 500  # 쓰기 몇 번마다 만료 항목을 정리할지
+    
+    def __init__(self, path):
+        self.path = path
+        self.local = threading.local()
+        self.writes = 0
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('CREATE TABLE IF NOT EXISTS cache_entry (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)')
+    
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+    
+    @property
+    def conn(self):
+        # 스레드(및 fork된 프로세스)마다 별도 연결 사용
+        if getattr(self.local, 'pid', None) != os.getpid():
+            self.local.conn = self._connect()
+            self.local.pid = os.getpid()
+        return self.local.conn
+    
+    def get(self, key):
+        row = self.conn.execute('SELECT value, expires_at FROM cache_entry WHERE key = ?', (key,)).fetchone()
+        if row is None or (row[1] is not None and row[1] < time.time()):
+            return None
+        return json.loads(row[0])
+    
+    def set(self, key, value, ttl):
+        self.conn.execute(
+            'INSERT OR REPLACE INTO cache_entry (key, value, expires_at) VALUES (?, ?, ?)',
+            (key, json.dumps(value, ensure_ascii=False, default=str), time.time() + ttl)
+        )
+        self.writes += 1
+        if self.writes % self.PRUNE_EVERY == 0:
+            self.conn.execute('DELETE FROM cache_entry WHERE expires_at < ?', (time.time(),))
+    
+    def incr(self, key):
+        self.conn.execute(
+            "INSERT INTO cache_entry (key, value, expires_at) VALUES (?, '1', NULL) "
+            "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1",
+            (key,)
+        )
+    
+    def version(self, key):
+        row = self.conn.execute('SELECT value FROM cache_entry WHERE key = ?', (key,)).fetchone()
+        return int(row[0]) if row else 0
+    
+    def clear(self):
+        self.conn.execute('DELETE FROM cache_entry')
+
+class ReadThroughCache:
+    """엔티티 네임스페이스별 버전 키를 사용하는 읽기 캐시
+    
+    CACHE_BACKEND='memory'는 프로세스 내 LRU만 사용하고, 'sqlite'는 LRU 앞단에 더해 워커들이 공유하는
+    로컬 파일(CACHE_SQLITE_PATH)에 항목과 버전 카운터를 저장해 다른 워커의 변경도 바로 반영합니다.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.ttl = 300
+        self.local = LRUCache()
+        self.shared = None
+        self.versions = {}  # memory 백엔드의 버전 카운터 (LRU에서 밀려나지 않도록 따로 보관)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def init_app(self, app):
+        self.enabled = app.config['CACHE_ENABLED']
+        self.ttl = app.config['CACHE_TTL']
+        self.local = LRUCache(app.config['CACHE_MAX_ENTRIES'], app.config['CACHE_LOCAL_TTL'])
+        self.shared = None
+        if app.config['CACHE_BACKEND'] == 'sqlite':
+            self.shared = SQLiteCacheBackend(os.path.join(app.instance_path, app.config['CACHE_SQLITE_PATH']))
+    
+    def version(self, namespace):
+        key = f'version:{namespace}'
+        if self.shared:
+            return self.shared.version(key)
+        return self.versions.get(key, 0)
+    
+    def bump(self, *namespaces):
+        """엔티티 변경 후(커밋 이후) 호출해 해당 네임스페이스의 캐시 항목을 모두 무효화"""
+        for namespace in namespaces:
+            key = f'version:{namespace}'
+            if self.shared:
+                self.shared.incr(key)
+            else:
+                with self.lock:
+                    self.versions[key] = self.versions.get(key, 0) + 1
+    
+    def get_or_load(self, namespace, key, loader, shared_only=False):
+        """캐시에 있으면 반환하고, 없으면 loader() 결과(JSON으로 직렬화 가능한 값)를 저장 후 반환
+        
+        shared_only=True(권한 확인 등)는 다른 워커의 변경이 바로 무효화되는 sqlite 백엔드에서만 캐시하고,
+        memory 백엔드에서는 매번 loader()를 호출합니다. (회수된 권한이 다른 워커에 남아 있지 않도록)
+        """
+        if not self.enabled or (shared_only and not self.shared):
+            return loader()
+        
+        full_key = f'{namespace}:v{self.version(namespace)}:{key}'
+        value = self.local.get(full_key)
+        if value is None and self.shared:
+            value = self.shared.get(full_key)
+            if value is not None:
+                self.local.set(full_key, value)
+        if value is not None:
+            with self.lock:
+                self.hits += 1
+            return value
+        
+        with self.lock:
+            self.misses += 1
+        value = loader()
+        if value is not None:
+            self.local.set(full_key, value)
+            if self.shared:
+                self.shared.set(full_key, value, self.ttl)
+        return value
+    
+    def clear(self):
+        self.local.clear()
+        if self.shared:
+            self.shared.clear()
+    
+    def stats(self):
+        with self.lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            'enabled': self.enabled,
+            'backend': 'sqlite' if self.shared else 'memory',
+            'entries': len(self.local.entries),
+            'hits': hits,
+            'misses': misses,
+            'hitRate': round(hits / total, 3) if total else None
+        }
+
+cache = ReadThroughCache()
 
 # 데이터베이스 모델
 class User(db.Model):
@@ -46,7 +486,7 @@ class Workspace(db.Model):
     description = db.Column(db.Text)
     slack_webhook_name = db.Column(db.String(100), default='기본 슬랙')  # 슬랙 웹훅 이름
     slack_webhook_url = db.Column(db.String(500))
-    webhook_urls = db.Column(db.Text)  # JSON 형태로 저장
+    webhook_urls = db.Column(db.JSON(none_as_null=True))  # [{name, url}] 목록 (JSON1 json_each로 조회 가능)
     checkin_time = db.Column(db.Time)  # 입실 시간
     middle_time = db.Column(db.Time)   # 중간 시간
     checkout_time = db.Column(db.Time) # 퇴실 시간
@@ -54,10 +494,10 @@ class Workspace(db.Model):
     zoom_url = db.Column(db.String(500))
     zoom_id = db.Column(db.String(100))
     zoom_password = db.Column(db.String(100))
-    status = db.Column(db.String(20), default='pending')  # pending, approved, rejected
+    status = db.Column(db.String(20), default='pending')  # pending, approved, rejected, deleted
     created_by = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
     
     # 관계
     creator = db.relationship('User', backref='created_workspaces', lazy=True)
@@ -84,15 +524,23 @@ class Notice(db.Model):
     scheduled_at = db.Column(db.DateTime, nullable=False)
     status = db.Column(db.String(20), default='scheduled')  # scheduled, sent, failed
     no_image = db.Column(db.Boolean, default=False)
-    form_data = db.Column(db.Text)  # JSON 형태로 저장
-    variable_data = db.Column(db.Text)  # JSON 형태로 저장 (템플릿 변수값)
+    priority = db.Column(db.String(20))  # 전송 레인 지정 (없으면 유형별 기본 레인)
+    form_data = db.Column(db.JSON(none_as_null=True))
+    variable_data = db.Column(db.JSON(none_as_null=True))  # 템플릿 변수값
     selected_webhook_url = db.Column(db.String(500))  # 선택된 웹훅 URL
+    target_webhook_urls = db.Column(db.JSON(none_as_null=True))  # 동시 전송 대상 웹훅 URL 목록
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     sent_at = db.Column(db.DateTime)
     error_message = db.Column(db.Text)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
     
     # 관계
     creator = db.relationship('User', backref='created_notices', lazy=True)
+    
+    # 인덱스 (워크스페이스별 기간 조회용)
+    __table_args__ = (
+        db.Index('ix_notice_workspace_scheduled_at', 'workspace_id', 'scheduled_at'),
+    )
 
 class NoticeCategory(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -115,11 +563,11 @@ class NoticeTemplate(db.Model):
     title = db.Column(db.String(200), nullable=False)
     content = db.Column(db.Text, nullable=False)
     workspace_id = db.Column(db.Integer, db.ForeignKey('workspace.id'), nullable=False)
-    variables = db.Column(db.Text)  # JSON 형태로 저장
+    variables = db.Column(db.JSON(none_as_null=True))
     is_default = db.Column(db.Boolean, default=False)
     created_by = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
     
     # 관계
     creator = db.relationship('User', backref='created_templates', lazy=True)
@@ -127,41 +575,135 @@ class NoticeTemplate(db.Model):
 
 class ScheduledJob(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    notice_id = db.Column(db.Integer, db.ForeignKey('notice.id'), nullable=False)
+    notice_id = db.Column(db.Integer, db.ForeignKey('notice.id'), nullable=False, index=True)
     job_id = db.Column(db.String(100), unique=True, nullable=False)
-    status = db.Column(db.String(20), default='pending')  # pending, completed, failed
+    status = db.Column(db.String(20), default='pending')  # pending, running, completed, failed
     scheduled_at = db.Column(db.DateTime, nullable=False)
     executed_at = db.Column(db.DateTime)
     error_message = db.Column(db.Text)
+    delay_seconds = db.Column(db.Integer)  # 예약 시간 대비 실제 전송 시작 지연 (초)
+    claimed_from = db.Column(db.String(20))  # running으로 선점하기 전 상태 (pending, failed), 중단된 작업의 카운터 보정용
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)  # 리더 스케줄러 동기화용
     
     # 관계
     notice = db.relationship('Notice', backref='scheduled_jobs', lazy=True)
 
+class NoticeDelivery(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    notice_id = db.Column(db.Integer, db.ForeignKey('notice.id'), nullable=False, index=True)
+    webhook_url = db.Column(db.String(500), nullable=False)
+    status = db.Column(db.String(20), default='pending')  # pending, sent, failed
+    attempt_count = db.Column(db.Integer, default=0, nullable=False)
+    latency_ms = db.Column(db.Integer)  # 마지막 시도 응답 시간
+    error_message = db.Column(db.Text)
+    sent_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # 관계
+    notice = db.relationship('Notice', backref='deliveries', lazy=True)
+    
+    __table_args__ = (
+        db.UniqueConstraint('notice_id', 'webhook_url', name='uq_notice_delivery_target'),
+    )
+
+class WorkspaceCounter(db.Model):
+    workspace_id = db.Column(db.Integer, db.ForeignKey('workspace.id'), primary_key=True)
+    scheduled_count = db.Column(db.Integer, default=0, nullable=False)  # 예약 상태 공지 수
+    sent_count = db.Column(db.Integer, default=0, nullable=False)       # 전송 완료 공지 수
+    failed_count = db.Column(db.Integer, default=0, nullable=False)     # 전송 실패 공지 수
+    pending_job_count = db.Column(db.Integer, default=0, nullable=False)  # 대기 중인 예약 작업 수
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class NoticeArchive(db.Model):
+    id = db.Column(db.Integer, primary_key=True)  # 원본 공지 ID
+    workspace_id = db.Column(db.Integer, db.ForeignKey('workspace.id'), nullable=False)
+    type = db.Column(db.String(50), nullable=False)
+    title = db.Column(db.String(200), nullable=False)
+    status = db.Column(db.String(20), nullable=False)  # sent, failed
+    scheduled_at = db.Column(db.DateTime, nullable=False)
+    sent_at = db.Column(db.DateTime)
+    payload = db.Column(db.LargeBinary, nullable=False)  # 공지 + 예약 작업 전체 (zlib 압축 JSON)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    # 인덱스 (워크스페이스별 기간 조회용)
+    __table_args__ = (
+        db.Index('ix_notice_archive_workspace_scheduled_at', 'workspace_id', 'scheduled_at'),
+    )
+
+class NoticeEvent(db.Model):
+    id = db.Column(db.Integer, primary_key=True)  # SSE 이벤트 ID (이어받기 기준)
+    workspace_id = db.Column(db.Integer, db.ForeignKey('workspace.id'), nullable=False, index=True)
+    type = db.Column(db.String(50), nullable=False)  # notice.created, notice.status 등
+    payload = db.Column(db.Text, nullable=False)  # JSON 형태로 저장
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+class SyncTombstone(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    entity = db.Column(db.String(30), nullable=False)  # notice, template, workspace_access
+    entity_id = db.Column(db.Integer, nullable=False)
+    workspace_id = db.Column(db.Integer, nullable=True)
+    user_id = db.Column(db.Integer, nullable=True)  # workspace_access인 경우 대상 사용자
+    deleted_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+class WorkspacePurge(db.Model):
+    # 워크스페이스 행이 삭제된 뒤에도 결과를 조회할 수 있도록 FK를 두지 않음
+    workspace_id = db.Column(db.Integer, primary_key=True)
+    status = db.Column(db.String(20), nullable=False, default='queued')  # queued, running, completed, failed
+    notices_total = db.Column(db.Integer)
+    notices_deleted = db.Column(db.Integer, nullable=False, default=0)
+    jobs_deleted = db.Column(db.Integer, nullable=False, default=0)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+    error = db.Column(db.Text)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class SchedulerLease(db.Model):
+    name = db.Column(db.String(50), primary_key=True)
+    owner = db.Column(db.String(200), nullable=False)  # 리더 워커 식별자 (호스트:PID:랜덤)
+    expires_at = db.Column(db.DateTime, nullable=False)
+
+class WebhookHealth(db.Model):
+    url = db.Column(db.String(500), primary_key=True)
+    state = db.Column(db.String(20), nullable=False, default='closed')  # closed, open, half_open
+    failure_rate = db.Column(db.Float)  # 최근 전송 실패율
+    recent_calls = db.Column(db.Integer, default=0)
+    last_latency_ms = db.Column(db.Integer)
+    last_error = db.Column(db.Text)
+    last_success_at = db.Column(db.DateTime)
+    last_failure_at = db.Column(db.DateTime)
+    open_until = db.Column(db.DateTime)  # 차단 해제(시험 전송) 예정 시각
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
 class ZoomExitRecord(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.String(100), nullable=False)
     user_name = db.Column(db.String(100), nullable=False)
     workspace_id = db.Column(db.Integer, db.ForeignKey('workspace.id'), nullable=False)
     timestamp = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    # 인덱스 (워크스페이스별 기간 조회/내보내기용)
+    __table_args__ = (
+        db.Index('ix_zoom_exit_record_workspace_timestamp', 'workspace_id', 'timestamp'),
+    )
 
 # JWT 토큰 검증 및 오류 핸들러
 @jwt.expired_token_loader
 def expired_token_callback(jwt_header, jwt_payload):
-    print(f"토큰 만료: header={jwt_header}, payload={jwt_payload}")
+    auth_logger.warning('토큰 만료', extra=log_fields(userId=jwt_payload.get('sub')))
     return jsonify({'message': '토큰이 만료되었습니다.'}), 401
 
 @jwt.invalid_token_loader
 def invalid_token_callback(error):
-    print(f"유효하지 않은 토큰: error={error}")
+    auth_logger.warning('유효하지 않은 토큰: %s', error)
     return jsonify({'message': '유효하지 않은 토큰입니다.'}), 401
 
 @jwt.unauthorized_loader
 def missing_token_callback(error):
-    print(f"토큰 누락: error={error}")
+    auth_logger.warning('토큰 누락: %s', error)
     return jsonify({'message': '인증 토큰이 필요합니다.'}), 401
 
 # 인증 관련 API
-@app.route('/api/auth/register', methods=['POST'])
+@api.route('/api/auth/register', methods=['POST'])
 def register():
     data = request.get_json()
     
@@ -180,7 +722,7 @@ def register():
     
     return jsonify({'message': '회원가입이 완료되었습니다. 관리자 승인을 기다려주세요.'}), 201
 
-@app.route('/api/auth/login', methods=['POST'])
+@api.route('/api/auth/login', methods=['POST'])
 def login():
     data = request.get_json()
     user = User.query.filter_by(email=data['email']).first()
@@ -204,7 +746,7 @@ def login():
         }
     })
 
-@app.route('/api/auth/verify', methods=['POST'])
+@api.route('/api/auth/verify', methods=['POST'])
 @jwt_required()
 def verify_token():
     current_user_id = int(get_jwt_identity())
@@ -221,27 +763,82 @@ def verify_token():
         'isApproved': user.is_approved
     })
 
+@api.route('/api/bootstrap', methods=['GET'])
+@jwt_required()
+def bootstrap():
+    """앱 첫 화면에 필요한 데이터를 한 번에 조회 (사용자, 워크스페이스, 선택한 워크스페이스의 카테고리/템플릿)
+    
+    workspaceId를 생략했거나 접근할 수 없는 워크스페이스면 첫 번째 워크스페이스를 선택합니다.
+    include=notices를 주면 선택한 워크스페이스의 공지도 함께 반환하고, watermark로 이후 변경분(?since=)을 이어받을 수 있습니다.
+    """
+    current_user_id = int(get_jwt_identity())
+    user = db.session.get(User, current_user_id)
+    
+    if not user:
+        return jsonify({'message': '사용자를 찾을 수 없습니다.'}), 404
+    
+    started_at = datetime.utcnow()
+    include = set(filter(None, request.args.get('include', '').split(',')))
+    
+    # 할당된 승인 워크스페이스 (생성자 이름까지 한 번의 조회로 로드)
+    workspaces = Workspace.query.options(db.joinedload(Workspace.creator)).join(
+        UserWorkspace, UserWorkspace.workspace_id == Workspace.id
+    ).filter(
+        UserWorkspace.user_id == current_user_id,
+        Workspace.status == 'approved'
+    ).order_by(Workspace.id).distinct().all()
+    
+    workspace_ids = [ws.id for ws in workspaces]
+    selected_id = request.args.get('workspaceId', type=int)
+    if selected_id not in workspace_ids:
+        selected_id = workspace_ids[0] if workspace_ids else None
+    
+    # 카테고리/템플릿 목록 엔드포인트와 같은 캐시 키 사용
+    categories = cache.get_or_load('category', selected_id or 'global', lambda: load_template_categories(selected_id))
+    templates = cache.get_or_load(
+        'template', f'{selected_id}:None',
+        lambda: [serialize_template(template) for template in NoticeTemplate.query.filter_by(workspace_id=selected_id).all()]
+    ) if selected_id else []
+    
+    result = {
+        'user': {
+            'id': user.id,
+            'email': user.email,
+            'name': user.name,
+            'isAdmin': user.is_admin,
+            'isApproved': user.is_approved
+        },
+        'workspaces': [serialize_workspace(ws) for ws in workspaces],
+        'selectedWorkspaceId': selected_id,
+        'categories': categories,
+        'templates': templates,
+        'watermark': (started_at - SYNC_WATERMARK_OVERLAP).isoformat()
+    }
+    
+    if 'notices' in include:
+        notices = Notice.query.filter_by(workspace_id=selected_id).all() if selected_id else []
+        result['notices'] = [serialize_notice(notice) for notice in notices]
+    
+    return jsonify(result)
+
 # 사용자 관리 API (관리자만)
-@app.route('/api/admin/users', methods=['GET'])
+@api.route('/api/admin/users', methods=['GET'])
 @jwt_required()
 def get_all_users():
     try:
-        print("get_all_users API 호출됨")
         current_user_id = int(get_jwt_identity())
-        print(f"현재 사용자 ID: {current_user_id}")
         current_user = db.session.get(User, current_user_id)
-        print(f"현재 사용자: {current_user}")
         
         if not current_user:
-            print("사용자를 찾을 수 없음")
+            logger.warning('사용자를 찾을 수 없음', extra=log_fields(userId=current_user_id))
             return jsonify({'message': '사용자를 찾을 수 없습니다.'}), 404
         
         if not current_user.is_admin:
-            print("관리자 권한 없음")
+            logger.warning('관리자 권한 없음', extra=log_fields(userId=current_user_id))
             return jsonify({'message': '관리자 권한이 필요합니다.'}), 403
         
         users = User.query.all()
-        print(f"총 사용자 수: {len(users)}")
+        logger.debug('사용자 목록 조회', extra=log_fields(userId=current_user_id, count=len(users)))
         
         result = [{
             'id': user.id,
@@ -255,10 +852,10 @@ def get_all_users():
         
         return jsonify(result)
     except Exception as e:
-        print(f"get_all_users에서 오류 발생: {e}")
+        logger.exception('사용자 목록 조회 오류')
         return jsonify({'message': '서버 오류가 발생했습니다.'}), 500
 
-@app.route('/api/admin/users/<int:user_id>/approve', methods=['PUT'])
+@api.route('/api/admin/users/<int:user_id>/approve', methods=['PUT'])
 @jwt_required()
 def approve_user(user_id):
     current_user_id = int(get_jwt_identity())
@@ -276,7 +873,7 @@ def approve_user(user_id):
     
     return jsonify({'message': '사용자가 승인되었습니다.'})
 
-@app.route('/api/admin/users/<int:user_id>/reject', methods=['PUT'])
+@api.route('/api/admin/users/<int:user_id>/reject', methods=['PUT'])
 @jwt_required()
 def reject_user(user_id):
     current_user_id = int(get_jwt_identity())
@@ -294,7 +891,41 @@ def reject_user(user_id):
     
     return jsonify({'message': '사용자가 거부되었습니다.'})
 
-@app.route('/api/admin/users/<int:user_id>', methods=['DELETE'])
+@api.route('/api/admin/users/bulk', methods=['PUT'])
+@jwt_required()
+def bulk_update_users():
+    """여러 사용자를 한 번에 승인/거부 (action: approve, reject)"""
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    if not current_user.is_admin:
+        return jsonify({'message': '관리자 권한이 필요합니다.'}), 403
+    
+    data = request.get_json() or {}
+    user_ids = parse_id_list(data.get('userIds'))
+    action = data.get('action')
+    
+    if user_ids is None:
+        return jsonify({'message': 'userIds는 ID 목록이어야 합니다.'}), 400
+    if action not in ('approve', 'reject'):
+        return jsonify({'message': 'action은 approve 또는 reject여야 합니다.'}), 400
+    
+    missing_ids = find_missing_ids(User, user_ids)
+    if missing_ids:
+        return jsonify({'message': '존재하지 않는 사용자가 있습니다.', 'missingUserIds': missing_ids}), 404
+    
+    updated = User.query.filter(User.id.in_(user_ids)).update(
+        {'is_approved': action == 'approve'},
+        synchronize_session=False
+    )
+    db.session.commit()
+    
+    return jsonify({
+        'message': '사용자가 일괄 승인되었습니다.' if action == 'approve' else '사용자가 일괄 거부되었습니다.',
+        'updated': updated
+    })
+
+@api.route('/api/admin/users/<int:user_id>', methods=['DELETE'])
 @jwt_required()
 def delete_user(user_id):
     current_user_id = int(get_jwt_identity())
@@ -325,15 +956,16 @@ def delete_user(user_id):
         # 사용자 삭제
         db.session.delete(user)
         db.session.commit()
+        cache.bump('membership')
         
         return jsonify({'message': '사용자가 삭제되었습니다.'})
     
     except Exception as e:
         db.session.rollback()
-        print(f"사용자 삭제 오류: {e}")
+        logger.exception('사용자 삭제 오류')
         return jsonify({'message': '사용자 삭제 중 오류가 발생했습니다.'}), 500
 
-@app.route('/api/admin/users/<int:user_id>/workspaces', methods=['GET'])
+@api.route('/api/admin/users/<int:user_id>/workspaces', methods=['GET'])
 @jwt_required()
 def get_user_workspace_access(user_id):
     current_user_id = int(get_jwt_identity())
@@ -357,7 +989,52 @@ def get_user_workspace_access(user_id):
         'createdAt': ws.created_at.isoformat()
     } for ws in workspaces])
 
-@app.route('/api/admin/users/<int:user_id>/workspaces', methods=['PUT'])
+def load_workspace_access(user_ids):
+    """사용자들의 현재 (user_id, workspace_id) 멤버십 집합"""
+    if not user_ids:
+        return set()
+    return set(db.session.query(UserWorkspace.user_id, UserWorkspace.workspace_id).filter(
+        UserWorkspace.user_id.in_(user_ids)
+    ).all())
+
+def apply_workspace_access_diff(to_add, to_remove):
+    """멤버십 추가/삭제분만 executemany로 반영하고 삭제분은 동기화용 삭제 기록을 남김 (커밋은 호출자)"""
+    now = datetime.utcnow()
+    if to_add:
+        db.session.execute(UserWorkspace.__table__.insert(), [
+            {'user_id': user_id, 'workspace_id': workspace_id, 'created_at': now}
+            for user_id, workspace_id in sorted(to_add)
+        ])
+    if to_remove:
+        db.session.execute(
+            UserWorkspace.__table__.delete().where(
+                UserWorkspace.user_id == db.bindparam('b_user_id'),
+                UserWorkspace.workspace_id == db.bindparam('b_workspace_id')
+            ),
+            [{'b_user_id': user_id, 'b_workspace_id': workspace_id} for user_id, workspace_id in sorted(to_remove)]
+        )
+        db.session.execute(db.insert(SyncTombstone), [{
+            'entity': 'workspace_access',
+            'entity_id': workspace_id,
+            'workspace_id': workspace_id,
+            'user_id': user_id,
+            'deleted_at': now
+        } for user_id, workspace_id in sorted(to_remove)])
+
+def parse_id_list(values):
+    """요청 본문의 ID 목록을 중복 없는 정수 리스트로 변환 (형식이 잘못되면 None)"""
+    if not isinstance(values, list):
+        return None
+    try:
+        return sorted({int(value) for value in values})
+    except (TypeError, ValueError):
+        return None
+
+def find_missing_ids(model, ids, *criteria):
+    found = {row[0] for row in db.session.query(model.id).filter(model.id.in_(ids), *criteria).all()} if ids else set()
+    return [id_ for id_ in ids if id_ not in found]
+
+@api.route('/api/admin/users/<int:user_id>/workspaces', methods=['PUT'])
 @jwt_required()
 def update_user_workspace_access(user_id):
     current_user_id = int(get_jwt_identity())
@@ -371,73 +1048,128 @@ def update_user_workspace_access(user_id):
         return jsonify({'message': '사용자를 찾을 수 없습니다.'}), 404
     
     data = request.get_json()
-    workspace_ids = data.get('workspaceIds', [])
+    workspace_ids = parse_id_list(data.get('workspaceIds', []))
+    if workspace_ids is None:
+        return jsonify({'message': 'workspaceIds는 ID 목록이어야 합니다.'}), 400
     
     try:
-        # 기존 워크스페이스 접근 권한 삭제
-        UserWorkspace.query.filter_by(user_id=user_id).delete()
+        # 현재 멤버십과 비교해 바뀐 워크스페이스만 추가/삭제
+        current = load_workspace_access([user_id])
+        desired = {(user_id, workspace_id) for workspace_id in workspace_ids}
+        to_add, to_remove = desired - current, current - desired
+        apply_workspace_access_diff(to_add, to_remove)
         
-        # 새로운 워크스페이스 접근 권한 추가
-        for workspace_id in workspace_ids:
-            user_workspace = UserWorkspace(user_id=user_id, workspace_id=workspace_id)
-            db.session.add(user_workspace)
+        db.session.commit()
+        cache.bump('membership')
+        return jsonify({
+            'message': '워크스페이스 접근 권한이 업데이트되었습니다.',
+            'added': len(to_add),
+            'removed': len(to_remove)
+        })
+    
+    except Exception as e:
+        db.session.rollback()
+        logger.exception('워크스페이스 접근 권한 업데이트 오류')
+        return jsonify({'message': '워크스페이스 접근 권한 업데이트 중 오류가 발생했습니다.'}), 500
+
+@api.route('/api/admin/workspace-access', methods=['PUT'])
+@jwt_required()
+def bulk_update_workspace_access():
+    """여러 사용자에게 워크스페이스 접근 권한 일괄 부여/회수
+    
+    mode: add (기존 권한 유지하고 추가), remove (지정한 권한만 회수),
+    replace (각 사용자의 권한을 workspaceIds로 교체)
+    """
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    if not current_user.is_admin:
+        return jsonify({'message': '관리자 권한이 필요합니다.'}), 403
+    
+    data = request.get_json() or {}
+    user_ids = parse_id_list(data.get('userIds'))
+    workspace_ids = parse_id_list(data.get('workspaceIds'))
+    mode = data.get('mode', 'add')
+    
+    if user_ids is None or workspace_ids is None:
+        return jsonify({'message': 'userIds, workspaceIds는 ID 목록이어야 합니다.'}), 400
+    if mode not in ('add', 'remove', 'replace'):
+        return jsonify({'message': 'mode는 add, remove, replace 중 하나여야 합니다.'}), 400
+    
+    missing_users = find_missing_ids(User, user_ids)
+    missing_workspaces = find_missing_ids(Workspace, workspace_ids, Workspace.status != 'deleted')
+    if missing_users or missing_workspaces:
+        return jsonify({
+            'message': '존재하지 않는 사용자 또는 워크스페이스가 있습니다.',
+            'missingUserIds': missing_users,
+            'missingWorkspaceIds': missing_workspaces
+        }), 404
+    
+    try:
+        current = load_workspace_access(user_ids)
+        desired = {(user_id, workspace_id) for user_id in user_ids for workspace_id in workspace_ids}
+        if mode == 'add':
+            to_add, to_remove = desired - current, set()
+        elif mode == 'remove':
+            to_add, to_remove = set(), desired & current
+        else:
+            to_add, to_remove = desired - current, current - desired
+        apply_workspace_access_diff(to_add, to_remove)
         
         db.session.commit()
-        return jsonify({'message': '워크스페이스 접근 권한이 업데이트되었습니다.'})
+        cache.bump('membership')
+        return jsonify({
+            'message': '워크스페이스 접근 권한이 일괄 업데이트되었습니다.',
+            'added': len(to_add),
+            'removed': len(to_remove)
+        })
     
     except Exception as e:
         db.session.rollback()
-        print(f"워크스페이스 접근 권한 업데이트 오류: {e}")
+        logger.exception('워크스페이스 접근 권한 일괄 업데이트 오류')
         return jsonify({'message': '워크스페이스 접근 권한 업데이트 중 오류가 발생했습니다.'}), 500
 
 # 워크스페이스 관리 API
-@app.route('/api/workspaces', methods=['GET'])
+@api.route('/api/workspaces', methods=['GET'])
 @jwt_required()
 def get_user_workspaces():
     current_user_id = int(get_jwt_identity())
     current_user = db.session.get(User, current_user_id)
     
+    sync_requested, since = parse_sync_watermark()
+    if since is False:
+        return jsonify({'message': 'since 값이 올바르지 않습니다.'}), 400
+    started_at = datetime.utcnow()
+    
     # 모든 사용자(관리자 포함)는 자신에게 할당된 승인된 워크스페이스만 조회
-    user_workspace_ids = [uw.workspace_id for uw in current_user.user_workspaces]
+    query = Workspace.query.join(UserWorkspace, UserWorkspace.workspace_id == Workspace.id).filter(
+        UserWorkspace.user_id == current_user_id
+    ).distinct()
     
-    if user_workspace_ids:
-        workspaces = Workspace.query.filter(
-            Workspace.id.in_(user_workspace_ids),
-            Workspace.status == 'approved'
-        ).all()
-    else:
-        workspaces = []
+    if not since:
+        workspaces = query.filter(Workspace.status == 'approved').all()
+        items = [serialize_workspace(ws) for ws in workspaces]
+        return jsonify(sync_response(items, [], started_at) if sync_requested else items)
     
-    return jsonify([{
-        'id': ws.id,
-        'name': ws.name,
-        'description': ws.description,
-        'slackWebhookName': ws.slack_webhook_name,
-        'slackWebhookUrl': ws.slack_webhook_url,
-        'webhookUrls': json.loads(ws.webhook_urls) if ws.webhook_urls else [],
-        'checkinTime': ws.checkin_time.strftime('%H:%M') if ws.checkin_time else None,
-        'middleTime': ws.middle_time.strftime('%H:%M') if ws.middle_time else None,
-        'checkoutTime': ws.checkout_time.strftime('%H:%M') if ws.checkout_time else None,
-        'qrImageUrl': ws.qr_image_url,
-        'zoomUrl': ws.zoom_url,
-        'zoomId': ws.zoom_id,
-        'zoomPassword': ws.zoom_password,
-        'status': ws.status,
-        'createdBy': ws.creator.name if ws.creator else None,
-        'createdAt': ws.created_at.isoformat(),
-        'updatedAt': ws.updated_at.isoformat()
-    } for ws in workspaces])
+    # 변경분: 워크스페이스 자체가 수정되었거나 새로 할당된 경우
+    changed = query.filter((Workspace.updated_at > since) | (UserWorkspace.created_at > since)).all()
+    deleted = [ws.id for ws in changed if ws.status != 'approved']
+    deleted += [tombstone.entity_id for tombstone in SyncTombstone.query.filter(
+        SyncTombstone.entity == 'workspace_access',
+        SyncTombstone.user_id == current_user_id,
+        SyncTombstone.deleted_at > since
+    ).all()]
+    
+    items = [serialize_workspace(ws) for ws in changed if ws.status == 'approved']
+    return jsonify(sync_response(items, deleted, started_at, since=since))
 
-@app.route('/api/workspaces', methods=['POST'])
+@api.route('/api/workspaces', methods=['POST'])
 @jwt_required()
 def create_workspace_by_user():
     try:
         current_user_id = int(get_jwt_identity())
         data = request.get_json()
         
-        # 웹훅 URL들을 JSON으로 저장
-        webhook_urls = json.dumps(data.get('webhookUrls', []))
-        
         # 시간 형식 변환
         checkin_time = None
         middle_time = None
@@ -455,7 +1187,7 @@ def create_workspace_by_user():
             description=data.get('description', ''),
             slack_webhook_name=data.get('slackWebhookName', '기본 슬랙'),
             slack_webhook_url=data.get('slackWebhookUrl', ''),
-            webhook_urls=webhook_urls,
+            webhook_urls=data.get('webhookUrls', []),
             checkin_time=checkin_time,
             middle_time=middle_time,
             checkout_time=checkout_time,
@@ -475,7 +1207,7 @@ def create_workspace_by_user():
             'description': workspace.description,
             'slackWebhookName': workspace.slack_webhook_name,
             'slackWebhookUrl': workspace.slack_webhook_url,
-            'webhookUrls': json.loads(workspace.webhook_urls) if workspace.webhook_urls else [],
+            'webhookUrls': workspace.webhook_urls or [],
             'checkinTime': workspace.checkin_time.strftime('%H:%M') if workspace.checkin_time else None,
             'middleTime': workspace.middle_time.strftime('%H:%M') if workspace.middle_time else None,
             'checkoutTime': workspace.checkout_time.strftime('%H:%M') if workspace.checkout_time else None,
@@ -490,10 +1222,10 @@ def create_workspace_by_user():
         }), 201
         
     except Exception as e:
-        print(f"워크스페이스 등록 오류: {str(e)}")
+        logger.exception('워크스페이스 등록 오류')
         return jsonify({'message': '워크스페이스 등록에 실패했습니다.'}), 500
 
-@app.route('/api/admin/workspaces', methods=['POST'])
+@api.route('/api/admin/workspaces', methods=['POST'])
 @jwt_required()
 def create_workspace():
     current_user_id = int(get_jwt_identity())
@@ -529,7 +1261,7 @@ def create_workspace():
         'updatedAt': workspace.updated_at.isoformat()
     }), 201
 
-@app.route('/api/admin/workspaces', methods=['GET'])
+@api.route('/api/admin/workspaces', methods=['GET'])
 @jwt_required()
 def get_all_workspaces_admin():
     current_user_id = int(get_jwt_identity())
@@ -538,7 +1270,7 @@ def get_all_workspaces_admin():
     if not current_user.is_admin:
         return jsonify({'message': '관리자 권한이 필요합니다.'}), 403
     
-    workspaces = Workspace.query.all()
+    workspaces = Workspace.query.filter(Workspace.status != 'deleted').all()
     
     return jsonify([{
         'id': ws.id,
@@ -553,7 +1285,7 @@ def get_all_workspaces_admin():
         'updatedAt': ws.updated_at.isoformat()
     } for ws in workspaces])
 
-@app.route('/api/admin/workspaces/pending', methods=['GET'])
+@api.route('/api/admin/workspaces/pending', methods=['GET'])
 @jwt_required()
 def get_pending_workspaces():
     current_user_id = int(get_jwt_identity())
@@ -565,7 +1297,7 @@ def get_pending_workspaces():
     status_filter = request.args.get('status', 'pending')
     
     if status_filter == 'all':
-        workspaces = Workspace.query.all()
+        workspaces = Workspace.query.filter(Workspace.status != 'deleted').all()
     else:
         workspaces = Workspace.query.filter_by(status=status_filter).all()
     
@@ -582,7 +1314,7 @@ def get_pending_workspaces():
         'updatedAt': ws.updated_at.isoformat()
     } for ws in workspaces])
 
-@app.route('/api/admin/workspaces/<int:workspace_id>/approve', methods=['PUT'])
+@api.route('/api/admin/workspaces/<int:workspace_id>/approve', methods=['PUT'])
 @jwt_required()
 def approve_workspace(workspace_id):
     current_user_id = int(get_jwt_identity())
@@ -591,8 +1323,9 @@ def approve_workspace(workspace_id):
     if not current_user.is_admin:
         return jsonify({'message': '관리자 권한이 필요합니다.'}), 403
     
+    # 삭제 중인 워크스페이스는 백그라운드 삭제와 겹치지 않도록 되살리지 않음
     workspace = db.session.get(Workspace, workspace_id)
-    if not workspace:
+    if not workspace or workspace.status == 'deleted':
         return jsonify({'message': '워크스페이스를 찾을 수 없습니다.'}), 404
     
     data = request.get_json()
@@ -619,53 +1352,89 @@ def approve_workspace(workspace_id):
             db.session.add(user_workspace)
     
     db.session.commit()
+    cache.bump('workspace', 'membership')
     
     return jsonify({'message': f'워크스페이스가 {new_status}되었습니다.'})
 
-@app.route('/api/workspaces/<int:workspace_id>', methods=['GET'])
+@api.route('/api/admin/workspaces/bulk', methods=['PUT'])
+@jwt_required()
+def bulk_update_workspaces():
+    """여러 워크스페이스를 한 번에 승인/거부하고, 승인된 워크스페이스의 생성자에게 접근 권한 부여"""
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    if not current_user.is_admin:
+        return jsonify({'message': '관리자 권한이 필요합니다.'}), 403
+    
+    data = request.get_json() or {}
+    workspace_ids = parse_id_list(data.get('workspaceIds'))
+    new_status = data.get('status')
+    
+    if workspace_ids is None:
+        return jsonify({'message': 'workspaceIds는 ID 목록이어야 합니다.'}), 400
+    if new_status not in ['approved', 'rejected']:
+        return jsonify({'message': '유효하지 않은 상태입니다.'}), 400
+    
+    missing_ids = find_missing_ids(Workspace, workspace_ids, Workspace.status != 'deleted')
+    if missing_ids:
+        return jsonify({'message': '존재하지 않는 워크스페이스가 있습니다.', 'missingWorkspaceIds': missing_ids}), 404
+    
+    try:
+        updated = Workspace.query.filter(Workspace.id.in_(workspace_ids)).update(
+            {'status': new_status, 'updated_at': datetime.utcnow()},
+            synchronize_session=False
+        )
+        
+        granted = set()
+        if new_status == 'approved':
+            creators = db.session.query(Workspace.created_by, Workspace.id).filter(Workspace.id.in_(workspace_ids)).all()
+            granted = set(creators) - load_workspace_access({user_id for user_id, _ in creators})
+            apply_workspace_access_diff(granted, set())
+        
+        db.session.commit()
+        cache.bump('workspace', 'membership')
+        return jsonify({
+            'message': f'워크스페이스가 {new_status}되었습니다.',
+            'updated': updated,
+            'accessGranted': len(granted)
+        })
+    
+    except Exception as e:
+        db.session.rollback()
+        logger.exception('워크스페이스 일괄 승인 오류')
+        return jsonify({'message': '워크스페이스 상태 변경 중 오류가 발생했습니다.'}), 500
+
+@api.route('/api/workspaces/<int:workspace_id>', methods=['GET'])
 @jwt_required()
 def get_workspace_detail(workspace_id):
     try:
         current_user_id = int(get_jwt_identity())
         
         # 사용자가 해당 워크스페이스에 접근 권한이 있는지 확인
-        user_workspace = UserWorkspace.query.filter_by(
-            user_id=current_user_id,
-            workspace_id=workspace_id
-        ).first()
+        workspace_ids = cache.get_or_load('membership', current_user_id, lambda: [
+            user_workspace.workspace_id
+            for user_workspace in UserWorkspace.query.filter_by(user_id=current_user_id).all()
+        ], shared_only=True)
         
-        if not user_workspace:
+        if workspace_id not in workspace_ids:
             return jsonify({'message': '워크스페이스에 접근 권한이 없습니다.'}), 403
         
-        workspace = db.session.get(Workspace, workspace_id)
-        if not workspace:
+        def load_workspace():
+            workspace = db.session.get(Workspace, workspace_id)
+            return serialize_workspace(workspace) if workspace else None
+        
+        workspace = cache.get_or_load('workspace', workspace_id, load_workspace)
+        if not workspace or workspace['status'] == 'deleted':
             return jsonify({'message': '워크스페이스를 찾을 수 없습니다.'}), 404
         
-        return jsonify({
-            'id': workspace.id,
-            'name': workspace.name,
-            'description': workspace.description,
-            'slackWebhookName': workspace.slack_webhook_name,
-            'slackWebhookUrl': workspace.slack_webhook_url,
-            'webhookUrls': json.loads(workspace.webhook_urls) if workspace.webhook_urls else [],
-            'checkinTime': workspace.checkin_time.strftime('%H:%M') if workspace.checkin_time else None,
-            'middleTime': workspace.middle_time.strftime('%H:%M') if workspace.middle_time else None,
-            'checkoutTime': workspace.checkout_time.strftime('%H:%M') if workspace.checkout_time else None,
-            'qrImageUrl': workspace.qr_image_url,
-            'zoomUrl': workspace.zoom_url,
-            'zoomId': workspace.zoom_id,
-            'zoomPassword': workspace.zoom_password,
-            'status': workspace.status,
-            'createdBy': workspace.creator.name if workspace.creator else None,
-            'createdAt': workspace.created_at.isoformat(),
-            'updatedAt': workspace.updated_at.isoformat()
-        })
+        # 웹훅 상태는 전송마다 바뀌므로 캐시하지 않음
+        return jsonify(dict(workspace, webhookHealth=get_workspace_webhook_health(workspace['slackWebhookUrl'], workspace['webhookUrls'])))
         
     except Exception as e:
-        print(f"워크스페이스 조회 오류: {str(e)}")
+        logger.exception('워크스페이스 조회 오류')
         return jsonify({'message': '워크스페이스 조회에 실패했습니다.'}), 500
 
-@app.route('/api/workspaces/<int:workspace_id>', methods=['PUT'])
+@api.route('/api/workspaces/<int:workspace_id>', methods=['PUT'])
 @jwt_required()
 def update_workspace(workspace_id):
     try:
@@ -673,7 +1442,7 @@ def update_workspace(workspace_id):
         current_user = db.session.get(User, current_user_id)
         
         workspace = db.session.get(Workspace, workspace_id)
-        if not workspace:
+        if not workspace or workspace.status == 'deleted':
             return jsonify({'message': '워크스페이스를 찾을 수 없습니다.'}), 404
         
         # 관리자이거나 워크스페이스 생성자인 경우에만 수정 가능
@@ -682,9 +1451,8 @@ def update_workspace(workspace_id):
         
         data = request.get_json()
         
-        # 웹훅 URL들을 JSON으로 저장
         if 'webhookUrls' in data:
-            workspace.webhook_urls = json.dumps(data['webhookUrls'])
+            workspace.webhook_urls = data['webhookUrls']
         
         # 슬랙 웹훅 관련 필드 업데이트
         if 'slackWebhookName' in data:
@@ -723,6 +1491,7 @@ def update_workspace(workspace_id):
         workspace.updated_at = datetime.utcnow()
         
         db.session.commit()
+        cache.bump('workspace')
         
         return jsonify({
             'id': workspace.id,
@@ -730,7 +1499,7 @@ def update_workspace(workspace_id):
             'description': workspace.description,
             'slackWebhookName': workspace.slack_webhook_name,
             'slackWebhookUrl': workspace.slack_webhook_url,
-            'webhookUrls': json.loads(workspace.webhook_urls) if workspace.webhook_urls else [],
+            'webhookUrls': workspace.webhook_urls or [],
             'checkinTime': workspace.checkin_time.strftime('%H:%M') if workspace.checkin_time else None,
             'middleTime': workspace.middle_time.strftime('%H:%M') if workspace.middle_time else None,
             'checkoutTime': workspace.checkout_time.strftime('%H:%M') if workspace.checkout_time else None,
@@ -745,11 +1514,11 @@ def update_workspace(workspace_id):
         })
         
     except Exception as e:
-        print(f"워크스페이스 수정 오류: {str(e)}")
+        logger.exception('워크스페이스 수정 오류')
         db.session.rollback()
         return jsonify({'message': '워크스페이스 수정에 실패했습니다.'}), 500
 
-@app.route('/api/workspaces/<int:workspace_id>/qr', methods=['POST'])
+@api.route('/api/workspaces/<int:workspace_id>/qr', methods=['POST'])
 @jwt_required()
 def upload_workspace_qr_image(workspace_id):
     try:
@@ -792,6 +1561,7 @@ def upload_workspace_qr_image(workspace_id):
             workspace.updated_at = datetime.utcnow()
             
             db.session.commit()
+            cache.bump('workspace')
             
             return jsonify({
                 'message': 'QR 이미지가 업로드되었습니다.',
@@ -801,20 +1571,19 @@ def upload_workspace_qr_image(workspace_id):
             return jsonify({'message': '지원되지 않는 파일 형식입니다.'}), 400
             
     except Exception as e:
-        print(f"QR 이미지 업로드 오류: {str(e)}")
+        logger.exception('QR 이미지 업로드 오류')
         return jsonify({'message': 'QR 이미지 업로드에 실패했습니다.'}), 500
 
-@app.route('/api/workspaces/<int:workspace_id>/leave', methods=['DELETE'])
+@api.route('/api/workspaces/<int:workspace_id>/leave', methods=['DELETE'])
 @jwt_required()
 def leave_workspace(workspace_id):
     try:
         current_user_id = int(get_jwt_identity())
-        print(f"워크스페이스 나가기 요청 - 사용자 ID: {current_user_id}, 워크스페이스 ID: {workspace_id}")
         
         # 워크스페이스가 존재하는지 확인
         workspace = db.session.get(Workspace, workspace_id)
         if not workspace:
-            print(f"워크스페이스를 찾을 수 없음: {workspace_id}")
+            logger.warning('워크스페이스를 찾을 수 없음', extra=log_fields(userId=current_user_id, workspaceId=workspace_id))
             return jsonify({'message': '워크스페이스를 찾을 수 없습니다.'}), 404
         
         # 사용자-워크스페이스 연결 삭제
@@ -824,21 +1593,23 @@ def leave_workspace(workspace_id):
         ).first()
         
         if not user_workspace:
-            print(f"사용자-워크스페이스 연결을 찾을 수 없음: 사용자 {current_user_id}, 워크스페이스 {workspace_id}")
+            logger.warning('사용자-워크스페이스 연결을 찾을 수 없음', extra=log_fields(userId=current_user_id, workspaceId=workspace_id))
             return jsonify({'message': '워크스페이스에 할당되지 않았습니다.'}), 404
         
-        print(f"사용자-워크스페이스 연결 삭제: {user_workspace.id}")
+        logger.info('워크스페이스 나가기', extra=log_fields(userId=current_user_id, workspaceId=workspace_id))
+        record_tombstone('workspace_access', workspace_id, workspace_id=workspace_id, user_id=current_user_id)
         db.session.delete(user_workspace)
         db.session.commit()
+        cache.bump('membership')
         
         return jsonify({'message': '워크스페이스 할당이 해제되었습니다.'})
         
     except Exception as e:
-        print(f"워크스페이스 나가기 오류: {str(e)}")
+        logger.exception('워크스페이스 나가기 오류')
         db.session.rollback()
         return jsonify({'message': '워크스페이스 나가기 중 오류가 발생했습니다.'}), 500
 
-@app.route('/api/admin/workspaces/<int:workspace_id>', methods=['DELETE'])
+@api.route('/api/admin/workspaces/<int:workspace_id>', methods=['DELETE'])
 @jwt_required()
 def delete_workspace(workspace_id):
     current_user_id = int(get_jwt_identity())
@@ -849,244 +1620,3361 @@ def delete_workspace(workspace_id):
     
     try:
         workspace = db.session.get(Workspace, workspace_id)
-        if not workspace:
+        if not workspace or workspace.status == 'deleted':
             return jsonify({'message': '워크스페이스를 찾을 수 없습니다.'}), 404
         
-        # 연결된 사용자 워크스페이스 관계 모두 삭제
-        UserWorkspace.query.filter_by(workspace_id=workspace_id).delete()
-        
-        # 연결된 공지사항들의 스케줄드 작업들 삭제
-        notices = Notice.query.filter_by(workspace_id=workspace_id).all()
-        for notice in notices:
-            # 스케줄러에서 작업 삭제
-            scheduled_jobs = ScheduledJob.query.filter_by(notice_id=notice.id).all()
-            for job in scheduled_jobs:
-                try:
-                    scheduler.remove_job(job.job_id)
-                except:
-                    pass  # 작업이 이미 없거나 오류가 있어도 무시
-        
-        # 스케줄드 작업 테이블에서 삭제
-        for notice in notices:
-            ScheduledJob.query.filter_by(notice_id=notice.id).delete()
-        
-        # 공지사항들 삭제
-        Notice.query.filter_by(workspace_id=workspace_id).delete()
-        
-        # 템플릿들 삭제
-        NoticeTemplate.query.filter_by(workspace_id=workspace_id).delete()
+        # 워크스페이스를 즉시 삭제 상태로 표시하고 접근 권한 해제
+        workspace.status = 'deleted'
+        workspace.updated_at = datetime.utcnow()
+        # 멤버십 행이 없어지면 변경분 조회에서 보이지 않으므로 삭제 기록을 남김
+        apply_workspace_access_diff(set(), set(db.session.query(UserWorkspace.user_id, UserWorkspace.workspace_id).filter(
+            UserWorkspace.workspace_id == workspace_id
+        ).all()))
         
-        # QR 이미지 파일 삭제
-        if workspace.qr_image_url:
-            try:
-                import os
-                # URL에서 파일명 추출
-                filename = workspace.qr_image_url.split('/')[-1]
-                qr_dir = os.path.join(os.path.dirname(__file__), 'static', 'qr')
-                file_path = os.path.join(qr_dir, filename)
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-            except Exception as e:
-                print(f"QR 이미지 파일 삭제 실패: {e}")
+        # 대시보드 카운터 삭제
+        WorkspaceCounter.query.filter_by(workspace_id=workspace_id).delete()
         
-        # 워크스페이스 삭제
-        db.session.delete(workspace)
         db.session.commit()
+        cache.bump('workspace', 'membership')
+        
+        # 연관 데이터는 백그라운드에서 나누어 삭제
+        schedule_workspace_purge(workspace_id)
         
-        return jsonify({'message': '워크스페이스가 삭제되었습니다.'})
+        return jsonify({
+            'message': '워크스페이스가 삭제되었습니다.',
+            'purge': get_workspace_purge_progress(workspace_id)
+        }), 202
         
     except Exception as e:
-        print(f"워크스페이스 삭제 오류: {str(e)}")
+        logger.exception('워크스페이스 삭제 오류')
         db.session.rollback()
         return jsonify({'message': '워크스페이스 삭제 중 오류가 발생했습니다.'}), 500
 
-# 사용자 할당용 워크스페이스 조회 API (승인된 워크스페이스만)
-@app.route('/api/admin/workspaces/approved', methods=['GET'])
+@api.route('/api/admin/workspaces/<int:workspace_id>/purge', methods=['GET'])
 @jwt_required()
-def get_approved_workspaces_for_assignment():
+def get_workspace_purge_status(workspace_id):
     current_user_id = int(get_jwt_identity())
     current_user = db.session.get(User, current_user_id)
     
     if not current_user.is_admin:
         return jsonify({'message': '관리자 권한이 필요합니다.'}), 403
     
-    try:
-        # status가 'approved'인 워크스페이스만 조회
-        workspaces = Workspace.query.filter_by(status='approved').all()
-        
-        result = []
-        for workspace in workspaces:
-            result.append({
-                'id': workspace.id,
-                'name': workspace.name,
-                'description': workspace.description,
-                'createdBy': workspace.creator.name if workspace.creator else 'Unknown',
-                'createdAt': workspace.created_at.isoformat(),
-                'status': workspace.status
+    progress = get_workspace_purge_progress(workspace_id)
+    if not progress:
+        return jsonify({'message': '삭제 작업을 찾을 수 없습니다.'}), 404
+    
+    return jsonify(progress)
+
+# 워크스페이스 연관 데이터 백그라운드 삭제
+PURGE_CHUNK_SIZE = 500       # 한 번에 삭제할 공지 수
+PURGE_CHUNK_PAUSE = 0.05     # 청크 사이 대기 시간 (초), 다른 요청이 쓰기 락을 얻을 수 있도록 양보
+
+def serialize_workspace_purge(purge):
+    return {
+        'workspaceId': purge.workspace_id,
+        'status': purge.status,
+        'noticesDeleted': purge.notices_deleted,
+        'jobsDeleted': purge.jobs_deleted,
+        'noticesTotal': purge.notices_total,
+        'startedAt': serialize_datetime(purge.started_at),
+        'finishedAt': serialize_datetime(purge.finished_at),
+        'error': purge.error
+    }
+
+def get_workspace_purge_progress(workspace_id):
+    # 진행 상황은 DB에 기록하므로 삭제를 실행하지 않는 워커에서도, 재시작 후에도 조회 가능
+    purge = db.session.get(WorkspacePurge, workspace_id)
+    return serialize_workspace_purge(purge) if purge else None
+
+def update_workspace_purge_progress(workspace_id, notices_deleted=0, jobs_deleted=0, **fields):
+    """진행 상황 갱신 (삭제 건수는 누적, 커밋은 호출자 트랜잭션에서 수행)"""
+    purge = db.session.get(WorkspacePurge, workspace_id)
+    if purge is None:
+        purge = WorkspacePurge(workspace_id=workspace_id, notices_deleted=0, jobs_deleted=0)
+        db.session.add(purge)
+    purge.notices_deleted += notices_deleted
+    purge.jobs_deleted += jobs_deleted
+    for key, value in fields.items():
+        setattr(purge, key, value)
+
+def schedule_workspace_purge(workspace_id):
+    update_workspace_purge_progress(workspace_id, status='queued', error=None, finished_at=None)
+    db.session.commit()
+    run_background_task(purge_workspace, [workspace_id], f'purge_workspace_{workspace_id}')
+
+def purge_workspace(workspace_id):
+    """삭제 표시된 워크스페이스의 연관 데이터를 청크 단위로 삭제"""
+    with get_app().app_context():
+        workspace = db.session.get(Workspace, workspace_id)
+        if not workspace or workspace.status != 'deleted':
+            return
+        
+        update_workspace_purge_progress(
+            workspace_id,
+            status='running',
+            started_at=datetime.utcnow(),
+            notices_total=Notice.query.filter_by(workspace_id=workspace_id).count()
+        )
+        db.session.commit()
+        
+        try:
+            while True:
+                notice_ids = [row[0] for row in db.session.query(Notice.id).filter(
+                    Notice.workspace_id == workspace_id
+                ).limit(PURGE_CHUNK_SIZE).all()]
+                
+                if not notice_ids:
+                    break
+                
+                # 스케줄러 작업 일괄 제거
+                job_ids = [row[0] for row in db.session.query(ScheduledJob.job_id).filter(
+                    ScheduledJob.notice_id.in_(notice_ids)
+                ).all()]
+                remove_scheduler_jobs(job_ids)
+                
+                # 집합 단위 삭제
+                jobs_deleted = ScheduledJob.query.filter(
+                    ScheduledJob.notice_id.in_(notice_ids)
+                ).delete(synchronize_session=False)
+                NoticeDelivery.query.filter(
+                    NoticeDelivery.notice_id.in_(notice_ids)
+                ).delete(synchronize_session=False)
+                notices_deleted = Notice.query.filter(
+                    Notice.id.in_(notice_ids)
+                ).delete(synchronize_session=False)
+                record_tombstones('notice', notice_ids, workspace_id)
+                update_workspace_purge_progress(
+                    workspace_id,
+                    notices_deleted=notices_deleted,
+                    jobs_deleted=jobs_deleted
+                )
+                db.session.commit()
+                
+                time.sleep(PURGE_CHUNK_PAUSE)
+            
+            # 나머지 연관 데이터 삭제
+            template_ids = [row[0] for row in db.session.query(NoticeTemplate.id).filter(
+                NoticeTemplate.workspace_id == workspace_id
+            ).all()]
+            NoticeTemplate.query.filter_by(workspace_id=workspace_id).delete(synchronize_session=False)
+            record_tombstones('template', template_ids, workspace_id)
+            NoticeCategory.query.filter_by(workspace_id=workspace_id).delete(synchronize_session=False)
+            ZoomExitRecord.query.filter_by(workspace_id=workspace_id).delete(synchronize_session=False)
+            NoticeArchive.query.filter_by(workspace_id=workspace_id).delete(synchronize_session=False)
+            NoticeEvent.query.filter_by(workspace_id=workspace_id).delete(synchronize_session=False)
+            
+            # QR 이미지 파일 삭제
+            if workspace.qr_image_url:
+                try:
+                    filename = workspace.qr_image_url.split('/')[-1]
+                    file_path = os.path.join(os.path.dirname(__file__), 'static', 'qr_images', filename)
+                    if os.path.exists(file_path):
+                        os.remove(file_path)
+                except Exception as e:
+                    logger.warning('QR 이미지 파일 삭제 실패: %s', e, extra=log_fields(workspaceId=workspace_id))
+            
+            db.session.delete(workspace)
+            update_workspace_purge_progress(
+                workspace_id,
+                status='completed',
+                finished_at=datetime.utcnow()
+            )
+            db.session.commit()
+            cache.bump('workspace', 'category', 'template', 'membership')
+            
+        except Exception as e:
+            db.session.rollback()
+            logger.exception('워크스페이스 데이터 삭제 오류', extra=log_fields(workspaceId=workspace_id))
+            update_workspace_purge_progress(
+                workspace_id,
+                status='failed',
+                error=str(e),
+                finished_at=datetime.utcnow()
+            )
+            db.session.commit()
+
+def remove_scheduler_jobs(job_ids):
+    """스케줄러에서 여러 작업을 한 번에 제거 (없는 작업은 무시)"""
+    registered = {job.id for job in scheduler.get_jobs()}
+    for job_id in registered.intersection(job_ids):
+        try:
+            scheduler.remove_job(job_id)
+        except JobLookupError:
+            pass  # 그 사이 이미 실행되었거나 제거된 작업
+
+def resume_workspace_purges():
+    """서버 재시작 시 완료되지 않은 워크스페이스 삭제 작업 재개"""
+    for (workspace_id,) in db.session.query(Workspace.id).filter_by(status='deleted').all():
+        schedule_workspace_purge(workspace_id)
+
+# 사용자 할당용 워크스페이스 조회 API (승인된 워크스페이스만)
+@api.route('/api/admin/workspaces/approved', methods=['GET'])
+@jwt_required()
+def get_approved_workspaces_for_assignment():
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    if not current_user.is_admin:
+        return jsonify({'message': '관리자 권한이 필요합니다.'}), 403
+    
+    try:
+        # status가 'approved'인 워크스페이스만 조회
+        workspaces = Workspace.query.filter_by(status='approved').all()
+        
+        result = []
+        for workspace in workspaces:
+            result.append({
+                'id': workspace.id,
+                'name': workspace.name,
+                'description': workspace.description,
+                'createdBy': workspace.creator.name if workspace.creator else 'Unknown',
+                'createdAt': workspace.created_at.isoformat(),
+                'status': workspace.status
             })
         
         return jsonify(result)
         
     except Exception as e:
-        print(f"승인된 워크스페이스 조회 오류: {str(e)}")
+        logger.exception('승인된 워크스페이스 조회 오류')
         return jsonify({'message': '워크스페이스 조회 중 오류가 발생했습니다.'}), 500
 
-# 공지사항 관리 API
-@app.route('/api/notices', methods=['POST'])
-@jwt_required()
-def create_notice():
-    current_user_id = int(get_jwt_identity())
-    data = request.get_json()
+# 공지사항 관리 API
+@api.route('/api/notices', methods=['POST'])
+@jwt_required()
+def create_notice():
+    current_user_id = int(get_jwt_identity())
+    data = request.get_json()
+    
+    if data.get('priority') and data['priority'] not in current_app.config['DISPATCH_LANES']:
+        return jsonify({'message': f'priority는 {", ".join(current_app.config["DISPATCH_LANES"])} 중 하나여야 합니다.'}), 400
+    
+    notice = Notice(
+        type=data['type'],
+        category_id=data.get('categoryId'),
+        template_id=data.get('templateId'),
+        title=data['title'],
+        message=data['message'],
+        workspace_id=data['workspaceId'],
+        created_by=current_user_id,
+        scheduled_at=datetime.fromisoformat(data['scheduledAt'].replace('Z', '+00:00')),
+        no_image=data.get('noImage', False),
+        priority=data.get('priority') or None,
+        form_data=data.get('formData', {}),
+        variable_data=data.get('variableData', {}),
+        selected_webhook_url=data.get('selectedWebhookUrl'),  # 선택된 웹훅 URL 저장
+        target_webhook_urls=data.get('selectedWebhookUrls') or None
+    )
+    
+    db.session.add(notice)
+    db.session.flush()
+    
+    # 스케줄러에 작업 추가
+    job_id = f"notice_{notice.id}_{datetime.now().timestamp()}"
+    
+    scheduled_job = ScheduledJob(
+        notice_id=notice.id,
+        job_id=job_id,
+        scheduled_at=notice.scheduled_at
+    )
+    
+    db.session.add(scheduled_job)
+    
+    # 대시보드 카운터 갱신 (같은 트랜잭션)
+    adjust_workspace_counters(notice.workspace_id, scheduled_count=1, pending_job_count=1)
+    publish_event(notice.workspace_id, 'notice.created', notice_event_payload(notice, scheduled_job))
+    db.session.commit()
+    
+    # APScheduler에 작업 등록
+    register_notice_job(notice.id, job_id, notice.scheduled_at, notice.type)
+    
+    return jsonify({'message': '공지사항이 예약되었습니다.', 'id': notice.id}), 201
+
+@api.route('/api/notices', methods=['GET'])
+@jwt_required()
+def get_notices():
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    sync_requested, since = parse_sync_watermark()
+    if since is False:
+        return jsonify({'message': 'since 값이 올바르지 않습니다.'}), 400
+    started_at = datetime.utcnow()
+    
+    query = Notice.query
+    tombstones = SyncTombstone.query.filter(SyncTombstone.entity == 'notice')
+    
+    if not current_user.is_admin:
+        # 사용자가 접근 가능한 워크스페이스의 공지만 조회
+        user_workspace_ids = [uw.workspace_id for uw in current_user.user_workspaces]
+        query = query.filter(Notice.workspace_id.in_(user_workspace_ids))
+        tombstones = tombstones.filter(SyncTombstone.workspace_id.in_(user_workspace_ids))
+    
+    if not since:
+        items = [serialize_notice(notice) for notice in query.all()]
+        return jsonify(sync_response(items, [], started_at) if sync_requested else items)
+    
+    items = [serialize_notice(notice) for notice in query.filter(Notice.updated_at > since).all()]
+    deleted = [tombstone.entity_id for tombstone in tombstones.filter(SyncTombstone.deleted_at > since).all()]
+    return jsonify(sync_response(items, deleted, started_at, since=since))
+
+NOTICE_EDITABLE_FIELDS = {
+    'type': 'type',
+    'categoryId': 'category_id',
+    'templateId': 'template_id',
+    'title': 'title',
+    'message': 'message',
+    'noImage': 'no_image',
+    'selectedWebhookUrl': 'selected_webhook_url',
+    'priority': 'priority',
+}
+
+NOTICE_TYPES = ('attendance', 'satisfaction', 'thread', 'custom')
+
+def validate_notice_update(notice, data):
+    """수정 요청 검증 (객체를 바꾸기 전에 호출). 오류 메시지 또는 None 반환"""
+    for key, max_length in (('title', 200), ('message', None)):
+        if key in data:
+            value = data[key]
+            if not isinstance(value, str) or not value.strip():
+                return f'{key}는 비어 있을 수 없습니다.'
+            if max_length and len(value) > max_length:
+                return f'{key}는 {max_length}자 이하여야 합니다.'
+    
+    if 'type' in data and data['type'] not in NOTICE_TYPES:
+        return f'type은 {", ".join(NOTICE_TYPES)} 중 하나여야 합니다.'
+    
+    if 'noImage' in data and not isinstance(data['noImage'], bool):
+        return 'noImage는 true 또는 false여야 합니다.'
+    
+    if data.get('priority') and data['priority'] not in current_app.config['DISPATCH_LANES']:
+        return f'priority는 {", ".join(current_app.config["DISPATCH_LANES"])} 중 하나여야 합니다.'
+    
+    # 카테고리는 전역 또는 같은 워크스페이스, 템플릿은 같은 워크스페이스 것만 허용 (null이면 연결 해제)
+    if data.get('categoryId') is not None:
+        category = db.session.get(NoticeCategory, data['categoryId']) if isinstance(data['categoryId'], int) else None
+        if not category or category.workspace_id not in (None, notice.workspace_id):
+            return '카테고리를 찾을 수 없습니다.'
+    if data.get('templateId') is not None:
+        template = db.session.get(NoticeTemplate, data['templateId']) if isinstance(data['templateId'], int) else None
+        if not template or template.workspace_id != notice.workspace_id:
+            return '템플릿을 찾을 수 없습니다.'
+    
+    if data.get('selectedWebhookUrl') is not None and (not isinstance(data['selectedWebhookUrl'], str) or len(data['selectedWebhookUrl']) > 500):
+        return 'selectedWebhookUrl 형식이 올바르지 않습니다.'
+    if data.get('selectedWebhookUrls') is not None and (
+        not isinstance(data['selectedWebhookUrls'], list) or not all(isinstance(url, str) for url in data['selectedWebhookUrls'])
+    ):
+        return 'selectedWebhookUrls는 URL 목록이어야 합니다.'
+    for key in ('formData', 'variableData'):
+        if data.get(key) is not None and not isinstance(data[key], dict):
+            return f'{key}는 객체여야 합니다.'
+    
+    return None
+
+@api.route('/api/notices/<int:notice_id>', methods=['PUT'])
+@jwt_required()
+def update_notice(notice_id):
+    """예약된 공지 수정. 예약 시간이 바뀌면 기존 작업 행과 스케줄러 작업을 그대로 재예약"""
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    notice = db.session.get(Notice, notice_id)
+    if not notice:
+        return jsonify({'message': '공지사항을 찾을 수 없습니다.'}), 404
+    
+    if not current_user.is_admin:
+        user_workspace = UserWorkspace.query.filter_by(
+            user_id=current_user_id,
+            workspace_id=notice.workspace_id
+        ).first()
+        
+        if not user_workspace:
+            return jsonify({'message': '워크스페이스에 접근 권한이 없습니다.'}), 403
+    
+    scheduled_job = ScheduledJob.query.filter_by(notice_id=notice_id).first()
+    if notice.status != 'scheduled' or not scheduled_job or scheduled_job.status != 'pending':
+        return jsonify({'message': '이미 전송되었거나 전송 중인 공지사항은 수정할 수 없습니다.'}), 409
+    
+    data = request.get_json() or {}
+    
+    try:
+        scheduled_at = notice.scheduled_at
+        if data.get('scheduledAt'):
+            scheduled_at = datetime.fromisoformat(data['scheduledAt'].replace('Z', '+00:00'))
+            # 저장된 값(naive UTC)과 비교할 수 있도록 변환 (aware/naive는 항상 다르게 비교되어 매번 재예약됨)
+            if scheduled_at.tzinfo:
+                scheduled_at = scheduled_at.astimezone(timezone.utc).replace(tzinfo=None)
+    except (TypeError, ValueError):
+        return jsonify({'message': 'scheduledAt 형식이 올바르지 않습니다.'}), 400
+    
+    error = validate_notice_update(notice, data)
+    if error:
+        return jsonify({'message': error}), 400
+    
+    for key, attr in NOTICE_EDITABLE_FIELDS.items():
+        if key in data:
+            setattr(notice, attr, data[key])
+    notice.priority = notice.priority or None
+    if 'formData' in data:
+        notice.form_data = data['formData'] or {}
+    if 'variableData' in data:
+        notice.variable_data = data['variableData'] or {}
+    if 'selectedWebhookUrls' in data:
+        notice.target_webhook_urls = data['selectedWebhookUrls'] or None
+    
+    rescheduled = scheduled_at != notice.scheduled_at
+    if rescheduled:
+        # 전송이 시작되지 않은 경우에만 같은 작업 행의 시간을 변경
+        updated = ScheduledJob.query.filter_by(id=scheduled_job.id, status='pending').update(
+            {'scheduled_at': scheduled_at},
+            synchronize_session=False
+        )
+        if not updated:
+            db.session.rollback()
+            return jsonify({'message': '이미 전송되었거나 전송 중인 공지사항은 수정할 수 없습니다.'}), 409
+        notice.scheduled_at = scheduled_at
+    
+    publish_event(notice.workspace_id, 'notice.updated', notice_event_payload(notice, scheduled_job))
+    db.session.commit()
+    
+    # 이 워커가 스케줄러를 실행 중이면 바로 재예약, 아니면 리더가 sync_scheduler_jobs로 반영
+    if rescheduled:
+        reschedule_notice_job(notice.id, scheduled_job.job_id, scheduled_at, notice.type)
+    
+    return jsonify(serialize_notice(notice))
+
+@api.route('/api/notices/<int:notice_id>', methods=['DELETE'])
+@jwt_required()
+def delete_notice(notice_id):
+    """공지와 예약 작업, 전송 기록 삭제 (전송 중인 공지는 삭제 불가)"""
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    notice = db.session.get(Notice, notice_id)
+    if not notice:
+        return jsonify({'message': '공지사항을 찾을 수 없습니다.'}), 404
+    
+    if not current_user.is_admin:
+        user_workspace = UserWorkspace.query.filter_by(
+            user_id=current_user_id,
+            workspace_id=notice.workspace_id
+        ).first()
+        
+        if not user_workspace:
+            return jsonify({'message': '워크스페이스에 접근 권한이 없습니다.'}), 403
+    
+    scheduled_jobs = ScheduledJob.query.filter_by(notice_id=notice_id).all()
+    if any(job.status == 'running' for job in scheduled_jobs):
+        return jsonify({'message': '전송 중인 공지사항은 삭제할 수 없습니다.'}), 409
+    job_ids = [job.job_id for job in scheduled_jobs]
+    
+    try:
+        # 확인 이후 전송이 시작되었으면 삭제하지 않음
+        deleted_jobs = ScheduledJob.query.filter(
+            ScheduledJob.notice_id == notice_id,
+            ScheduledJob.status != 'running'
+        ).delete(synchronize_session=False)
+        if deleted_jobs != len(scheduled_jobs):
+            db.session.rollback()
+            return jsonify({'message': '전송 중인 공지사항은 삭제할 수 없습니다.'}), 409
+        
+        NoticeDelivery.query.filter_by(notice_id=notice_id).delete(synchronize_session=False)
+        
+        # 대시보드 카운터, 삭제 기록, 이벤트 (같은 트랜잭션)
+        deltas = status_transition_deltas(notice.status, None)
+        for job in scheduled_jobs:
+            for field, delta in status_transition_deltas(None, None, job.status, None).items():
+                deltas[field] = deltas.get(field, 0) + delta
+        adjust_workspace_counters(notice.workspace_id, **deltas)
+        record_tombstone('notice', notice.id, workspace_id=notice.workspace_id)
+        publish_event(notice.workspace_id, 'notice.deleted', {'noticeId': notice.id, 'workspaceId': notice.workspace_id})
+        
+        db.session.delete(notice)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.exception('공지사항 삭제 오류', extra=log_fields(noticeId=notice_id))
+        return jsonify({'message': '공지사항 삭제 중 오류가 발생했습니다.'}), 500
+    
+    # 이 워커의 스케줄러에서 제거 (다른 워커는 리더가 삭제 기록으로 제거)
+    remove_scheduler_jobs(job_ids)
+    
+    return jsonify({'message': '공지사항이 삭제되었습니다.'})
+
+# 변경분 동기화 (?since=<watermark>)
+SYNC_WATERMARK_OVERLAP = timedelta(seconds=5)  # 커밋 지연으로 누락되지 않도록 워터마크를 겹쳐서 발급
+SYNC_TOMBSTONE_RETENTION_DAYS = 30             # 삭제 기록 보관 기간, 이보다 오래된 워터마크는 전체 재동기화
+
+def parse_sync_watermark():
+    """since 파라미터 파싱. (요청 여부, 기준 시각) 반환, 형식 오류면 기준 시각이 False
+    
+    since=0 또는 보관 기간보다 오래된 워터마크는 전체 재동기화(기준 시각 None)로 처리합니다.
+    """
+    if 'since' not in request.args:
+        return False, None
+    
+    value = request.args['since']
+    if value in ('', '0'):
+        return True, None
+    
+    try:
+        since = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return True, False
+    
+    # 오프셋이 있으면 UTC로 변환 후 DB 값(naive UTC)과 비교
+    if since.tzinfo:
+        since = since.astimezone(timezone.utc).replace(tzinfo=None)
+    
+    if since < datetime.utcnow() - timedelta(days=SYNC_TOMBSTONE_RETENTION_DAYS):
+        return True, None
+    return True, since
+
+def sync_response(items, deleted, started_at, since=None):
+    return {
+        'items': items,
+        'deleted': deleted,
+        'full': since is None,
+        'watermark': (started_at - SYNC_WATERMARK_OVERLAP).isoformat()
+    }
+
+def record_tombstone(entity, entity_id, workspace_id=None, user_id=None):
+    """하드 삭제된 행을 변경분 동기화에서 알리기 위한 기록 (커밋은 호출한 쪽에서 수행)"""
+    db.session.add(SyncTombstone(entity=entity, entity_id=entity_id, workspace_id=workspace_id, user_id=user_id))
+
+def record_tombstones(entity, entity_ids, workspace_id):
+    """일괄 삭제한 행들의 삭제 기록 (executemany, 커밋은 호출한 쪽에서 수행)"""
+    if not entity_ids:
+        return
+    now = datetime.utcnow()
+    db.session.execute(db.insert(SyncTombstone), [
+        {'entity': entity, 'entity_id': entity_id, 'workspace_id': workspace_id, 'deleted_at': now}
+        for entity_id in entity_ids
+    ])
+
+def prune_sync_tombstones():
+    with get_app().app_context():
+        cutoff = datetime.utcnow() - timedelta(days=SYNC_TOMBSTONE_RETENTION_DAYS)
+        SyncTombstone.query.filter(SyncTombstone.deleted_at < cutoff).delete(synchronize_session=False)
+        db.session.commit()
+
+def serialize_workspace(ws):
+    return {
+        'id': ws.id,
+        'name': ws.name,
+        'description': ws.description,
+        'slackWebhookName': ws.slack_webhook_name,
+        'slackWebhookUrl': ws.slack_webhook_url,
+        'webhookUrls': ws.webhook_urls or [],
+        'checkinTime': ws.checkin_time.strftime('%H:%M') if ws.checkin_time else None,
+        'middleTime': ws.middle_time.strftime('%H:%M') if ws.middle_time else None,
+        'checkoutTime': ws.checkout_time.strftime('%H:%M') if ws.checkout_time else None,
+        'qrImageUrl': ws.qr_image_url,
+        'zoomUrl': ws.zoom_url,
+        'zoomId': ws.zoom_id,
+        'zoomPassword': ws.zoom_password,
+        'status': ws.status,
+        'createdBy': ws.creator.name if ws.creator else None,
+        'createdAt': ws.created_at.isoformat(),
+        'updatedAt': ws.updated_at.isoformat()
+    }
+
+def serialize_notice(notice):
+    return {
+        'id': notice.id,
+        'type': notice.type,
+        'title': notice.title,
+        'message': notice.message,
+        'workspaceId': notice.workspace_id,
+        'createdBy': notice.created_by,
+        'scheduledAt': notice.scheduled_at.isoformat(),
+        'status': notice.status,
+        'priority': notice.priority,
+        'createdAt': notice.created_at.isoformat(),
+        'updatedAt': notice.updated_at.isoformat() if notice.updated_at else None
+    }
+
+def serialize_template(template):
+    return {
+        'id': str(template.id),
+        'categoryId': str(template.category_id),
+        'name': template.name,
+        'title': template.title,
+        'content': template.content,
+        'workspaceId': str(template.workspace_id),
+        'variables': template.variables or [],
+        'isDefault': template.is_default,
+        'createdBy': str(template.created_by),
+        'createdAt': template.created_at.isoformat(),
+        'updatedAt': template.updated_at.isoformat()
+    }
+
+# 캘린더 조회 최대 기간 (일)
+CALENDAR_MAX_RANGE_DAYS = 93
+
+@api.route('/api/notices/calendar', methods=['GET'])
+@jwt_required()
+def get_notice_calendar():
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    workspace_id = request.args.get('workspaceId', type=int)
+    if not workspace_id:
+        return jsonify({'message': 'workspaceId가 필요합니다.'}), 400
+    
+    # 사용자가 해당 워크스페이스에 접근 권한이 있는지 확인 (관리자는 전체 접근)
+    if not current_user.is_admin:
+        user_workspace = UserWorkspace.query.filter_by(
+            user_id=current_user_id,
+            workspace_id=workspace_id
+        ).first()
+        
+        if not user_workspace:
+            return jsonify({'message': '워크스페이스에 접근 권한이 없습니다.'}), 403
+    
+    # 기간 파싱 (YYYY-MM-DD, 종료일 포함)
+    try:
+        start_date = datetime.strptime(request.args['start'], '%Y-%m-%d')
+        end_date = datetime.strptime(request.args['end'], '%Y-%m-%d')
+    except (KeyError, ValueError):
+        return jsonify({'message': 'start, end는 YYYY-MM-DD 형식이어야 합니다.'}), 400
+    
+    if end_date < start_date:
+        return jsonify({'message': '종료일이 시작일보다 빠릅니다.'}), 400
+    
+    if (end_date - start_date).days >= CALENDAR_MAX_RANGE_DAYS:
+        return jsonify({'message': f'조회 기간은 최대 {CALENDAR_MAX_RANGE_DAYS}일입니다.'}), 400
+    
+    range_filter = (
+        Notice.workspace_id == workspace_id,
+        Notice.scheduled_at >= start_date,
+        Notice.scheduled_at < end_date + timedelta(days=1)
+    )
+    
+    # 일자/상태/유형별 집계 (workspace_id, scheduled_at 인덱스 사용)
+    day = db.func.date(Notice.scheduled_at)
+    counts = db.session.query(
+        day, Notice.status, Notice.type, db.func.count(Notice.id)
+    ).filter(*range_filter).group_by(day, Notice.status, Notice.type).all()
+    
+    days = {}
+    for date_str, status, notice_type, count in counts:
+        entry = days.setdefault(date_str, {
+            'date': date_str,
+            'total': 0,
+            'byStatus': {},
+            'byType': {},
+            'notices': []
+        })
+        entry['total'] += count
+        entry['byStatus'][status] = entry['byStatus'].get(status, 0) + count
+        entry['byType'][notice_type] = entry['byType'].get(notice_type, 0) + count
+    
+    # 공지 요약 (본문 없이 필요한 컬럼만 조회)
+    if request.args.get('summary', 'true') != 'false':
+        summaries = db.session.query(
+            Notice.id, Notice.type, Notice.title, Notice.status, Notice.scheduled_at
+        ).filter(*range_filter).order_by(Notice.scheduled_at).all()
+        
+        for notice_id, notice_type, title, status, scheduled_at in summaries:
+            date_str = scheduled_at.strftime('%Y-%m-%d')
+            if date_str in days:
+                days[date_str]['notices'].append({
+                    'id': notice_id,
+                    'type': notice_type,
+                    'title': title,
+                    'status': status,
+                    'scheduledAt': scheduled_at.isoformat()
+                })
+    
+    return jsonify({
+        'workspaceId': workspace_id,
+        'start': start_date.strftime('%Y-%m-%d'),
+        'end': end_date.strftime('%Y-%m-%d'),
+        'days': [days[key] for key in sorted(days)]
+    })
+
+# 데이터 내보내기 (CSV / NDJSON 스트리밍)
+EXPORT_CHUNK_SIZE = 1000             # 커서에서 한 번에 가져와 내보낼 행 수
+EXPORT_FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson; charset=utf-8',
+}
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')  # 스프레드시트에서 수식으로 해석되는 시작 문자
+
+def export_notices_query(workspace_id, start, end):
+    query = db.select(
+        Notice.id.label('id'),
+        Notice.type.label('type'),
+        Notice.title.label('title'),
+        Notice.message.label('message'),
+        Notice.status.label('status'),
+        Notice.scheduled_at.label('scheduledAt'),
+        Notice.sent_at.label('sentAt'),
+        User.name.label('createdBy'),
+        Notice.error_message.label('errorMessage')
+    ).outerjoin(User, User.id == Notice.created_by).where(Notice.workspace_id == workspace_id)
+    if start:
+        query = query.where(Notice.scheduled_at >= start)
+    if end:
+        query = query.where(Notice.scheduled_at < end)
+    return query.order_by(Notice.scheduled_at, Notice.id)
+
+def export_jobs_query(workspace_id, start, end):
+    query = db.select(
+        ScheduledJob.job_id.label('jobId'),
+        ScheduledJob.notice_id.label('noticeId'),
+        Notice.title.label('noticeTitle'),
+        ScheduledJob.status.label('status'),
+        ScheduledJob.scheduled_at.label('scheduledAt'),
+        ScheduledJob.executed_at.label('executedAt'),
+        ScheduledJob.error_message.label('errorMessage')
+    ).join(Notice, Notice.id == ScheduledJob.notice_id).where(Notice.workspace_id == workspace_id)
+    if start:
+        query = query.where(Notice.scheduled_at >= start)
+    if end:
+        query = query.where(Notice.scheduled_at < end)
+    return query.order_by(Notice.scheduled_at, ScheduledJob.id)
+
+def export_deliveries_query(workspace_id, start, end):
+    query = db.select(
+        NoticeDelivery.notice_id.label('noticeId'),
+        Notice.title.label('noticeTitle'),
+        NoticeDelivery.webhook_url.label('webhookUrl'),
+        NoticeDelivery.status.label('status'),
+        NoticeDelivery.attempt_count.label('attemptCount'),
+        NoticeDelivery.latency_ms.label('latencyMs'),
+        NoticeDelivery.sent_at.label('sentAt'),
+        NoticeDelivery.error_message.label('errorMessage')
+    ).join(Notice, Notice.id == NoticeDelivery.notice_id).where(Notice.workspace_id == workspace_id)
+    if start:
+        query = query.where(Notice.scheduled_at >= start)
+    if end:
+        query = query.where(Notice.scheduled_at < end)
+    return query.order_by(Notice.scheduled_at, NoticeDelivery.id)
+
+def export_zoom_exits_query(workspace_id, start, end):
+    query = db.select(
+        ZoomExitRecord.user_id.label('userId'),
+        ZoomExitRecord.user_name.label('userName'),
+        ZoomExitRecord.timestamp.label('timestamp')
+    ).where(ZoomExitRecord.workspace_id == workspace_id)
+    if start:
+        query = query.where(ZoomExitRecord.timestamp >= start)
+    if end:
+        query = query.where(ZoomExitRecord.timestamp < end)
+    return query.order_by(ZoomExitRecord.timestamp, ZoomExitRecord.id)
+
+EXPORT_QUERIES = {
+    'notices': export_notices_query,
+    'jobs': export_jobs_query,
+    'deliveries': export_deliveries_query,
+    'zoom-exits': export_zoom_exits_query,
+}
+
+def export_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+def csv_cell(value):
+    value = export_value(value)
+    if value is None:
+        return ''
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+def generate_export(query, export_format):
+    """서버 측 커서에서 EXPORT_CHUNK_SIZE 행씩 읽어 바로 내보냄 (내보내기 크기와 무관하게 메모리 일정)"""
+    result = db.session.execute(query.execution_options(yield_per=EXPORT_CHUNK_SIZE))
+    try:
+        columns = list(result.keys())
+        buffer = io.StringIO()
+        
+        if export_format == 'csv':
+            writer = csv.writer(buffer)
+            buffer.write('\ufeff')  # 엑셀에서 한글이 깨지지 않도록 BOM 추가
+            writer.writerow(columns)
+            yield buffer.getvalue()
+            
+            for rows in result.partitions():
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows([csv_cell(value) for value in row] for row in rows)
+                yield buffer.getvalue()
+        else:
+            for rows in result.partitions():
+                yield ''.join(
+                    json.dumps({column: export_value(value) for column, value in zip(columns, row)}, ensure_ascii=False) + '\n'
+                    for row in rows
+                )
+    finally:
+        result.close()
+        db.session.remove()
+
+@api.route('/api/export/<kind>', methods=['GET'])
+@jwt_required()
+def export_workspace_data(kind):
+    """워크스페이스의 공지/예약 작업/전송 결과/줌 퇴장 기록을 CSV 또는 NDJSON으로 내보내기"""
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    if kind not in EXPORT_QUERIES:
+        return jsonify({'message': f'지원하지 않는 내보내기 종류입니다. ({", ".join(EXPORT_QUERIES)})'}), 404
+    
+    export_format = request.args.get('format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({'message': 'format은 csv 또는 ndjson이어야 합니다.'}), 400
+    
+    workspace_id = request.args.get('workspaceId', type=int)
+    if not workspace_id:
+        return jsonify({'message': 'workspaceId가 필요합니다.'}), 400
+    
+    # 사용자가 해당 워크스페이스에 접근 권한이 있는지 확인 (관리자는 전체 접근)
+    if not current_user.is_admin:
+        user_workspace = UserWorkspace.query.filter_by(
+            user_id=current_user_id,
+            workspace_id=workspace_id
+        ).first()
+        
+        if not user_workspace:
+            return jsonify({'message': '워크스페이스에 접근 권한이 없습니다.'}), 403
+    
+    # 기간 파싱 (YYYY-MM-DD, 종료일 포함, 생략 시 전체 기간)
+    try:
+        start_date = datetime.strptime(request.args['start'], '%Y-%m-%d') if request.args.get('start') else None
+        end_date = datetime.strptime(request.args['end'], '%Y-%m-%d') if request.args.get('end') else None
+    except ValueError:
+        return jsonify({'message': 'start, end는 YYYY-MM-DD 형식이어야 합니다.'}), 400
+    
+    if start_date and end_date and end_date < start_date:
+        return jsonify({'message': '종료일이 시작일보다 빠릅니다.'}), 400
+    
+    query = EXPORT_QUERIES[kind](workspace_id, start_date, end_date + timedelta(days=1) if end_date else None)
+    filename = '_'.join(filter(None, [
+        kind,
+        str(workspace_id),
+        start_date.strftime('%Y%m%d') if start_date else None,
+        end_date.strftime('%Y%m%d') if end_date else None
+    ])) + f'.{export_format}'
+    
+    return Response(stream_with_context(generate_export(query, export_format)), content_type=EXPORT_FORMATS[export_format], headers={
+        'Content-Disposition': f'attachment; filename="{filename}"',
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+# 웹훅 동시 전송 설정
+WEBHOOK_TIMEOUT = 10       # 웹훅 요청 타임아웃 (초)
+WEBHOOK_MAX_WORKERS = 32   # 동시 전송 스레드 수
+
+webhook_executor = ThreadPoolExecutor(max_workers=WEBHOOK_MAX_WORKERS, thread_name_prefix='webhook')
+
+# 웹훅 회로 차단기 (URL별)
+# 폐기되었거나 응답이 느린 웹훅으로 계속 전송해 전송 스레드를 붙잡지 않도록, 최근 실패율이 높은 URL은
+# 일정 시간 전송하지 않고 바로 실패 처리(open)한 뒤 시험 전송 1건(half_open)이 성공하면 다시 연결(closed)합니다.
+BREAKER_WINDOW = 20             # 실패율 계산에 사용할 최근 전송 수
+BREAKER_MIN_CALLS = 5           # 이 횟수 이상 전송한 뒤부터 차단 여부 판단
+BREAKER_FAILURE_RATE = 0.5      # 차단 실패율 임계값
+BREAKER_SLOW_CALL_MS = 5000     # 이보다 느린 응답은 전송에 성공해도 실패로 집계
+BREAKER_OPEN_SECONDS = 60       # 차단 후 시험 전송까지 대기 시간 (시험 전송이 실패할 때마다 2배)
+BREAKER_MAX_OPEN_SECONDS = 900  # 최대 차단 시간
+
+class WebhookCircuitBreaker:
+    """프로세스 내 URL별 회로 상태. 상태 요약은 WebhookHealth 테이블에 저장해 다른 워커와 API에서 조회"""
+    def __init__(self):
+        self.circuits = {}
+        self.lock = threading.Lock()
+    
+    def _circuit(self, url):
+        circuit = self.circuits.get(url)
+        if circuit is None:
+            circuit = self.circuits[url] = {
+                'state': 'closed',
+                'outcomes': deque(maxlen=BREAKER_WINDOW),
+                'open_until': None,
+                'open_seconds': BREAKER_OPEN_SECONDS,
+                'probing': False
+            }
+        return circuit
+    
+    def known(self, url):
+        return url in self.circuits
+    
+    def restore(self, url, state, open_until):
+        """다른 워커/이전 프로세스가 저장한 차단 상태를 처음 보는 URL에 적용"""
+        with self.lock:
+            circuit = self._circuit(url)
+            if state in ('open', 'half_open') and open_until:
+                circuit['state'] = 'open'
+                circuit['open_until'] = open_until
+    
+    def before_call(self, url):
+        """전송해도 되면 None, 차단 중이면 다시 시도할 수 있는 시각 반환"""
+        now = datetime.utcnow()
+        with self.lock:
+            circuit = self._circuit(url)
+            if circuit['state'] == 'open':
+                if now < circuit['open_until']:
+                    return circuit['open_until']
+                circuit['state'] = 'half_open'
+                circuit['probing'] = False
+            if circuit['state'] == 'half_open':
+                # 시험 전송은 한 건만 허용
+                if circuit['probing']:
+                    return circuit['open_until']
+                circuit['probing'] = True
+            return None
+    
+    def record(self, url, error, latency_ms):
+        """전송 결과 반영. 상태가 바뀌면 새 상태 반환"""
+        failed = error is not None or latency_ms >= BREAKER_SLOW_CALL_MS
+        with self.lock:
+            circuit = self._circuit(url)
+            previous_state = circuit['state']
+            
+            if previous_state == 'half_open':
+                circuit['probing'] = False
+                if failed:
+                    circuit['open_seconds'] = min(circuit['open_seconds'] * 2, BREAKER_MAX_OPEN_SECONDS)
+                    self._open(circuit)
+                else:
+                    circuit['state'] = 'closed'
+                    circuit['outcomes'].clear()
+                    circuit['open_seconds'] = BREAKER_OPEN_SECONDS
+            elif previous_state == 'closed':
+                circuit['outcomes'].append(failed)
+                outcomes = circuit['outcomes']
+                if len(outcomes) >= BREAKER_MIN_CALLS and sum(outcomes) / len(outcomes) >= BREAKER_FAILURE_RATE:
+                    self._open(circuit)
+            
+            return circuit['state'] if circuit['state'] != previous_state else None
+    
+    def _open(self, circuit):
+        circuit['state'] = 'open'
+        circuit['open_until'] = datetime.utcnow() + timedelta(seconds=circuit['open_seconds'])
+    
+    def snapshot(self, url):
+        with self.lock:
+            circuit = self._circuit(url)
+            outcomes = circuit['outcomes']
+            return {
+                'state': circuit['state'],
+                'failure_rate': round(sum(outcomes) / len(outcomes), 3) if outcomes else None,
+                'recent_calls': len(outcomes),
+                'open_until': circuit['open_until'] if circuit['state'] != 'closed' else None
+            }
+
+webhook_breaker = WebhookCircuitBreaker()
+
+def restore_webhook_circuits(urls):
+    """이 프로세스에서 처음 보는 URL의 저장된 차단 상태 불러오기"""
+    unknown = [url for url in urls if not webhook_breaker.known(url)]
+    if not unknown:
+        return
+    rows = db.session.query(WebhookHealth.url, WebhookHealth.state, WebhookHealth.open_until).filter(
+        WebhookHealth.url.in_(unknown)
+    ).all()
+    for url, state, open_until in rows:
+        webhook_breaker.restore(url, state, open_until)
+
+def save_webhook_health(results):
+    """전송 결과로 URL별 상태 요약 갱신 (커밋은 호출자 트랜잭션에서 수행)
+    
+    results: [(url, error, latency_ms)]
+    """
+    now = datetime.utcnow()
+    rows = []
+    for url, error, latency_ms in results:
+        row = dict(webhook_breaker.snapshot(url), url=url, last_latency_ms=latency_ms, updated_at=now)
+        if error:
+            row.update(last_error=error, last_failure_at=now)
+        else:
+            row.update(last_success_at=now)
+        rows.append(row)
+    
+    for row in rows:
+        stmt = sqlite_insert(WebhookHealth).values(**row)
+        db.session.execute(stmt.on_conflict_do_update(
+            index_elements=[WebhookHealth.url],
+            set_={key: stmt.excluded[key] for key in row if key != 'url'}
+        ))
+
+def serialize_webhook_health(url, health):
+    return {
+        'url': url,
+        'state': health.state if health else 'closed',
+        'failureRate': health.failure_rate if health else None,
+        'recentCalls': health.recent_calls if health else 0,
+        'lastLatencyMs': health.last_latency_ms if health else None,
+        'lastError': health.last_error if health else None,
+        'lastSuccessAt': serialize_datetime(health.last_success_at) if health else None,
+        'lastFailureAt': serialize_datetime(health.last_failure_at) if health else None,
+        'retryAt': serialize_datetime(health.open_until) if health and health.state != 'closed' else None
+    }
+
+def get_workspace_webhook_health(slack_webhook_url, webhook_urls):
+    """워크스페이스의 기본/추가 웹훅 URL별 상태 (webhook_urls는 [{name, url}] 목록)"""
+    urls = [slack_webhook_url] if slack_webhook_url else []
+    for item in webhook_urls or []:
+        url = item.get('url') if isinstance(item, dict) else item
+        if url:
+            urls.append(url)
+    urls = list(dict.fromkeys(urls))
+    
+    health = {row.url: row for row in WebhookHealth.query.filter(WebhookHealth.url.in_(urls)).all()} if urls else {}
+    return [serialize_webhook_health(url, health.get(url)) for url in urls]
+
+def webhook_usage_query(url=None):
+    """웹훅 URL별 사용 워크스페이스 (기본 슬랙 웹훅 + webhook_urls 항목을 JSON1 json_each로 펼쳐 DB에서 조회)"""
+    item = db.func.json_each(Workspace.webhook_urls).table_valued('value', 'type')
+    # 이전 데이터는 {name, url} 대신 URL 문자열만 저장되어 있을 수 있음
+    item_url = db.case((item.c.type == 'object', db.func.json_extract(item.c.value, '$.url')), else_=item.c.value)
+    usage = db.union_all(
+        db.select(Workspace.slack_webhook_url.label('url'), Workspace.id.label('workspace_id'), Workspace.name.label('workspace_name'))
+        .where(Workspace.status != 'deleted'),
+        db.select(item_url.label('url'), Workspace.id.label('workspace_id'), Workspace.name.label('workspace_name'))
+        .select_from(Workspace).join(item, db.true())
+        .where(Workspace.status != 'deleted')
+    ).subquery()
+    
+    query = db.select(usage.c.url, usage.c.workspace_id, usage.c.workspace_name).where(usage.c.url.isnot(None), usage.c.url != '')
+    if url:
+        query = query.where(usage.c.url == url)
+    return query.distinct().order_by(usage.c.url, usage.c.workspace_id)
+
+@api.route('/api/admin/webhooks', methods=['GET'])
+@jwt_required()
+def get_webhook_usage():
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    if not current_user.is_admin:
+        return jsonify({'message': '관리자 권한이 필요합니다.'}), 403
+    
+    usage = {}
+    for url, workspace_id, workspace_name in db.session.execute(webhook_usage_query(request.args.get('url'))):
+        usage.setdefault(url, []).append({'id': workspace_id, 'name': workspace_name})
+    
+    health = {row.url: row for row in WebhookHealth.query.filter(WebhookHealth.url.in_(usage)).all()} if usage else {}
+    result = [dict(serialize_webhook_health(url, health.get(url)), workspaces=workspaces) for url, workspaces in usage.items()]
+    if request.args.get('state'):
+        result = [item for item in result if item['state'] == request.args['state']]
+    
+    return jsonify(result)
+
+def get_notice_target_urls(notice, workspace):
+    """공지 전송 대상 웹훅 URL 목록 (중복 제거, 순서 유지)"""
+    if notice.target_webhook_urls:
+        urls = notice.target_webhook_urls
+    else:
+        # 선택된 웹훅 URL이 있으면 우선 사용, 없으면 기본 슬랙 웹훅 URL 사용
+        urls = [notice.selected_webhook_url or workspace.slack_webhook_url]
+    return list(dict.fromkeys(url for url in urls if url))
+
+def build_slack_message(notice, workspace):
+    # Slack 메시지 구성
+    slack_data = {
+        "text": notice.title,
+        "blocks": [
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": notice.message
+                }
+            }
+        ]
+    }
+    
+    # QR 이미지 추가 (no_image가 False인 경우)
+    if not notice.no_image and workspace.qr_image_url:
+        slack_data["blocks"].append({
+            "type": "image",
+            "image_url": workspace.qr_image_url,
+            "alt_text": "QR Code"
+        })
+    
+    return slack_data
+
+def post_webhook(webhook_url, payload):
+    """웹훅 1건 전송 (DB 접근 없음, 작업 스레드에서 실행)"""
+    import requests  # 전송 시에만 로드 (import 비용 절감)
+    
+    started = time.monotonic()
+    try:
+        response = requests.post(webhook_url, json=payload, timeout=WEBHOOK_TIMEOUT)
+        response.raise_for_status()
+        error = None
+    except Exception as e:
+        error = str(e)
+    return error, int((time.monotonic() - started) * 1000)
+
+def deliver_notice(notice, workspace):
+    """대상 웹훅으로 동시 전송하고 대상별 결과를 기록. 이미 전송된 대상은 건너뜀"""
+    target_urls = get_notice_target_urls(notice, workspace)
+    if not target_urls:
+        raise Exception("발송할 웹훅 URL이 설정되지 않았습니다.")
+    
+    # 대상 추가 전에 조회해 둠 (추가 후 조회하면 autoflush로 웹훅 응답을 기다리는 동안 쓰기 잠금을 잡게 됨)
+    restore_webhook_circuits(target_urls)
+    deliveries = {delivery.webhook_url: delivery for delivery in NoticeDelivery.query.filter_by(notice_id=notice.id).all()}
+    for url in target_urls:
+        if url not in deliveries:
+            deliveries[url] = NoticeDelivery(notice_id=notice.id, webhook_url=url, status='pending', attempt_count=0)
+            db.session.add(deliveries[url])
+    
+    # 실패했거나 아직 보내지 않은 대상만 재전송 (차단된 URL은 요청 없이 바로 실패 처리)
+    pending = [deliveries[url] for url in target_urls if deliveries[url].status != 'sent']
+    payload = build_slack_message(notice, workspace)
+    futures = {}
+    for delivery in pending:
+        retry_at = webhook_breaker.before_call(delivery.webhook_url)
+        if retry_at is None:
+            futures[delivery] = webhook_executor.submit(post_webhook, delivery.webhook_url, payload)
+        else:
+            delivery.status = 'failed'
+            delivery.error_message = f'최근 전송 실패가 많아 {retry_at.isoformat()}까지 전송을 차단했습니다. (circuit open)'
+    
+    results = []
+    for delivery, future in futures.items():
+        error, latency_ms = future.result()
+        delivery.attempt_count += 1
+        delivery.latency_ms = latency_ms
+        delivery.error_message = error
+        if error:
+            delivery.status = 'failed'
+            logger.warning('웹훅 전송 실패: %s', error, extra=log_fields(noticeId=notice.id, latencyMs=latency_ms))
+        else:
+            delivery.status = 'sent'
+            delivery.sent_at = datetime.utcnow()
+        
+        transition = webhook_breaker.record(delivery.webhook_url, error, latency_ms)
+        if transition:
+            logger.warning('웹훅 회로 상태 변경: %s', transition, extra=log_fields(
+                workspaceId=workspace.id, webhookUrl=delivery.webhook_url
+            ))
+        results.append((delivery.webhook_url, error, latency_ms))
+    save_webhook_health(results)
+    
+    failed = [deliveries[url] for url in target_urls if deliveries[url].status != 'sent']
+    if failed:
+        raise Exception(f"{len(failed)}/{len(target_urls)}개 웹훅 전송 실패: " + "; ".join(
+            f"{delivery.webhook_url}: {delivery.error_message}" for delivery in failed
+        ))
+
+# 공지 전송 함수
+def send_notice(notice_id, claim_statuses=('pending',)):
+    """공지 전송 (예약 작업, 재전송, 즉시 전송 공용)
+    
+    작업 행 상태가 claim_statuses 중 하나일 때만 running으로 선점한 뒤 전송합니다.
+    예약 작업과 즉시 전송이 동시에 실행되어도 한 쪽만 전송하며, 전송을 진행했으면 True를 반환합니다.
+    """
+    with get_app().app_context():
+        notice = db.session.get(Notice, notice_id)
+        scheduled_job = ScheduledJob.query.filter_by(notice_id=notice_id).first()
+        
+        if not notice or not scheduled_job:
+            return False
+        
+        previous_status = notice.status
+        previous_job_status = scheduled_job.status
+        
+        workspace = db.session.get(Workspace, notice.workspace_id)
+        
+        # 삭제 중인 워크스페이스의 공지는 전송하지 않음
+        if not workspace or workspace.status == 'deleted':
+            return False
+        
+        if previous_job_status not in claim_statuses:
+            return False
+        
+        # 예약 실행의 지연 시간 기록 (즉시 전송/재전송은 제외)
+        claim_values = {'status': 'running', 'claimed_from': previous_job_status}
+        delay = (datetime.utcnow() - scheduled_job.scheduled_at).total_seconds() if previous_job_status == 'pending' else -1
+        if delay >= 0:
+            claim_values['delay_seconds'] = int(delay)
+        
+        # 작업 선점 (다른 스레드/워커가 먼저 가져갔으면 중단)
+        # 선점과 함께 커밋해 둠. 변경을 남겨 두면 전송 중 조회의 autoflush로 웹훅 응답을 기다리는 동안 쓰기 잠금을 잡게 됨
+        claimed = ScheduledJob.query.filter_by(id=scheduled_job.id, status=previous_job_status).update(
+            claim_values,
+            synchronize_session=False
+        )
+        db.session.commit()
+        if not claimed:
+            return False
+        db.session.refresh(scheduled_job)
+        
+        if delay >= get_app().config['SCHEDULER_LATE_THRESHOLD']:
+            scheduler_logger.warning('예약 시간보다 늦게 전송', extra=log_fields(
+                noticeId=notice_id, type=notice.type, delaySeconds=int(delay)
+            ))
+        
+        try:
+            deliver_notice(notice, workspace)
+            
+            # 성공 처리
+            notice.status = 'sent'
+            notice.sent_at = datetime.utcnow()
+            notice.error_message = None
+            scheduled_job.status = 'completed'
+            scheduled_job.executed_at = datetime.utcnow()
+            scheduled_job.error_message = None
+            
+        except Exception as e:
+            # 실패 처리
+            notice.status = 'failed'
+            notice.error_message = str(e)
+            scheduled_job.status = 'failed'
+            scheduled_job.executed_at = datetime.utcnow()
+            scheduled_job.error_message = str(e)
+        
+        # 대시보드 카운터 갱신 (같은 트랜잭션)
+        adjust_workspace_counters(
+            notice.workspace_id,
+            **status_transition_deltas(previous_status, notice.status, previous_job_status, scheduled_job.status)
+        )
+        publish_event(notice.workspace_id, 'notice.status', notice_event_payload(notice, scheduled_job))
+        
+        db.session.commit()
+        return True
+
+def serialize_delivery(delivery):
+    return {
+        'id': delivery.id,
+        'webhookUrl': delivery.webhook_url,
+        'status': delivery.status,
+        'attemptCount': delivery.attempt_count,
+        'latencyMs': delivery.latency_ms,
+        'error': delivery.error_message,
+        'sentAt': delivery.sent_at.isoformat() if delivery.sent_at else None
+    }
+
+@api.route('/api/notices/<int:notice_id>/deliveries', methods=['GET'])
+@jwt_required()
+def get_notice_deliveries(notice_id):
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    notice = db.session.get(Notice, notice_id)
+    if not notice:
+        return jsonify({'message': '공지사항을 찾을 수 없습니다.'}), 404
+    
+    if not current_user.is_admin:
+        user_workspace = UserWorkspace.query.filter_by(
+            user_id=current_user_id,
+            workspace_id=notice.workspace_id
+        ).first()
+        
+        if not user_workspace:
+            return jsonify({'message': '워크스페이스에 접근 권한이 없습니다.'}), 403
+    
+    deliveries = NoticeDelivery.query.filter_by(notice_id=notice_id).order_by(NoticeDelivery.id).all()
+    
+    return jsonify([serialize_delivery(delivery) for delivery in deliveries])
+
+@api.route('/api/notices/<int:notice_id>/retry', methods=['POST'])
+@jwt_required()
+def retry_notice(notice_id):
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    notice = db.session.get(Notice, notice_id)
+    if not notice:
+        return jsonify({'message': '공지사항을 찾을 수 없습니다.'}), 404
+    
+    if not current_user.is_admin:
+        user_workspace = UserWorkspace.query.filter_by(
+            user_id=current_user_id,
+            workspace_id=notice.workspace_id
+        ).first()
+        
+        if not user_workspace:
+            return jsonify({'message': '워크스페이스에 접근 권한이 없습니다.'}), 403
+    
+    if notice.status != 'failed':
+        return jsonify({'message': '전송에 실패한 공지만 재전송할 수 있습니다.'}), 400
+    
+    # 실패한 대상만 재전송
+    run_background_task(send_notice, [notice_id, ('failed',)], f'retry_notice_{notice_id}')
+    
+    return jsonify({'message': '실패한 대상으로 재전송을 시작했습니다.'}), 202
+
+@api.route('/api/notices/<int:notice_id>/send', methods=['POST'])
+@jwt_required()
+def send_notice_now(notice_id):
+    """예약 시간을 기다리지 않고 즉시 전송 (요청 스레드에서 바로 웹훅 전송 후 결과 반환)
+    
+    대기 중인 예약 작업은 선점 후 제거하므로 같은 공지가 두 번 전송되지 않고,
+    이미 전송된 공지에 다시 요청하면 전송 없이 기존 결과를 돌려줍니다.
+    """
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    notice = db.session.get(Notice, notice_id)
+    if not notice:
+        return jsonify({'message': '공지사항을 찾을 수 없습니다.'}), 404
+    
+    if not current_user.is_admin:
+        user_workspace = UserWorkspace.query.filter_by(
+            user_id=current_user_id,
+            workspace_id=notice.workspace_id
+        ).first()
+        
+        if not user_workspace:
+            return jsonify({'message': '워크스페이스에 접근 권한이 없습니다.'}), 403
+    
+    scheduled_job = ScheduledJob.query.filter_by(notice_id=notice_id).first()
+    if not scheduled_job:
+        return jsonify({'message': '공지사항의 예약 작업을 찾을 수 없습니다.'}), 404
+    
+    job_id = scheduled_job.job_id
+    started = time.perf_counter()
+    sent = send_notice(notice_id, ('pending', 'failed'))
+    latency_ms = int((time.perf_counter() - started) * 1000)
+    
+    db.session.expire_all()
+    notice = db.session.get(Notice, notice_id)
+    scheduled_job = ScheduledJob.query.filter_by(notice_id=notice_id).first()
+    
+    if not sent and scheduled_job.status == 'running':
+        return jsonify({'message': '이미 전송 중인 공지사항입니다.'}), 409
+    if not sent and notice.status != 'sent':
+        return jsonify({'message': '공지사항을 전송할 수 없습니다.', 'status': notice.status}), 400
+    
+    # 스케줄러에 남은 예약 작업 제거 (다른 워커의 작업은 실행 시 선점에 실패해 전송하지 않음)
+    remove_scheduler_jobs([job_id])
+    
+    deliveries = NoticeDelivery.query.filter_by(notice_id=notice_id).order_by(NoticeDelivery.id).all()
+    return jsonify({
+        'message': '공지사항이 전송되었습니다.' if notice.status == 'sent' else '공지사항 전송에 실패했습니다.',
+        'id': notice.id,
+        'status': notice.status,
+        'alreadySent': not sent,
+        'sentAt': notice.sent_at.isoformat() if notice.sent_at else None,
+        'latencyMs': latency_ms if sent else None,
+        'error': notice.error_message,
+        'deliveries': [serialize_delivery(delivery) for delivery in deliveries]
+    })
+
+# 상태 변경 이벤트 (SSE)
+EVENT_POLL_INTERVAL = 0.5      # 이벤트 테이블 확인 주기 (초)
+EVENT_KEEPALIVE_INTERVAL = 15  # 연결 유지용 주석 전송 주기 (초)
+EVENT_RETENTION_HOURS = 24     # 이어받기용 이벤트 보관 시간
+EVENT_REPLAY_LIMIT = 1000      # 재연결 시 한 번에 재전송할 최대 이벤트 수
+
+def publish_event(workspace_id, event_type, data):
+    """상태 변경 이벤트 기록 (커밋은 호출한 쪽 트랜잭션에서 수행)
+    
+    이벤트 테이블을 거치므로 다른 워커 프로세스에서 발생한 변경도 모든 워커의 구독자에게 전달됩니다.
+    """
+    db.session.add(NoticeEvent(
+        workspace_id=workspace_id,
+        type=event_type,
+        payload=json.dumps(data, ensure_ascii=False)
+    ))
+
+def notice_event_payload(notice, scheduled_job=None):
+    return {
+        'noticeId': notice.id,
+        'workspaceId': notice.workspace_id,
+        'status': notice.status,
+        'jobStatus': scheduled_job.status if scheduled_job else None,
+        'scheduledAt': notice.scheduled_at.isoformat() if notice.scheduled_at else None,
+        'sentAt': notice.sent_at.isoformat() if notice.sent_at else None,
+        'error': notice.error_message
+    }
+
+def format_sse(event):
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+class EventBus:
+    """프로세스 내 이벤트 분배기
+    
+    백그라운드 스레드 하나가 이벤트 테이블의 새 행을 읽어 구독자별 큐에 나눠 넣습니다.
+    구독자가 아무리 많아도 DB 조회는 프로세스당 한 번입니다.
+    """
+    
+    def __init__(self):
+        self._subscribers = {}  # queue -> 구독 워크스페이스 ID 집합 (None이면 전체)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._last_id = None
+    
+    def subscribe(self, workspace_ids):
+        subscriber = queue.Queue(maxsize=500)
+        with self._lock:
+            self._subscribers[subscriber] = workspace_ids
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, args=[get_app()], name='event-bus', daemon=True)
+                self._thread.start()
+        return subscriber
+    
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.pop(subscriber, None)
+    
+    def dispatch(self, events):
+        with self._lock:
+            subscribers = list(self._subscribers.items())
+        
+        for subscriber, workspace_ids in subscribers:
+            for event in events:
+                if workspace_ids is not None and event['workspaceId'] not in workspace_ids:
+                    continue
+                try:
+                    subscriber.put_nowait(event)
+                except queue.Full:
+                    # 처리하지 못하는 구독자는 끊고, 클라이언트가 Last-Event-ID로 이어받도록 함
+                    self.unsubscribe(subscriber)
+                    with subscriber.mutex:
+                        subscriber.queue.clear()
+                    subscriber.put_nowait(None)
+                    break
+    
+    def _run(self, app):
+        while True:
+            with self._lock:
+                if not self._subscribers:
+                    self._thread = None
+                    self._last_id = None
+                    return
+            try:
+                with app.app_context():
+                    if self._last_id is None:
+                        self._last_id = db.session.query(db.func.max(NoticeEvent.id)).scalar() or 0
+                    rows = NoticeEvent.query.filter(NoticeEvent.id > self._last_id).order_by(NoticeEvent.id).limit(500).all()
+                    events = [serialize_notice_event(row) for row in rows]
+                    db.session.remove()
+                if events:
+                    self._last_id = events[-1]['id']
+                    self.dispatch(events)
+            except Exception as e:
+                logger.exception('이벤트 분배 오류')
+            time.sleep(EVENT_POLL_INTERVAL)
+
+event_bus = EventBus()
+
+def serialize_notice_event(row):
+    return {
+        'id': row.id,
+        'type': row.type,
+        'workspaceId': row.workspace_id,
+        'createdAt': row.created_at.isoformat(),
+        'data': json.loads(row.payload)
+    }
+
+def prune_notice_events():
+    """보관 시간이 지난 이벤트 삭제"""
+    with get_app().app_context():
+        cutoff = datetime.utcnow() - timedelta(hours=EVENT_RETENTION_HOURS)
+        NoticeEvent.query.filter(NoticeEvent.created_at < cutoff).delete(synchronize_session=False)
+        db.session.commit()
+
+@api.route('/api/events/stream', methods=['GET'])
+@jwt_required(locations=['headers', 'query_string'])
+def stream_events():
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    # 구독 범위: 관리자는 전체, 일반 사용자는 할당된 워크스페이스
+    if current_user.is_admin:
+        workspace_ids = None
+    else:
+        workspace_ids = {uw.workspace_id for uw in current_user.user_workspaces}
+    
+    # 재연결 시 마지막으로 받은 이벤트 이후부터 재전송
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('lastEventId')
+    last_event_id = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
+    
+    subscriber = event_bus.subscribe(workspace_ids)
+    
+    backlog = []
+    if last_event_id is not None:
+        query = NoticeEvent.query.filter(NoticeEvent.id > last_event_id)
+        if workspace_ids is not None:
+            query = query.filter(NoticeEvent.workspace_id.in_(workspace_ids))
+        backlog = [serialize_notice_event(row) for row in query.order_by(NoticeEvent.id).limit(EVENT_REPLAY_LIMIT).all()]
+    db.session.remove()
+    
+    def generate():
+        sent_id = last_event_id or 0
+        try:
+            yield "retry: 3000\n\n"
+            for event in backlog:
+                sent_id = event['id']
+                yield format_sse(event)
+            
+            while True:
+                try:
+                    event = subscriber.get(timeout=EVENT_KEEPALIVE_INTERVAL)
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+                    continue
+                
+                if event is None:
+                    return  # 큐 초과로 연결 종료
+                if event['id'] <= sent_id:
+                    continue  # 재전송분과 중복
+                sent_id = event['id']
+                yield format_sse(event)
+        finally:
+            event_bus.unsubscribe(subscriber)
+    
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+# 우선순위 전송 큐
+# 스케줄러 작업은 공지를 유형(또는 priority 필드)에 맞는 레인에 넣기만 하고, 전송은 전송 워커가 담당합니다.
+# 일반 워커는 대기 중인 레인 사이를 가중치 비율로 번갈아 처리하고(smooth weighted round robin),
+# 예약 워커는 가장 높은 레인만 처리해 대량 공지가 밀려 있어도 입실 공지 등은 바로 전송됩니다.
+class DispatchQueue:
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.lanes = {}    # 레인 -> 가중치 (앞쪽이 높은 우선순위)
+        self.queues = {}
+        self.credits = {}
+        self.closed = True
+        self.generation = 0  # 워커 재시작 시 이전 워커가 종료되도록 구분
+        self.active = set()  # 대기 중이거나 전송 중인 항목 (스케줄러 동기화/정합성 점검에서 중복 등록 방지)
+    
+    def open(self, lanes):
+        with self.cond:
+            self.generation += 1
+            self.lanes = dict(lanes)
+            self.queues = {lane: deque() for lane in self.lanes}
+            self.credits = {lane: 0 for lane in self.lanes}
+            self.active = set()
+            self.closed = False
+    
+    def close(self):
+        """대기 항목을 버리고 워커 종료 (예약 작업 행은 pending으로 남아 다음 리더가 다시 등록)"""
+        with self.cond:
+            self.closed = True
+            self.queues = {lane: deque() for lane in self.lanes}
+            self.active = set()
+            self.cond.notify_all()
+    
+    @property
+    def top_lane(self):
+        return next(iter(self.lanes), None)
+    
+    def put(self, lane, item):
+        with self.cond:
+            if self.closed:
+                return False
+            if item not in self.active:
+                self.active.add(item)
+                self.queues[lane].append((time.monotonic(), item))
+                self.cond.notify_all()
+            return True
+    
+    def done(self, item):
+        with self.cond:
+            self.active.discard(item)
+    
+    def is_active(self, item):
+        with self.cond:
+            return item in self.active
+    
+    def get(self, generation, only_lane=None):
+        """다음 항목 (레인, 항목, 대기 시간 초). 큐가 닫혔거나 워커가 재시작되었으면 None"""
+        with self.cond:
+            while True:
+                if self.closed or generation != self.generation:
+                    return None
+                ready = [lane for lane in self.queues if self.queues[lane] and (only_lane is None or lane == only_lane)]
+                if ready:
+                    break
+                self.cond.wait()
+            
+            # 대기 중인 레인끼리만 가중치를 나눠 가짐 (빈 레인의 몫은 다른 레인이 사용)
+            total = sum(self.lanes[lane] for lane in ready)
+            for lane in ready:
+                self.credits[lane] += self.lanes[lane]
+            lane = max(ready, key=lambda name: self.credits[name])
+            self.credits[lane] -= total
+            
+            enqueued_at, item = self.queues[lane].popleft()
+            return lane, item, time.monotonic() - enqueued_at
+    
+    def stats(self):
+        with self.cond:
+            return {lane: len(queue) for lane, queue in self.queues.items()}
+
+dispatch_queue = DispatchQueue()
+dispatch_workers = []
+
+def notice_lane(notice_type, priority=None):
+    config = get_app().config
+    lanes = config['DISPATCH_LANES']
+    if priority in lanes:
+        return priority
+    lane = config['DISPATCH_TYPE_LANES'].get(notice_type, config['DISPATCH_DEFAULT_LANE'])
+    return lane if lane in lanes else config['DISPATCH_DEFAULT_LANE']
+
+def dispatch_notice(notice_id):
+    """예약 시간에 스케줄러가 호출. 공지를 우선순위 레인에 넣고 바로 반환"""
+    with get_app().app_context():
+        row = db.session.query(Notice.type, Notice.priority).filter(Notice.id == notice_id).first()
+        db.session.remove()
+    if row is None:
+        return
+    
+    lane = notice_lane(*row)
+    if not dispatch_queue.put(lane, notice_id):
+        # 전송 워커가 없는 경우 (스케줄러 중지 중) 바로 전송
+        send_notice(notice_id)
+
+def dispatch_worker(generation, only_lane=None):
+    while True:
+        entry = dispatch_queue.get(generation, only_lane)
+        if entry is None:
+            return
+        lane, notice_id, waited = entry
+        try:
+            if not expire_late_dispatch(notice_id, lane, waited):
+                send_notice(notice_id)
+        except Exception:
+            scheduler_logger.exception('공지 전송 작업 오류', extra=log_fields(noticeId=notice_id, lane=lane))
+        finally:
+            dispatch_queue.done(notice_id)
+        if waited >= 1:
+            scheduler_logger.info('전송 큐 대기', extra=log_fields(noticeId=notice_id, lane=lane, waitedMs=int(waited * 1000)))
+
+def start_dispatch_workers(app):
+    """전송 워커 시작: 일반 워커 DISPATCH_WORKERS개 + 최상위 레인 전용 DISPATCH_RESERVED_WORKERS개"""
+    stop_dispatch_workers()
+    dispatch_queue.open(app.config['DISPATCH_LANES'])
+    
+    lanes = [None] * app.config['DISPATCH_WORKERS'] + [dispatch_queue.top_lane] * app.config['DISPATCH_RESERVED_WORKERS']
+    for index, only_lane in enumerate(lanes):
+        thread = threading.Thread(
+            target=dispatch_worker,
+            args=(dispatch_queue.generation, only_lane),
+            name=f'dispatch-{only_lane or "shared"}-{index}',
+            daemon=True
+        )
+        thread.start()
+        dispatch_workers.append(thread)
+
+def stop_dispatch_workers():
+    dispatch_queue.close()
+    dispatch_workers.clear()
+
+# 스케줄러 작업 등록
+def as_utc(value):
+    """DB의 시간 값은 UTC 기준 naive datetime이므로 스케줄러에 넘길 때 UTC로 명시"""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+def notice_job_policy(notice_type):
+    """공지 유형별 스케줄러 작업 정책 (기본 설정 위에 SCHEDULER_JOB_POLICIES[유형]을 덮어씀)"""
+    config = get_app().config
+    policy = {
+        'misfire_grace_time': config['SCHEDULER_MISFIRE_GRACE_TIME'],
+        'coalesce': config['SCHEDULER_COALESCE'],
+        'max_instances': config['SCHEDULER_MAX_INSTANCES'],
+        'on_misfire': config['SCHEDULER_ON_MISFIRE']
+    }
+    policy.update(config['SCHEDULER_JOB_POLICIES'].get(notice_type) or {})
+    return policy
+
+def register_notice_job(notice_id, job_id, run_date, notice_type=None):
+    """공지 전송 작업을 스케줄러에 등록
+    
+    스케줄러가 실행 중이지 않은 워커(리더가 아닌 워커, CLI)에서는 등록하지 않고,
+    리더가 sync_scheduler_jobs로 DB의 ScheduledJob 행을 가져가 등록합니다.
+    """
+    if not scheduler.running:
+        return
+    policy = notice_job_policy(notice_type)
+    scheduler.add_job(
+        func=dispatch_notice,
+        trigger='date',
+        run_date=as_utc(run_date),
+        args=[notice_id],
+        id=job_id,
+        replace_existing=True,
+        misfire_grace_time=policy['misfire_grace_time'],
+        coalesce=policy['coalesce'],
+        max_instances=policy['max_instances']
+    )
+
+def run_background_task(func, args, task_id):
+    """일회성 백그라운드 작업 실행 (스케줄러가 없으면 별도 스레드에서 실행)"""
+    if scheduler.running:
+        scheduler.add_job(
+            func=func,
+            trigger='date',
+            run_date=datetime.now(),
+            args=args,
+            id=task_id,
+            replace_existing=True,
+            misfire_grace_time=None
+        )
+    else:
+        threading.Thread(target=func, args=args, name=task_id, daemon=True).start()
+
+def reschedule_notice_job(notice_id, job_id, run_date, notice_type=None):
+    """등록된 작업의 실행 시간만 변경 (없으면 새로 등록)"""
+    if not scheduler.running:
+        return
+    job = scheduler.get_job(job_id)
+    if job is None:
+        register_notice_job(notice_id, job_id, run_date, notice_type)
+    elif job.next_run_time != as_utc(run_date):
+        try:
+            scheduler.reschedule_job(job_id, trigger='date', run_date=as_utc(run_date))
+        except JobLookupError:
+            pass  # 그 사이 실행된 작업 (전송 시 작업 행 선점으로 중복 전송 방지)
+
+_last_synced_at = None
+
+def sync_scheduler_jobs(full=False):
+    """DB의 ScheduledJob 변경분을 스케줄러에 반영
+    
+    다른 워커에서 추가/재예약/전송/삭제된 작업을 리더가 가져옵니다. 평소에는 마지막 동기화 이후
+    updated_at이 바뀐 행과 공지 삭제 기록만 조회하고, 리더가 된 직후에는 대기 중인 작업 전체를 확인합니다.
+    """
+    global _last_synced_at
+    
+    started_at = datetime.utcnow()
+    with get_app().app_context():
+        query = db.session.query(
+            ScheduledJob.job_id, ScheduledJob.notice_id, ScheduledJob.scheduled_at, ScheduledJob.status, Notice.type
+        ).join(Notice, Notice.id == ScheduledJob.notice_id)
+        deleted_notice_ids = set()
+        if full or _last_synced_at is None:
+            query = query.filter(ScheduledJob.status == 'pending')
+        else:
+            since = _last_synced_at - SYNC_WATERMARK_OVERLAP
+            query = query.filter(ScheduledJob.updated_at > since)
+            deleted_notice_ids = {row[0] for row in db.session.query(SyncTombstone.entity_id).filter(
+                SyncTombstone.entity == 'notice',
+                SyncTombstone.deleted_at > since
+            ).all()}
+        rows = query.all()
+    
+    registered = {job.id: job for job in scheduler.get_jobs()}
+    for job_id, notice_id, scheduled_at, status, notice_type in rows:
+        if status != 'pending':
+            if job_id in registered:
+                remove_scheduler_jobs([job_id])
+        elif job_id not in registered and not dispatch_queue.is_active(notice_id):
+            register_notice_job(notice_id, job_id, scheduled_at, notice_type)
+        elif not full:
+            reschedule_notice_job(notice_id, job_id, scheduled_at, notice_type)
+    
+    if deleted_notice_ids:
+        remove_scheduler_jobs([
+            job.id for job in registered.values()
+            if job.func is dispatch_notice and job.args and job.args[0] in deleted_notice_ids
+        ])
+    
+    _last_synced_at = started_at
+
+# 스케줄러/DB 정합성 점검
+STALE_RUNNING_MINUTES = 10  # 이 시간 이상 running인 작업은 전송 중 프로세스가 중단된 것으로 보고 실패 처리
+
+last_reconcile_report = None
+
+def recover_stale_running_jobs():
+    """전송 도중 워커가 종료되어 running에 멈춘 작업을 실패로 정리 (웹훅 전송 여부를 알 수 없어 재전송하지 않음)"""
+    cutoff = datetime.utcnow() - timedelta(minutes=STALE_RUNNING_MINUTES)
+    stale_jobs = ScheduledJob.query.filter(
+        ScheduledJob.status == 'running',
+        ScheduledJob.updated_at < cutoff
+    ).all()
+    
+    for scheduled_job in stale_jobs:
+        fail_scheduled_job(scheduled_job, '전송 중 작업이 중단되었습니다. 전송 결과를 확인 후 재전송하세요.')
+    db.session.commit()
+    return len(stale_jobs)
+
+def fail_scheduled_job(scheduled_job, error):
+    """대기/전송 중인 작업과 공지를 실패로 기록 (커밋은 호출자)"""
+    notice = db.session.get(Notice, scheduled_job.notice_id)
+    # 선점(running) 시에는 카운터를 바꾸지 않으므로 선점 전 상태 기준으로 계산 (재전송은 failed에서 선점)
+    previous_job_status = (scheduled_job.claimed_from or 'pending') if scheduled_job.status == 'running' else scheduled_job.status
+    scheduled_job.status = 'failed'
+    scheduled_job.executed_at = datetime.utcnow()
+    scheduled_job.error_message = error
+    if notice:
+        previous_status = notice.status
+        notice.status = 'failed'
+        notice.error_message = error
+        adjust_workspace_counters(
+            notice.workspace_id,
+            **status_transition_deltas(previous_status, 'failed', previous_job_status, 'failed')
+        )
+        publish_event(notice.workspace_id, 'notice.status', notice_event_payload(notice, scheduled_job))
+
+def handle_missed_notice_job(job_id, scheduled_run_time):
+    """misfire로 건너뛴 전송 작업을 유형별 정책에 따라 늦게 전송하거나 실패로 기록 (조용히 유실되지 않도록)"""
+    with get_app().app_context():
+        row = db.session.query(ScheduledJob.id, ScheduledJob.notice_id, Notice.type).join(
+            Notice, Notice.id == ScheduledJob.notice_id
+        ).filter(
+            ScheduledJob.job_id == job_id,
+            ScheduledJob.status == 'pending'
+        ).first()
+        if not row:
+            return
+        
+        scheduled_job_id, notice_id, notice_type = row
+        on_misfire = notice_job_policy(notice_type)['on_misfire']
+        late_seconds = int((datetime.now(timezone.utc) - scheduled_run_time).total_seconds())
+        scheduler_logger.warning('예약 작업 misfire', extra=log_fields(
+            jobId=job_id, noticeId=notice_id, type=notice_type, lateSeconds=late_seconds, action=on_misfire
+        ))
+        
+        if on_misfire != 'fail':
+            db.session.remove()
+            dispatch_notice(notice_id)
+            return
+        
+        fail_missed_notice_job(scheduled_job_id, late_seconds)
+
+def fail_missed_notice_job(scheduled_job_id, late_seconds):
+    """늦은 작업을 실패로 기록. 다른 워커의 즉시 전송과 겹치지 않도록 pending일 때만 선점 (앱 컨텍스트 안에서 호출)"""
+    claimed = ScheduledJob.query.filter_by(id=scheduled_job_id, status='pending').update(
+        {'status': 'running', 'claimed_from': 'pending'},
+        synchronize_session=False
+    )
+    db.session.commit()
+    if not claimed:
+        return False
+    fail_scheduled_job(
+        db.session.get(ScheduledJob, scheduled_job_id),
+        f'예약 시간보다 {late_seconds}초 늦어 전송하지 않았습니다. (misfire)'
+    )
+    db.session.commit()
+    return True
+
+def expire_late_dispatch(notice_id, lane, waited):
+    """전송 큐에서 꺼낸 공지에 misfire 정책 적용 (실패로 기록했으면 True)
+    
+    스케줄러는 작업을 제때 실행했어도 전송 큐에서 오래 기다렸으면 예약 시간보다 늦게 전송될 수 있으므로,
+    전송 직전에 예약 시간 기준 지연이 유형별 misfire_grace_time을 넘었는지 다시 확인합니다.
+    """
+    with get_app().app_context():
+        row = db.session.query(ScheduledJob.id, ScheduledJob.scheduled_at, Notice.type).join(
+            Notice, Notice.id == ScheduledJob.notice_id
+        ).filter(
+            ScheduledJob.notice_id == notice_id,
+            ScheduledJob.status == 'pending'
+        ).first()
+        if not row:
+            db.session.remove()
+            return False
+        
+        scheduled_job_id, scheduled_at, notice_type = row
+        policy = notice_job_policy(notice_type)
+        late_seconds = int((datetime.utcnow() - scheduled_at).total_seconds())
+        if policy['on_misfire'] != 'fail' or policy['misfire_grace_time'] is None or late_seconds <= policy['misfire_grace_time']:
+            db.session.remove()
+            return False
+        
+        scheduler_logger.warning('전송 큐 대기 중 misfire', extra=log_fields(
+            noticeId=notice_id, type=notice_type, lane=lane, lateSeconds=late_seconds,
+            waitedMs=int(waited * 1000), action=policy['on_misfire']
+        ))
+        expired = fail_missed_notice_job(scheduled_job_id, late_seconds)
+        db.session.remove()
+        return expired
+
+def on_scheduler_job_missed(event):
+    if event.job_id.startswith('notice_'):
+        run_background_task(
+            handle_missed_notice_job,
+            [event.job_id, event.scheduled_run_time],
+            f'missed_{event.job_id}'
+        )
+
+def reconcile_scheduler_jobs():
+    """대기 중인 ScheduledJob과 스케줄러 작업을 집합으로 비교해 차이를 바로잡고 결과를 기록
+    
+    - DB에만 있는 작업: 다시 등록 (예약 시간이 지났으면 즉시 실행)
+    - 스케줄러에만 있는 작업 (삭제된 공지/워크스페이스, 이미 처리된 작업): 제거
+    - 양쪽에 있지만 실행 시간이 다른 작업: DB 기준으로 재예약
+    """
+    global last_reconcile_report
+    
+    if not scheduler.running:
+        return None
+    
+    started = time.perf_counter()
+    now = datetime.now(timezone.utc)
+    # DB보다 스케줄러를 먼저 읽음: 그 사이 sync_scheduler_jobs가 등록한 작업은 '누락'으로 보여 다시 등록될 뿐이지만,
+    # 반대 순서면 DB 조회 후 등록된 작업이 '스케줄러에만 있는 작업'으로 보여 제거됨
+    registered = {job.id: job for job in scheduler.get_jobs() if job.id.startswith('notice_')}
+    with get_app().app_context():
+        stale_running = recover_stale_running_jobs()
+        rows = db.session.query(ScheduledJob.job_id, ScheduledJob.notice_id, ScheduledJob.scheduled_at, Notice.type).join(
+            Notice, Notice.id == ScheduledJob.notice_id
+        ).filter(
+            ScheduledJob.status == 'pending'
+        ).all()
+        # 삭제 중인 워크스페이스의 작업은 등록하지 않음 (보통 없거나 적으므로 따로 조회해 제외)
+        deleted_workspace_ids = [row[0] for row in db.session.query(Workspace.id).filter(Workspace.status == 'deleted').all()]
+        purging = {row[0] for row in db.session.query(ScheduledJob.job_id).join(
+            Notice, Notice.id == ScheduledJob.notice_id
+        ).filter(
+            Notice.workspace_id.in_(deleted_workspace_ids)
+        ).all()} if deleted_workspace_ids else set()
+        db.session.remove()
+    
+    expected = {
+        job_id: (notice_id, as_utc(scheduled_at), notice_type)
+        for job_id, notice_id, scheduled_at, notice_type in rows if job_id not in purging
+    }
+    
+    # 실행 시간이 되어 전송 큐에서 대기 중인 작업은 스케줄러에서 빠져 있어도 누락이 아님
+    missing = {job_id for job_id in expected.keys() - registered.keys() if not dispatch_queue.is_active(expected[job_id][0])}
+    orphaned = registered.keys() - expected.keys()
+    drifted = [
+        job_id for job_id in expected.keys() & registered.keys()
+        if expected[job_id][1] > now and registered[job_id].next_run_time != expected[job_id][1]
+    ]
+    
+    for job_id in missing:
+        notice_id, run_date, notice_type = expected[job_id]
+        register_notice_job(notice_id, job_id, max(run_date, now), notice_type)
+    remove_scheduler_jobs(orphaned)
+    for job_id in drifted:
+        notice_id, run_date, notice_type = expected[job_id]
+        reschedule_notice_job(notice_id, job_id, run_date, notice_type)
+    
+    last_reconcile_report = {
+        'checkedAt': datetime.utcnow().isoformat(),
+        'pendingJobs': len(expected),
+        'schedulerJobs': len(registered),
+        'missing': len(missing),
+        'orphaned': len(orphaned),
+        'rescheduled': len(drifted),
+        'staleRunning': stale_running,
+        'durationMs': int((time.perf_counter() - started) * 1000)
+    }
+    
+    if missing or orphaned or drifted or stale_running:
+        scheduler_logger.warning('스케줄러/DB 불일치 정리', extra=log_fields(**last_reconcile_report))
+    else:
+        scheduler_logger.debug('스케줄러/DB 정합성 점검', extra=log_fields(**last_reconcile_report))
+    return last_reconcile_report
+
+@api.route('/api/admin/scheduler/reconcile', methods=['POST'])
+@jwt_required()
+def run_scheduler_reconcile():
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    if not current_user.is_admin:
+        return jsonify({'message': '관리자 권한이 필요합니다.'}), 403
+    
+    if not scheduler.running:
+        return jsonify({'message': '이 워커에서는 스케줄러가 실행 중이지 않습니다. 잠시 후 다시 시도하세요.'}), 409
+    
+    return jsonify(reconcile_scheduler_jobs())
+
+# 스케줄러 작업 조회 (관리자만)
+@api.route('/api/admin/scheduler/jobs', methods=['GET'])
+@jwt_required()
+def get_scheduled_jobs():
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    if not current_user.is_admin:
+        return jsonify({'message': '관리자 권한이 필요합니다.'}), 403
+    
+    query = ScheduledJob.query
+    if request.args.get('status'):
+        query = query.filter_by(status=request.args['status'])
+    jobs = query.order_by(ScheduledJob.id).all()
+    
+    # 스케줄러에 등록된 실제 실행 예정 시간 (스케줄러를 실행하지 않는 워커에서는 null)
+    next_run_times = {job.id: job.next_run_time for job in scheduler.get_jobs()} if scheduler.running else {}
+    
+    return jsonify([{
+        'id': job.id,
+        'jobId': job.job_id,
+        'noticeId': job.notice_id,
+        'status': job.status,
+        'scheduledAt': job.scheduled_at.isoformat(),
+        'executedAt': job.executed_at.isoformat() if job.executed_at else None,
+        'delaySeconds': job.delay_seconds,
+        'error': job.error_message,
+        'registered': job.job_id in next_run_times,
+        'nextRunTime': next_run_times[job.job_id].isoformat() if next_run_times.get(job.job_id) else None
+    } for job in jobs])
+
+@api.route('/api/admin/scheduler/status', methods=['GET'])
+@jwt_required()
+def get_scheduler_status():
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    if not current_user.is_admin:
+        return jsonify({'message': '관리자 권한이 필요합니다.'}), 403
+    
+    return jsonify({
+        'running': scheduler.running,
+        'owner': scheduler_owner_id,
+        'lastReconcile': last_reconcile_report,
+        'dispatch': {
+            'queued': dispatch_queue.stats(),
+            'workers': len(dispatch_workers)
+        }
+    })
+
+@api.route('/api/admin/cache', methods=['GET'])
+@jwt_required()
+def get_cache_stats():
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    if not current_user.is_admin:
+        return jsonify({'message': '관리자 권한이 필요합니다.'}), 403
+    
+    return jsonify(cache.stats())
+
+@api.route('/api/admin/cache', methods=['DELETE'])
+@jwt_required()
+def clear_cache():
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    if not current_user.is_admin:
+        return jsonify({'message': '관리자 권한이 필요합니다.'}), 403
+    
+    cache.clear()
+    return '', 204
+
+# 대시보드 카운터
+NOTICE_STATUS_COUNTER_FIELDS = {
+    'scheduled': 'scheduled_count',
+    'sent': 'sent_count',
+    'failed': 'failed_count'
+}
+
+def adjust_workspace_counters(workspace_id, **deltas):
+    """워크스페이스 카운터 증감 (커밋은 호출한 쪽 트랜잭션에서 수행)"""
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    
+    # 한 문장의 upsert(INSERT ... ON CONFLICT DO UPDATE SET col = col + delta)로 처리해
+    # 첫 카운터 행을 동시에 만드는 트랜잭션끼리 충돌하거나 증감값이 유실되지 않도록 함
+    now = datetime.utcnow()
+    values = dict(workspace_id=workspace_id, scheduled_count=0, sent_count=0, failed_count=0, pending_job_count=0, updated_at=now)
+    values.update(deltas)
+    db.session.execute(sqlite_insert(WorkspaceCounter).values(**values).on_conflict_do_update(
+        index_elements=[WorkspaceCounter.workspace_id],
+        set_=dict({field: getattr(WorkspaceCounter, field) + delta for field, delta in deltas.items()}, updated_at=now)
+    ))
+
+def status_transition_deltas(old_status, new_status, old_job_status=None, new_job_status=None):
+    """공지/작업 상태 변경에 따른 카운터 증감값 계산"""
+    deltas = {}
+    if old_status != new_status:
+        if old_status in NOTICE_STATUS_COUNTER_FIELDS:
+            field = NOTICE_STATUS_COUNTER_FIELDS[old_status]
+            deltas[field] = deltas.get(field, 0) - 1
+        if new_status in NOTICE_STATUS_COUNTER_FIELDS:
+            field = NOTICE_STATUS_COUNTER_FIELDS[new_status]
+            deltas[field] = deltas.get(field, 0) + 1
+    if old_job_status != new_job_status:
+        if old_job_status == 'pending':
+            deltas['pending_job_count'] = deltas.get('pending_job_count', 0) - 1
+        if new_job_status == 'pending':
+            deltas['pending_job_count'] = deltas.get('pending_job_count', 0) + 1
+    return deltas
+
+def rebuild_workspace_counters():
+    """기본 테이블에서 카운터를 다시 집계 (복구용)"""
+    counters = {}
+    
+    def counter_for(workspace_id):
+        return counters.setdefault(workspace_id, {
+            'workspace_id': workspace_id,
+            'scheduled_count': 0,
+            'sent_count': 0,
+            'failed_count': 0,
+            'pending_job_count': 0,
+            'updated_at': datetime.utcnow()
+        })
+    
+    notice_counts = db.session.query(
+        Notice.workspace_id, Notice.status, db.func.count(Notice.id)
+    ).join(Workspace, Notice.workspace_id == Workspace.id).filter(
+        Workspace.status != 'deleted'
+    ).group_by(Notice.workspace_id, Notice.status).all()
+    
+    archive_counts = db.session.query(
+        NoticeArchive.workspace_id, NoticeArchive.status, db.func.count(NoticeArchive.id)
+    ).join(Workspace, NoticeArchive.workspace_id == Workspace.id).filter(
+        Workspace.status != 'deleted'
+    ).group_by(NoticeArchive.workspace_id, NoticeArchive.status).all()
+    
+    # 보관된 공지도 전송/실패 누적 수에 포함
+    for workspace_id, status, count in notice_counts + archive_counts:
+        if status in NOTICE_STATUS_COUNTER_FIELDS:
+            counter_for(workspace_id)[NOTICE_STATUS_COUNTER_FIELDS[status]] += count
+    
+    job_counts = db.session.query(
+        Notice.workspace_id, db.func.count(ScheduledJob.id)
+    ).join(Notice, ScheduledJob.notice_id == Notice.id).join(
+        Workspace, Notice.workspace_id == Workspace.id
+    ).filter(
+        ScheduledJob.status == 'pending',
+        Workspace.status != 'deleted'
+    ).group_by(Notice.workspace_id).all()
+    
+    for workspace_id, count in job_counts:
+        counter_for(workspace_id)['pending_job_count'] = count
+    
+    WorkspaceCounter.query.delete()
+    if counters:
+        db.session.execute(db.insert(WorkspaceCounter), list(counters.values()))
+    db.session.commit()
+    
+    return len(counters)
+
+@api.route('/api/dashboard/summary', methods=['GET'])
+@jwt_required()
+def get_dashboard_summary():
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    if current_user.is_admin:
+        workspaces = db.session.query(Workspace.id, Workspace.name).filter(Workspace.status != 'deleted').all()
+    else:
+        workspaces = db.session.query(Workspace.id, Workspace.name).join(
+            UserWorkspace, UserWorkspace.workspace_id == Workspace.id
+        ).filter(UserWorkspace.user_id == current_user_id).all()
+    
+    workspace_ids = [workspace_id for workspace_id, _ in workspaces]
+    counters = {
+        counter.workspace_id: counter
+        for counter in WorkspaceCounter.query.filter(WorkspaceCounter.workspace_id.in_(workspace_ids)).all()
+    } if workspace_ids else {}
+    
+    totals = {'scheduled': 0, 'sent': 0, 'failed': 0, 'upcomingJobs': 0}
+    result = []
+    for workspace_id, name in workspaces:
+        counter = counters.get(workspace_id)
+        item = {
+            'workspaceId': workspace_id,
+            'workspaceName': name,
+            'scheduled': counter.scheduled_count if counter else 0,
+            'sent': counter.sent_count if counter else 0,
+            'failed': counter.failed_count if counter else 0,
+            'upcomingJobs': counter.pending_job_count if counter else 0,
+            'updatedAt': counter.updated_at.isoformat() if counter and counter.updated_at else None
+        }
+        for key in totals:
+            totals[key] += item[key]
+        result.append(item)
+    
+    return jsonify({'totals': totals, 'workspaces': result})
+
+@api.route('/api/admin/dashboard/recount', methods=['POST'])
+@jwt_required()
+def recount_dashboard_counters():
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    if not current_user.is_admin:
+        return jsonify({'message': '관리자 권한이 필요합니다.'}), 403
+    
+    try:
+        count = rebuild_workspace_counters()
+        return jsonify({'message': '대시보드 카운터가 재집계되었습니다.', 'workspaces': count})
+    except Exception as e:
+        db.session.rollback()
+        logger.exception('대시보드 카운터 재집계 오류')
+        return jsonify({'message': '대시보드 카운터 재집계 중 오류가 발생했습니다.'}), 500
+
+@api.cli.command('recount-counters')
+def recount_counters_command():
+    """대시보드 카운터 재집계"""
+    count = rebuild_workspace_counters()
+    print(f"워크스페이스 {count}개의 카운터를 재집계했습니다.")
+
+# 오래된 공지 보관 (hot/cold 분리)
+ARCHIVE_BATCH_SIZE = 500
+
+def serialize_datetime(value):
+    return value.isoformat() if value else None
+
+def build_notice_archive(notice, jobs, deliveries):
+    """공지와 예약 작업을 압축된 보관 레코드로 변환"""
+    payload = {
+        'id': notice.id,
+        'type': notice.type,
+        'categoryId': notice.category_id,
+        'templateId': notice.template_id,
+        'title': notice.title,
+        'message': notice.message,
+        'workspaceId': notice.workspace_id,
+        'createdBy': notice.created_by,
+        'scheduledAt': serialize_datetime(notice.scheduled_at),
+        'status': notice.status,
+        'noImage': notice.no_image,
+        'formData': notice.form_data or {},
+        'variableData': notice.variable_data or {},
+        'selectedWebhookUrl': notice.selected_webhook_url,
+        'selectedWebhookUrls': notice.target_webhook_urls or [],
+        'createdAt': serialize_datetime(notice.created_at),
+        'sentAt': serialize_datetime(notice.sent_at),
+        'error': notice.error_message,
+        'scheduledJobs': [{
+            'id': job.id,
+            'jobId': job.job_id,
+            'status': job.status,
+            'scheduledAt': serialize_datetime(job.scheduled_at),
+            'executedAt': serialize_datetime(job.executed_at),
+            'error': job.error_message
+        } for job in jobs],
+        'deliveries': [{
+            'webhookUrl': delivery.webhook_url,
+            'status': delivery.status,
+            'attemptCount': delivery.attempt_count,
+            'latencyMs': delivery.latency_ms,
+            'error': delivery.error_message,
+            'sentAt': serialize_datetime(delivery.sent_at)
+        } for delivery in deliveries]
+    }
+    
+    return {
+        'id': notice.id,
+        'workspace_id': notice.workspace_id,
+        'type': notice.type,
+        'title': notice.title,
+        'status': notice.status,
+        'scheduled_at': notice.scheduled_at,
+        'sent_at': notice.sent_at,
+        'payload': zlib.compress(json.dumps(payload, ensure_ascii=False).encode('utf-8')),
+        'archived_at': datetime.utcnow()
+    }
+
+def load_notice_archive(archive):
+    return json.loads(zlib.decompress(archive.payload).decode('utf-8'))
+
+def archive_old_notices(older_than_days=None):
+    """전송 완료/실패 후 보관 기간이 지난 공지와 예약 작업을 보관 테이블로 이동"""
+    with get_app().app_context():
+        if older_than_days is None:
+            older_than_days = current_app.config['ARCHIVE_AFTER_DAYS']
+        cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+        
+        archived = 0
+        while True:
+            # 대기 중인 작업이 남은 공지는 보관하지 않음
+            pending_job = db.session.query(ScheduledJob.id).filter(
+                ScheduledJob.notice_id == Notice.id,
+                ScheduledJob.status == 'pending'
+            ).exists()
+            notices = Notice.query.filter(
+                Notice.status.in_(['sent', 'failed']),
+                Notice.scheduled_at < cutoff,
+                ~pending_job
+            ).limit(ARCHIVE_BATCH_SIZE).all()
+            
+            if not notices:
+                break
+            
+            notice_ids = [notice.id for notice in notices]
+            jobs_by_notice = {}
+            for job in ScheduledJob.query.filter(ScheduledJob.notice_id.in_(notice_ids)).all():
+                jobs_by_notice.setdefault(job.notice_id, []).append(job)
+            
+            deliveries_by_notice = {}
+            for delivery in NoticeDelivery.query.filter(NoticeDelivery.notice_id.in_(notice_ids)).all():
+                deliveries_by_notice.setdefault(delivery.notice_id, []).append(delivery)
+            
+            rows = [
+                build_notice_archive(notice, jobs_by_notice.get(notice.id, []), deliveries_by_notice.get(notice.id, []))
+                for notice in notices
+            ]
+            
+            try:
+                archived_ids = [row['id'] for row in rows]
+                db.session.execute(db.insert(NoticeArchive), rows)
+                ScheduledJob.query.filter(ScheduledJob.notice_id.in_(archived_ids)).delete(synchronize_session=False)
+                NoticeDelivery.query.filter(NoticeDelivery.notice_id.in_(archived_ids)).delete(synchronize_session=False)
+                Notice.query.filter(Notice.id.in_(archived_ids)).delete(synchronize_session=False)
+                db.session.execute(db.insert(SyncTombstone), [{
+                    'entity': 'notice',
+                    'entity_id': row['id'],
+                    'workspace_id': row['workspace_id'],
+                    'deleted_at': datetime.utcnow()
+                } for row in rows])
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                logger.exception('공지 보관 오류')
+                break
+            
+            archived += len(rows)
+        
+        return archived
+
+def schedule_archive_job():
+    scheduler.add_job(
+        func=archive_old_notices,
+        trigger='interval',
+        hours=24,
+        id='archive_old_notices',
+        replace_existing=True
+    )
+
+@api.route('/api/archive/notices', methods=['GET'])
+@jwt_required()
+def get_archived_notices():
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    workspace_id = request.args.get('workspaceId', type=int)
+    if not workspace_id:
+        return jsonify({'message': 'workspaceId가 필요합니다.'}), 400
+    
+    # 사용자가 해당 워크스페이스에 접근 권한이 있는지 확인 (관리자는 전체 접근)
+    if not current_user.is_admin:
+        user_workspace = UserWorkspace.query.filter_by(
+            user_id=current_user_id,
+            workspace_id=workspace_id
+        ).first()
+        
+        if not user_workspace:
+            return jsonify({'message': '워크스페이스에 접근 권한이 없습니다.'}), 403
+    
+    query = NoticeArchive.query.filter_by(workspace_id=workspace_id)
+    
+    try:
+        if request.args.get('start'):
+            query = query.filter(NoticeArchive.scheduled_at >= datetime.strptime(request.args['start'], '%Y-%m-%d'))
+        if request.args.get('end'):
+            end_date = datetime.strptime(request.args['end'], '%Y-%m-%d')
+            query = query.filter(NoticeArchive.scheduled_at < end_date + timedelta(days=1))
+    except ValueError:
+        return jsonify({'message': 'start, end는 YYYY-MM-DD 형식이어야 합니다.'}), 400
+    
+    if request.args.get('status'):
+        query = query.filter_by(status=request.args['status'])
+    if request.args.get('type'):
+        query = query.filter_by(type=request.args['type'])
+    
+    limit = min(request.args.get('limit', 100, type=int), 1000)
+    offset = request.args.get('offset', 0, type=int)
+    archives = query.order_by(NoticeArchive.scheduled_at.desc()).offset(offset).limit(limit).all()
+    
+    return jsonify([load_notice_archive(archive) for archive in archives])
+
+@api.route('/api/archive/notices/<int:notice_id>', methods=['GET'])
+@jwt_required()
+def get_archived_notice(notice_id):
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    archive = db.session.get(NoticeArchive, notice_id)
+    if not archive:
+        return jsonify({'message': '보관된 공지를 찾을 수 없습니다.'}), 404
+    
+    if not current_user.is_admin:
+        user_workspace = UserWorkspace.query.filter_by(
+            user_id=current_user_id,
+            workspace_id=archive.workspace_id
+        ).first()
+        
+        if not user_workspace:
+            return jsonify({'message': '워크스페이스에 접근 권한이 없습니다.'}), 403
+    
+    return jsonify(load_notice_archive(archive))
+
+@api.route('/api/admin/archive/run', methods=['POST'])
+@jwt_required()
+def run_notice_archive():
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    if not current_user.is_admin:
+        return jsonify({'message': '관리자 권한이 필요합니다.'}), 403
+    
+    data = request.get_json(silent=True) or {}
+    archived = archive_old_notices(data.get('olderThanDays'))
+    
+    return jsonify({'message': f'공지 {archived}건을 보관했습니다.', 'archived': archived})
+
+@api.cli.command('archive-notices')
+@click.option('--days', type=int, default=None, help='보관 기준 일수 (기본값: ARCHIVE_AFTER_DAYS)')
+def archive_notices_command(days):
+    """오래된 전송 완료 공지 보관"""
+    archived = archive_old_notices(days)
+    print(f"공지 {archived}건을 보관했습니다.")
+
+# DB 유지보수 (온라인 백업, ANALYZE, 증분 VACUUM)
+# 백업은 SQLite 백업 API로 몇 페이지씩 나눠 복사하고 단계 사이에 잠금을 놓아 주므로 서비스 중에도 쓰기가 막히지 않습니다.
+BACKUP_FILE_PREFIX = 'fastlm_backup_'
+AUTO_VACUUM_MODES = {0: 'none', 1: 'full', 2: 'incremental'}
+
+backup_lock = threading.Lock()
+maintenance_lock = threading.Lock()
+last_backup_report = None
+last_maintenance_report = None
+
+def get_database_path():
+    """SQLite 파일 DB 경로 (메모리 DB나 다른 DB면 None)"""
+    url = db.engine.url
+    if url.get_backend_name() != 'sqlite' or not url.database or url.database == ':memory:':
+        return None
+    return url.database
+
+def get_backup_dir():
+    return os.path.join(current_app.instance_path, current_app.config['BACKUP_DIR'])
+
+def connect_maintenance_db(path):
+    # 앱 연결 풀과 별도의 autocommit 연결 (문장마다 트랜잭션이 끝나 잠금을 오래 잡지 않음)
+    return sqlite3.connect(path, timeout=15, isolation_level=None)
+
+def list_backups(backup_dir):
+    """백업 파일 경로 목록 (최신순, 파일 이름의 시각 기준)"""
+    if not os.path.isdir(backup_dir):
+        return []
+    names = sorted(
+        (name for name in os.listdir(backup_dir) if name.startswith(BACKUP_FILE_PREFIX) and name.endswith('.db')),
+        reverse=True
+    )
+    return [os.path.join(backup_dir, name) for name in names]
+
+def rotate_backups(backup_dir, keep):
+    """최근 keep개만 남기고 삭제 (0이면 삭제하지 않음)"""
+    if keep <= 0:
+        return []
+    removed = list_backups(backup_dir)[keep:]
+    for path in removed:
+        os.remove(path)
+    return [os.path.basename(path) for path in removed]
+
+def backup_database():
+    """DB를 온라인 백업하고 오래된 백업을 정리. 다른 백업이 진행 중이면 None"""
+    global last_backup_report
+    
+    if not backup_lock.acquire(blocking=False):
+        return None
+    
+    try:
+        with get_app().app_context():
+            path = get_database_path()
+            if not path:
+                return None
+            
+            config = current_app.config
+            backup_dir = get_backup_dir()
+            os.makedirs(backup_dir, exist_ok=True)
+            target = os.path.join(backup_dir, f'{BACKUP_FILE_PREFIX}{datetime.now().strftime("%Y%m%d_%H%M%S")}.db')
+            partial = target + '.partial'
+            started = time.perf_counter()
+            steps = 0
+            
+            def on_progress(status, remaining, total):
+                nonlocal steps
+                steps += 1
+                time.sleep(config['BACKUP_STEP_SLEEP'])
+            
+            try:
+                with closing(connect_maintenance_db(path)) as source, closing(sqlite3.connect(partial)) as dest:
+                    # 읽기 트랜잭션으로 스냅샷을 고정해 둠. 그렇지 않으면 복사 중 다른 연결이 쓸 때마다
+                    # 백업이 처음부터 다시 시작되어 쓰기가 잦으면 끝나지 않음 (WAL에서는 읽기 트랜잭션이 쓰기를 막지 않음)
+                    source.execute('BEGIN')
+                    source.execute('SELECT COUNT(*) FROM sqlite_master').fetchone()
+                    # 단계마다 BACKUP_PAGES_PER_STEP 페이지만 복사하고 단계 사이에 쉬어 다른 스레드가 진행할 수 있게 함
+                    source.backup(
+                        dest,
+                        pages=config['BACKUP_PAGES_PER_STEP'],
+                        progress=on_progress,
+                        sleep=config['BACKUP_STEP_SLEEP']
+                    )
+                    source.execute('COMMIT')
+                    check = dest.execute('PRAGMA quick_check').fetchone()[0]
+                if check != 'ok':
+                    raise sqlite3.DatabaseError(f'백업 파일 검사 실패: {check}')
+                os.replace(partial, target)
+                removed = rotate_backups(backup_dir, config['BACKUP_KEEP'])
+                last_backup_report = {
+                    'finishedAt': datetime.utcnow().isoformat(),
+                    'file': os.path.basename(target),
+                    'bytes': os.path.getsize(target),
+                    'steps': steps,
+                    'removed': removed,
+                    'durationMs': int((time.perf_counter() - started) * 1000),
+                    'error': None
+                }
+                logger.info('DB 백업 완료', extra=log_fields(**last_backup_report))
+            except Exception as e:
+                if os.path.exists(partial):
+                    os.remove(partial)
+                last_backup_report = {
+                    'finishedAt': datetime.utcnow().isoformat(),
+                    'file': None,
+                    'durationMs': int((time.perf_counter() - started) * 1000),
+                    'error': str(e)
+                }
+                logger.exception('DB 백업 오류')
+            
+            return last_backup_report
+    finally:
+        backup_lock.release()
+
+def maintain_database():
+    """통계 갱신(ANALYZE), 빈 페이지 반환(증분 VACUUM), WAL 체크포인트를 짧은 트랜잭션으로 나눠 실행
+    
+    다른 유지보수가 진행 중이면 None
+    """
+    global last_maintenance_report
+    
+    if not maintenance_lock.acquire(blocking=False):
+        return None
+    
+    try:
+        with get_app().app_context():
+            path = get_database_path()
+            if not path:
+                return None
+            
+            config = current_app.config
+            started = time.perf_counter()
+            try:
+                with closing(connect_maintenance_db(path)) as conn:
+                    # 테이블당 표본 행 수를 제한해 ANALYZE가 쓰기 잠금을 오래 잡지 않게 함
+                    conn.execute(f'PRAGMA analysis_limit={int(config["ANALYZE_LIMIT"])}')
+                    conn.execute('ANALYZE')
+                    
+                    auto_vacuum = AUTO_VACUUM_MODES.get(conn.execute('PRAGMA auto_vacuum').fetchone()[0])
+                    free_pages = conn.execute('PRAGMA freelist_count').fetchone()[0]
+                    freed = 0
+                    if auto_vacuum == 'incremental':
+                        while free_pages > 0:
+                            # execute()는 이 PRAGMA를 한 단계만 실행해 한 페이지만 반환하므로 executescript로 끝까지 실행
+                            conn.executescript(f'PRAGMA incremental_vacuum({int(config["VACUUM_PAGES_PER_STEP"])})')
+                            remaining = conn.execute('PRAGMA freelist_count').fetchone()[0]
+                            if remaining >= free_pages:
+                                break
+                            freed += free_pages - remaining
+                            free_pages = remaining
+                            time.sleep(config['BACKUP_STEP_SLEEP'])
+                    elif free_pages:
+                        logger.warning(
+                            'auto_vacuum이 꺼져 있어 빈 페이지를 반환하지 못했습니다 (migrate_db.py로 전환)',
+                            extra=log_fields(autoVacuum=auto_vacuum, freePages=free_pages)
+                        )
+                    
+                    # 읽는 중인 연결을 기다리지 않는 범위에서만 WAL 내용을 DB 파일로 옮김
+                    busy, wal_frames, checkpointed = conn.execute('PRAGMA wal_checkpoint(PASSIVE)').fetchone()
+                
+                last_maintenance_report = {
+                    'finishedAt': datetime.utcnow().isoformat(),
+                    'autoVacuum': auto_vacuum,
+                    'freedPages': freed,
+                    'freePages': free_pages,
+                    'walFrames': wal_frames,
+                    'checkpointedFrames': checkpointed,
+                    'durationMs': int((time.perf_counter() - started) * 1000),
+                    'error': None
+                }
+                logger.info('DB 유지보수 완료', extra=log_fields(**last_maintenance_report))
+            except Exception as e:
+                last_maintenance_report = {
+                    'finishedAt': datetime.utcnow().isoformat(),
+                    'durationMs': int((time.perf_counter() - started) * 1000),
+                    'error': str(e)
+                }
+                logger.exception('DB 유지보수 오류')
+            
+            return last_maintenance_report
+    finally:
+        maintenance_lock.release()
+
+def get_database_report():
+    """DB/WAL 파일 크기, 빈 페이지, 백업 목록과 마지막 백업/유지보수 결과 (앱 컨텍스트 안에서 호출)"""
+    path = get_database_path()
+    if not path:
+        return None
+    
+    with closing(connect_maintenance_db(path)) as conn:
+        page_size = conn.execute('PRAGMA page_size').fetchone()[0]
+        page_count = conn.execute('PRAGMA page_count').fetchone()[0]
+        free_pages = conn.execute('PRAGMA freelist_count').fetchone()[0]
+        auto_vacuum = AUTO_VACUUM_MODES.get(conn.execute('PRAGMA auto_vacuum').fetchone()[0])
+    
+    def file_size(file_path):
+        return os.path.getsize(file_path) if os.path.exists(file_path) else 0
+    
+    return {
+        'path': path,
+        'dbBytes': file_size(path),
+        'walBytes': file_size(path + '-wal'),
+        'pageSize': page_size,
+        'pageCount': page_count,
+        'freePages': free_pages,
+        'freeBytes': free_pages * page_size,
+        'autoVacuum': auto_vacuum,
+        'backups': [{
+            'file': os.path.basename(backup_path),
+            'bytes': file_size(backup_path),
+            'createdAt': datetime.utcfromtimestamp(os.path.getmtime(backup_path)).isoformat()
+        } for backup_path in list_backups(get_backup_dir())],
+        'lastBackup': last_backup_report,
+        'lastMaintenance': last_maintenance_report
+    }
+
+def schedule_maintenance_jobs(app):
+    """백업/유지보수 주기 작업 등록 (주기가 0이면 등록하지 않음)"""
+    if not app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+        return
+    if app.config['BACKUP_INTERVAL_HOURS'] > 0:
+        scheduler.add_job(
+            func=backup_database,
+            trigger='interval',
+            hours=app.config['BACKUP_INTERVAL_HOURS'],
+            id='backup_database',
+            replace_existing=True,
+            coalesce=True
+        )
+    if app.config['MAINTENANCE_INTERVAL_HOURS'] > 0:
+        scheduler.add_job(
+            func=maintain_database,
+            trigger='interval',
+            hours=app.config['MAINTENANCE_INTERVAL_HOURS'],
+            id='maintain_database',
+            replace_existing=True,
+            coalesce=True
+        )
+
+@api.route('/api/admin/db', methods=['GET'])
+@jwt_required()
+def get_database_status():
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    if not current_user.is_admin:
+        return jsonify({'message': '관리자 권한이 필요합니다.'}), 403
+    
+    report = get_database_report()
+    if report is None:
+        return jsonify({'message': 'SQLite 파일 DB에서만 지원합니다.'}), 400
+    
+    return jsonify(report)
+
+@api.route('/api/admin/db/backup', methods=['POST'])
+@jwt_required()
+def run_database_backup():
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    if not current_user.is_admin:
+        return jsonify({'message': '관리자 권한이 필요합니다.'}), 403
+    
+    if not get_database_path():
+        return jsonify({'message': 'SQLite 파일 DB에서만 지원합니다.'}), 400
+    
+    report = backup_database()
+    if report is None:
+        return jsonify({'message': '이미 백업이 진행 중입니다.'}), 409
+    if report['error']:
+        return jsonify({'message': f'백업에 실패했습니다: {report["error"]}', **report}), 500
+    
+    return jsonify({'message': f'{report["file"]} 백업을 만들었습니다.', **report})
+
+@api.route('/api/admin/db/maintenance', methods=['POST'])
+@jwt_required()
+def run_database_maintenance():
+    current_user_id = int(get_jwt_identity())
+    current_user = db.session.get(User, current_user_id)
+    
+    if not current_user.is_admin:
+        return jsonify({'message': '관리자 권한이 필요합니다.'}), 403
+    
+    if not get_database_path():
+        return jsonify({'message': 'SQLite 파일 DB에서만 지원합니다.'}), 400
+    
+    report = maintain_database()
+    if report is None:
+        return jsonify({'message': '이미 유지보수가 진행 중입니다.'}), 409
+    if report['error']:
+        return jsonify({'message': f'유지보수에 실패했습니다: {report["error"]}', **report}), 500
+    
+    return jsonify(report)
+
+@api.cli.command('backup-db')
+def backup_db_command():
+    """DB 온라인 백업 (서비스 중에도 실행 가능)"""
+    report = backup_database()
+    if report is None:
+        print("SQLite 파일 DB가 아니거나 이미 백업이 진행 중입니다.")
+    elif report['error']:
+        print(f"❌ 백업 실패: {report['error']}")
+    else:
+        print(f"✅ {report['file']} ({report['bytes'] / 1024 / 1024:.1f}MB, {report['durationMs'] / 1000:.1f}초)")
+        for name in report['removed']:
+            print(f"  오래된 백업 삭제: {name}")
+
+@api.cli.command('maintain-db')
+def maintain_db_command():
+    """ANALYZE, 증분 VACUUM, WAL 체크포인트 실행 후 크기 보고"""
+    report = maintain_database()
+    if report is None:
+        print("SQLite 파일 DB가 아니거나 이미 유지보수가 진행 중입니다.")
+        return
+    if report['error']:
+        print(f"❌ 유지보수 실패: {report['error']}")
+        return
     
-    notice = Notice(
-        type=data['type'],
-        category_id=data.get('categoryId'),
-        template_id=data.get('templateId'),
-        title=data['title'],
-        message=data['message'],
-        workspace_id=data['workspaceId'],
-        created_by=current_user_id,
-        scheduled_at=datetime.fromisoformat(data['scheduledAt'].replace('Z', '+00:00')),
-        no_image=data.get('noImage', False),
-        form_data=json.dumps(data.get('formData', {})),
-        variable_data=json.dumps(data.get('variableData', {})),
-        selected_webhook_url=data.get('selectedWebhookUrl')  # 선택된 웹훅 URL 저장
-    )
+    with get_app().app_context():
+        status = get_database_report()
+    print(f"✅ 유지보수 완료 ({report['durationMs'] / 1000:.1f}초, 반환 페이지 {report['freedPages']}개)")
+    print(f"  DB {status['dbBytes'] / 1024 / 1024:.1f}MB, WAL {status['walBytes'] / 1024 / 1024:.1f}MB, 빈 공간 {status['freeBytes'] / 1024 / 1024:.1f}MB (auto_vacuum: {status['autoVacuum']})")
+    print(f"  백업 {len(status['backups'])}개")
+
+# 전문 검색 (SQLite FTS5)
+# 공지/템플릿 본문을 외부 콘텐츠 FTS5 테이블로 색인하고 트리거로 동기화합니다.
+# 한국어는 띄어쓰기 없이 붙여 쓴 단어(출석체크)가 많으므로 trigram 토크나이저(SQLite 3.34+)로 단어 중간도 찾습니다 (체크 → 출석체크).
+# trigram은 3글자 이상 검색어만 색인으로 찾으므로 더 짧은 검색어는 원본 테이블에서 LIKE로 확인합니다.
+# trigram을 지원하지 않는 SQLite에서는 unicode61(공백/구두점 단위) + 접두어 검색으로 대신합니다 (출석 → 출석을, 단 체크 → 출석체크는 찾지 못함).
+def detect_search_tokenizer():
+    try:
+        with closing(sqlite3.connect(':memory:')) as conn:
+            conn.execute("CREATE VIRTUAL TABLE probe USING fts5(body, tokenize='trigram')")
+        return 'trigram'
+    except sqlite3.OperationalError:
+        return 'unicode61 remove_diacritics 2'
+
+SEARCH_TOKENIZER = detect_search_tokenizer()
+SEARCH_TRIGRAM = SEARCH_TOKENIZER == 'trigram'
+# unicode61에서는 짧은 접두어 검색을 빠르게 하기 위한 접두어 색인을 함께 만듦
+SEARCH_TABLE_OPTIONS = f"tokenize='{SEARCH_TOKENIZER}'" if SEARCH_TRIGRAM else f"tokenize='{SEARCH_TOKENIZER}', prefix='1 2 3'"
+SEARCH_MIN_TRIGRAM_TERM = 3
+SEARCH_MAX_TERMS = 8
+SEARCH_HIGHLIGHT = ('<mark>', '</mark>')
+SEARCH_SNIPPET_TOKENS = 16
+SEARCH_SNIPPET_CHARS = 100  # 색인을 쓰지 않는 짧은 검색어 결과의 스니펫 길이
+
+SEARCH_INDEX_DDL = {
+    'notice_fts': [
+        f"""CREATE VIRTUAL TABLE notice_fts USING fts5(
+            title, message,
+            content='notice', content_rowid='id',
+            {SEARCH_TABLE_OPTIONS}
+        )""",
+        """CREATE TRIGGER IF NOT EXISTS notice_fts_ai AFTER INSERT ON notice BEGIN
+            INSERT INTO notice_fts(rowid, title, message)
+            VALUES (new.id, new.title, new.message);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS notice_fts_ad AFTER DELETE ON notice BEGIN
+            INSERT INTO notice_fts(notice_fts, rowid, title, message)
+            VALUES ('delete', old.id, old.title, old.message);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS notice_fts_au AFTER UPDATE OF title, message ON notice BEGIN
+            INSERT INTO notice_fts(notice_fts, rowid, title, message)
+            VALUES ('delete', old.id, old.title, old.message);
+            INSERT INTO notice_fts(rowid, title, message)
+            VALUES (new.id, new.title, new.message);
+        END""",
+    ],
+    'notice_template_fts': [
+        f"""CREATE VIRTUAL TABLE notice_template_fts USING fts5(
+            name, title, content,
+            content='notice_template', content_rowid='id',
+            {SEARCH_TABLE_OPTIONS}
+        )""",
+        """CREATE TRIGGER IF NOT EXISTS notice_template_fts_ai AFTER INSERT ON notice_template BEGIN
+            INSERT INTO notice_template_fts(rowid, name, title, content)
+            VALUES (new.id, new.name, new.title, new.content);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS notice_template_fts_ad AFTER DELETE ON notice_template BEGIN
+            INSERT INTO notice_template_fts(notice_template_fts, rowid, name, title, content)
+            VALUES ('delete', old.id, old.name, old.title, old.content);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS notice_template_fts_au AFTER UPDATE OF name, title, content ON notice_template BEGIN
+            INSERT INTO notice_template_fts(notice_template_fts, rowid, name, title, content)
+            VALUES ('delete', old.id, old.name, old.title, old.content);
+            INSERT INTO notice_template_fts(rowid, name, title, content)
+            VALUES (new.id, new.name, new.title, new.content);
+        END""",
+    ],
+}
+
+def search_index_supported():
+    return db.engine.dialect.name == 'sqlite'
+
+def init_search_index(rebuild=False):
+    """FTS5 색인 테이블과 동기화 트리거 생성 (새로 만들었거나 rebuild=True면 기존 데이터로 재색인)
     
-    db.session.add(notice)
+    토크나이저나 컬럼이 바뀐 기존 색인(예: unicode61로 만든 색인)은 지우고 새로 만듭니다.
+    """
+    if not search_index_supported():
+        return
+    
+    for table, statements in SEARCH_INDEX_DDL.items():
+        current_sql = db.session.execute(
+            text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {'name': table}
+        ).scalar()
+        exists = current_sql is not None
+        if exists and ' '.join(current_sql.split()) != ' '.join(statements[0].split()):
+            db.session.execute(text(f'DROP TABLE {table}'))
+            for suffix in ('ai', 'ad', 'au'):
+                db.session.execute(text(f'DROP TRIGGER IF EXISTS {table}_{suffix}'))
+            exists = False
+        if not exists:
+            db.session.execute(text(statements[0]))
+        for statement in statements[1:]:
+            db.session.execute(text(statement))
+        if rebuild or not exists:
+            db.session.execute(text(f"INSERT INTO {table}({table}) VALUES ('rebuild')"))
     db.session.commit()
+
+def build_search_query(q, columns):
+    """사용자 입력을 (FTS5 MATCH 식, LIKE로 확인할 짧은 검색어 목록)으로 변환 (모든 단어 AND)
     
-    # 스케줄러에 작업 추가
-    job_id = f"notice_{notice.id}_{datetime.now().timestamp()}"
+    trigram: 3글자 이상 단어는 부분 문자열로 MATCH, 더 짧은 단어는 LIKE로 확인
+    unicode61: 각 단어를 접두어 검색
+    """
+    terms = re.findall(r'\w+', q)[:SEARCH_MAX_TERMS]
+    if not terms:
+        return None
     
-    scheduled_job = ScheduledJob(
-        notice_id=notice.id,
-        job_id=job_id,
-        scheduled_at=notice.scheduled_at
-    )
+    if SEARCH_TRIGRAM:
+        match_terms = [f'"{term}"' for term in terms if len(term) >= SEARCH_MIN_TRIGRAM_TERM]
+        like_terms = [term for term in terms if len(term) < SEARCH_MIN_TRIGRAM_TERM]
+    else:
+        match_terms = [f'"{term}"*' for term in terms]
+        like_terms = []
     
-    db.session.add(scheduled_job)
-    db.session.commit()
+    match = '{%s} : (%s)' % (' '.join(columns), ' '.join(match_terms)) if match_terms else None
+    return match, like_terms
+
+def search_conditions(alias, columns, match_table, query, workspace_ids):
+    """검색 WHERE 조건과 바인딩 값 (워크스페이스 범위는 원본 테이블 컬럼으로 제한)"""
+    match, like_terms = query
+    conditions = []
+    params = {}
+    if match:
+        conditions.append(f'{match_table} MATCH :match')
+        params['match'] = match
+    for index, term in enumerate(like_terms):
+        params[f'like{index}'] = '%' + re.sub(r'([\\%_])', r'\\\1', term) + '%'
+        conditions.append('(%s)' % ' OR '.join(f"{alias}.{column} LIKE :like{index} ESCAPE '\\'" for column in columns))
+    if workspace_ids is not None:
+        conditions.append(f'{alias}.workspace_id IN (%s)' % ', '.join(str(int(ws_id)) for ws_id in workspace_ids))
+    return ' AND '.join(conditions), params
+
+def search_notices(query, workspace_ids, limit):
+    """공지 검색. 색인으로 찾을 검색어가 없으면(짧은 검색어만 있으면) LIKE로 찾아 최신순 정렬"""
+    open_mark, close_mark = SEARCH_HIGHLIGHT
+    where, params = search_conditions('n', ['title', 'message'], 'notice_fts', query, workspace_ids)
+    if query[0]:
+        rows = db.session.execute(text(f"""
+            SELECT n.id, n.workspace_id, n.type, n.status, n.scheduled_at,
+                   highlight(notice_fts, 0, :open, :close) AS title,
+                   snippet(notice_fts, 1, :open, :close, '…', :tokens) AS snippet,
+                   bm25(notice_fts, 5.0, 1.0) AS rank
+            FROM notice_fts JOIN notice n ON n.id = notice_fts.rowid
+            WHERE {where}
+            ORDER BY rank
+            LIMIT :limit
+        """).columns(scheduled_at=db.DateTime), dict(params, open=open_mark, close=close_mark, tokens=SEARCH_SNIPPET_TOKENS, limit=limit))
+    else:
+        rows = db.session.execute(text(f"""
+            SELECT n.id, n.workspace_id, n.type, n.status, n.scheduled_at, n.title,
+                   substr(n.message, 1, :chars) AS snippet, 0 AS rank
+            FROM notice n
+            WHERE {where}
+            ORDER BY n.id DESC
+            LIMIT :limit
+        """).columns(scheduled_at=db.DateTime), dict(params, chars=SEARCH_SNIPPET_CHARS, limit=limit))
     
-    # APScheduler에 작업 등록
-    scheduler.add_job(
-        func=send_notice,
-        trigger="date",
-        run_date=notice.scheduled_at,
-        args=[notice.id],
-        id=job_id
-    )
+    return [{
+        'id': row.id,
+        'workspaceId': row.workspace_id,
+        'type': row.type,
+        'status': row.status,
+        'scheduledAt': serialize_datetime(row.scheduled_at),
+        'title': row.title,
+        'snippet': row.snippet,
+        'score': -row.rank
+    } for row in rows]
+
+def search_templates(query, workspace_ids, limit):
+    open_mark, close_mark = SEARCH_HIGHLIGHT
+    where, params = search_conditions('t', ['name', 'title', 'content'], 'notice_template_fts', query, workspace_ids)
+    if query[0]:
+        rows = db.session.execute(text(f"""
+            SELECT t.id, t.workspace_id, t.category_id,
+                   highlight(notice_template_fts, 0, :open, :close) AS name,
+                   highlight(notice_template_fts, 1, :open, :close) AS title,
+                   snippet(notice_template_fts, 2, :open, :close, '…', :tokens) AS snippet,
+                   bm25(notice_template_fts, 5.0, 3.0, 1.0) AS rank
+            FROM notice_template_fts JOIN notice_template t ON t.id = notice_template_fts.rowid
+            WHERE {where}
+            ORDER BY rank
+            LIMIT :limit
+        """), dict(params, open=open_mark, close=close_mark, tokens=SEARCH_SNIPPET_TOKENS, limit=limit))
+    else:
+        rows = db.session.execute(text(f"""
+            SELECT t.id, t.workspace_id, t.category_id, t.name, t.title,
+                   substr(t.content, 1, :chars) AS snippet, 0 AS rank
+            FROM notice_template t
+            WHERE {where}
+            ORDER BY t.id DESC
+            LIMIT :limit
+        """), dict(params, chars=SEARCH_SNIPPET_CHARS, limit=limit))
     
-    return jsonify({'message': '공지사항이 예약되었습니다.', 'id': notice.id}), 201
+    return [{
+        'id': str(row.id),
+        'workspaceId': str(row.workspace_id),
+        'categoryId': str(row.category_id),
+        'name': row.name,
+        'title': row.title,
+        'snippet': row.snippet,
+        'score': -row.rank
+    } for row in rows]
 
-@app.route('/api/notices', methods=['GET'])
+@api.route('/api/search', methods=['GET'])
 @jwt_required()
-def get_notices():
+def search():
     current_user_id = int(get_jwt_identity())
     current_user = db.session.get(User, current_user_id)
     
-    if current_user.is_admin:
-        notices = Notice.query.all()
+    if not search_index_supported():
+        return jsonify({'message': '전문 검색은 SQLite 데이터베이스에서만 지원됩니다.'}), 501
+    
+    q = request.args.get('q', '').strip()
+    if not q:
+        return jsonify({'message': '검색어(q)가 필요합니다.'}), 400
+    
+    search_type = request.args.get('type')
+    if search_type not in (None, 'notice', 'template'):
+        return jsonify({'message': 'type은 notice 또는 template이어야 합니다.'}), 400
+    
+    limit = min(request.args.get('limit', 20, type=int), 100)
+    workspace_id = request.args.get('workspaceId', type=int)
+    
+    # 검색 범위: 지정한 워크스페이스 또는 사용자가 접근 가능한 워크스페이스 전체 (관리자는 제한 없음)
+    if workspace_id:
+        if not current_user.is_admin:
+            user_workspace = UserWorkspace.query.filter_by(
+                user_id=current_user_id,
+                workspace_id=workspace_id
+            ).first()
+            
+            if not user_workspace:
+                return jsonify({'message': '워크스페이스에 접근 권한이 없습니다.'}), 403
+        workspace_ids = [workspace_id]
+    elif current_user.is_admin:
+        workspace_ids = None
     else:
-        # 사용자가 접근 가능한 워크스페이스의 공지만 조회
-        user_workspace_ids = [uw.workspace_id for uw in current_user.user_workspaces]
-        notices = Notice.query.filter(Notice.workspace_id.in_(user_workspace_ids)).all()
+        workspace_ids = [uw.workspace_id for uw in current_user.user_workspaces]
     
-    return jsonify([{
-        'id': notice.id,
-        'type': notice.type,
-        'title': notice.title,
-        'message': notice.message,
-        'workspaceId': notice.workspace_id,
-        'createdBy': notice.created_by,
-        'scheduledAt': notice.scheduled_at.isoformat(),
-        'status': notice.status,
-        'createdAt': notice.created_at.isoformat()
-    } for notice in notices])
+    result = {'query': q, 'notices': [], 'templates': []}
+    if workspace_ids == []:
+        return jsonify(result)
+    
+    try:
+        if search_type in (None, 'notice'):
+            query = build_search_query(q, ['title', 'message'])
+            if query:
+                result['notices'] = search_notices(query, workspace_ids, limit)
+        if search_type in (None, 'template'):
+            query = build_search_query(q, ['name', 'title', 'content'])
+            if query:
+                result['templates'] = search_templates(query, workspace_ids, limit)
+    except Exception as e:
+        logger.exception('검색 오류', extra=log_fields(query=q))
+        return jsonify({'message': '검색에 실패했습니다.'}), 500
+    
+    return jsonify(result)
 
-# 공지 전송 함수
-def send_notice(notice_id):
-    with app.app_context():
-        notice = db.session.get(Notice, notice_id)
-        scheduled_job = ScheduledJob.query.filter_by(notice_id=notice_id).first()
+@api.cli.command('rebuild-search-index')
+def rebuild_search_index_command():
+    """전문 검색 색인 재생성"""
+    init_search_index(rebuild=True)
+    print("검색 색인을 재생성했습니다.")
+
+# 일괄 가져오기 (CSV / JSON)
+# 파일 전체를 먼저 검증해 행별 오류 목록을 만들고, 유효한 행만 IMPORT_BATCH_SIZE 단위 트랜잭션으로 일괄 삽입합니다.
+IMPORT_BATCH_SIZE = 500
+IMPORT_MAX_ROWS = 10000
+IMPORT_HASH_WORKERS = min(8, os.cpu_count() or 1)  # 비밀번호 해시 병렬 계산 스레드 수 (scrypt는 GIL을 놓고 계산)
+EMAIL_PATTERN = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+TRUE_VALUES = ('1', 'true', 'y', 'yes')
+
+def parse_import_rows(content, filename=None):
+    """CSV 텍스트 또는 JSON 배열(또는 {"rows": [...]})을 dict 행 목록으로 변환"""
+    text_content = content.decode('utf-8-sig') if isinstance(content, bytes) else content
+    stripped = text_content.lstrip()
+    
+    if (filename or '').lower().endswith('.json') or stripped.startswith(('[', '{')):
+        data = json.loads(stripped)
+        rows = data.get('rows') if isinstance(data, dict) else data
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise ValueError('JSON은 객체 배열이어야 합니다.')
+        return rows
+    
+    # CSV: 빈 칸은 값 없음으로 처리
+    reader = csv.DictReader(io.StringIO(stripped))
+    return [
+        {key.strip(): (value.strip() or None) if isinstance(value, str) else value for key, value in row.items() if key}
+        for row in reader
+    ]
+
+def import_text(row, field, errors, required=False, max_length=None):
+    value = row.get(field)
+    if value is not None and not isinstance(value, str):
+        value = str(value)
+    if value is not None:
+        value = value.strip()
+    if not value:
+        if required:
+            errors.append(f'{field}: 필수 항목입니다.')
+        return None
+    if max_length and len(value) > max_length:
+        errors.append(f'{field}: 최대 {max_length}자까지 입력할 수 있습니다.')
+    return value
+
+def import_bool(row, field, default=False):
+    value = row.get(field)
+    if value is None or value == '':
+        return default
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in TRUE_VALUES
+
+def import_list(row, field, errors):
+    """JSON 배열 또는 CSV의 ';' 구분 값"""
+    value = row.get(field)
+    if value is None or value == '':
+        return []
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(';') if item.strip()]
+    errors.append(f'{field}: 목록 형식이 올바르지 않습니다.')
+    return []
+
+def import_id_list(row, field, errors):
+    try:
+        return sorted({int(value) for value in import_list(row, field, errors)})
+    except (TypeError, ValueError):
+        errors.append(f'{field}: 정수 ID 목록이어야 합니다.')
+        return []
+
+def import_time(row, field, errors):
+    value = import_text(row, field, errors)
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, '%H:%M').time()
+    except ValueError:
+        errors.append(f'{field}: HH:MM 형식이어야 합니다.')
+        return None
+
+def validate_user_rows(rows, created_by):
+    emails = {str(row.get('email') or '').strip().lower() for row in rows}
+    existing = set()
+    email_list = sorted(emails - {''})
+    for i in range(0, len(email_list), IMPORT_BATCH_SIZE):
+        chunk = email_list[i:i + IMPORT_BATCH_SIZE]
+        existing.update(email.lower() for (email,) in db.session.query(User.email).filter(db.func.lower(User.email).in_(chunk)).all())
+    workspace_ids = sorted({
+        workspace_id for row in rows for workspace_id in import_id_list(row, 'workspaceIds', [])
+    })
+    known_workspaces = set(workspace_ids) - set(find_missing_ids(Workspace, workspace_ids, Workspace.status != 'deleted'))
+    
+    seen = set()
+    for row in rows:
+        errors = []
+        email = import_text(row, 'email', errors, required=True, max_length=120)
+        if email:
+            # 중복 검사는 대소문자 구분 없이 수행
+            if not EMAIL_PATTERN.match(email):
+                errors.append('email: 이메일 형식이 올바르지 않습니다.')
+            elif email.lower() in existing:
+                errors.append('email: 이미 존재하는 이메일입니다.')
+            elif email.lower() in seen:
+                errors.append('email: 파일 안에서 중복된 이메일입니다.')
+            seen.add(email.lower())
+        password = import_text(row, 'password', errors, required=True)
+        if password and len(password) < 8:
+            errors.append('password: 8자 이상이어야 합니다.')
+        workspace_ids = import_id_list(row, 'workspaceIds', errors)
+        missing = [workspace_id for workspace_id in workspace_ids if workspace_id not in known_workspaces]
+        if missing:
+            errors.append(f'workspaceIds: 존재하지 않는 워크스페이스입니다. ({", ".join(map(str, missing))})')
         
-        if not notice or not scheduled_job:
-            return
+        yield {
+            'email': email,
+            'password': password,
+            'name': import_text(row, 'name', errors, required=True, max_length=100),
+            'is_approved': import_bool(row, 'isApproved', default=True),
+            'workspace_ids': workspace_ids
+        }, errors
+
+def insert_user_rows(values, created_by):
+    # 비밀번호 해시(scrypt)는 행마다 수십 ms가 걸리므로 배치 단위로 병렬 계산
+    with ThreadPoolExecutor(max_workers=IMPORT_HASH_WORKERS, thread_name_prefix='import-hash') as executor:
+        password_hashes = list(executor.map(generate_password_hash, [value['password'] for value in values]))
+    
+    now = datetime.utcnow()
+    user_ids = db.session.execute(db.insert(User).returning(User.id, sort_by_parameter_order=True), [{
+        'email': value['email'],
+        'password_hash': password_hash,
+        'name': value['name'],
+        'is_admin': False,
+        'is_approved': value['is_approved'],
+        'created_at': now
+    } for value, password_hash in zip(values, password_hashes)]).scalars().all()
+    
+    apply_workspace_access_diff({
+        (user_id, workspace_id)
+        for user_id, value in zip(user_ids, values)
+        for workspace_id in value['workspace_ids']
+    }, set())
+    return user_ids, ('membership',)
+
+def validate_workspace_rows(rows, created_by):
+    for row in rows:
+        errors = []
+        name = import_text(row, 'name', errors, required=True, max_length=100)
+        status = import_text(row, 'status', errors) or 'approved'
+        if status not in ('pending', 'approved'):
+            errors.append('status: pending 또는 approved여야 합니다.')
+        webhook_urls = []
+        for item in import_list(row, 'webhookUrls', errors):
+            # 화면과 같은 {name, url} 형식으로 저장 (CSV는 'URL' 또는 '이름|URL')
+            if isinstance(item, str):
+                name_part, _, url_part = item.rpartition('|')
+                item = {'name': name_part.strip(), 'url': url_part.strip()}
+            if not isinstance(item, dict) or not item.get('url'):
+                errors.append('webhookUrls: 웹훅 URL 형식이 올바르지 않습니다.')
+                continue
+            webhook_urls.append({'name': item.get('name') or '', 'url': item['url']})
         
+        yield {
+            'name': name,
+            'description': import_text(row, 'description', errors) or '',
+            'slack_webhook_name': import_text(row, 'slackWebhookName', errors, max_length=100) or '기본 슬랙',
+            'slack_webhook_url': import_text(row, 'slackWebhookUrl', errors, max_length=500) or '',
+            'webhook_urls': webhook_urls,
+            'checkin_time': import_time(row, 'checkinTime', errors),
+            'middle_time': import_time(row, 'middleTime', errors),
+            'checkout_time': import_time(row, 'checkoutTime', errors),
+            'zoom_url': import_text(row, 'zoomUrl', errors, max_length=500) or '',
+            'zoom_id': import_text(row, 'zoomId', errors, max_length=100) or '',
+            'zoom_password': import_text(row, 'zoomPassword', errors, max_length=100) or '',
+            'status': status,
+            'created_by': created_by
+        }, errors
+
+def insert_workspace_rows(values, created_by):
+    now = datetime.utcnow()
+    workspace_ids = db.session.execute(
+        db.insert(Workspace).returning(Workspace.id, sort_by_parameter_order=True),
+        [dict(value, created_at=now, updated_at=now) for value in values]
+    ).scalars().all()
+    
+    # 승인된 워크스페이스는 승인 처리와 같이 생성자에게 접근 권한 부여
+    apply_workspace_access_diff({
+        (created_by, workspace_id)
+        for workspace_id, value in zip(workspace_ids, values)
+        if value['status'] == 'approved'
+    }, set())
+    return workspace_ids, ('workspace', 'membership')
+
+def validate_template_rows(rows, created_by):
+    workspace_ids = set()
+    category_ids = set()
+    for row in rows:
         try:
-            workspace = db.session.get(Workspace, notice.workspace_id)
-            
-            # 선택된 웹훅 URL이 있으면 우선 사용, 없으면 기본 슬랙 웹훅 URL 사용
-            webhook_url = notice.selected_webhook_url or workspace.slack_webhook_url
-            
-            if not webhook_url:
-                raise Exception("발송할 웹훅 URL이 설정되지 않았습니다.")
-            
-            # Slack 메시지 구성
-            slack_data = {
-                "text": notice.title,
-                "blocks": [
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": notice.message
-                        }
-                    }
-                ]
-            }
-            
-            # QR 이미지 추가 (no_image가 False인 경우)
-            if not notice.no_image and workspace.qr_image_url:
-                slack_data["blocks"].append({
-                    "type": "image",
-                    "image_url": workspace.qr_image_url,
-                    "alt_text": "QR Code"
-                })
-            
-            # 선택된 웹훅으로 전송
-            response = requests.post(webhook_url, json=slack_data)
-            response.raise_for_status()
-            
-            # 성공 처리
-            notice.status = 'sent'
-            notice.sent_at = datetime.utcnow()
-            scheduled_job.status = 'completed'
-            scheduled_job.executed_at = datetime.utcnow()
-            
-        except Exception as e:
-            # 실패 처리
-            notice.status = 'failed'
-            notice.error_message = str(e)
-            scheduled_job.status = 'failed'
-            scheduled_job.executed_at = datetime.utcnow()
-            scheduled_job.error_message = str(e)
+            workspace_ids.add(int(row.get('workspaceId')))
+            category_ids.add(int(row.get('categoryId')))
+        except (TypeError, ValueError):
+            pass
+    known_workspaces = workspace_ids - set(find_missing_ids(Workspace, sorted(workspace_ids), Workspace.status != 'deleted'))
+    categories = dict(db.session.query(NoticeCategory.id, NoticeCategory.workspace_id).filter(
+        NoticeCategory.id.in_(category_ids),
+        NoticeCategory.is_active == True
+    ).all()) if category_ids else {}
+    
+    for row in rows:
+        errors = []
+        workspace_id = category_id = None
+        try:
+            workspace_id = int(row.get('workspaceId'))
+            if workspace_id not in known_workspaces:
+                errors.append('workspaceId: 존재하지 않는 워크스페이스입니다.')
+        except (TypeError, ValueError):
+            errors.append('workspaceId: 정수 ID가 필요합니다.')
+        try:
+            category_id = int(row.get('categoryId'))
+            if category_id not in categories:
+                errors.append('categoryId: 존재하지 않는 카테고리입니다.')
+            elif categories[category_id] not in (None, workspace_id):
+                errors.append('categoryId: 다른 워크스페이스의 카테고리입니다.')
+        except (TypeError, ValueError):
+            errors.append('categoryId: 정수 ID가 필요합니다.')
         
-        db.session.commit()
+        yield {
+            'workspace_id': workspace_id,
+            'category_id': category_id,
+            'name': import_text(row, 'name', errors, required=True, max_length=100),
+            'title': import_text(row, 'title', errors, required=True, max_length=200),
+            'content': import_text(row, 'content', errors, required=True),
+            'variables': import_list(row, 'variables', errors),
+            'is_default': import_bool(row, 'isDefault'),
+            'created_by': created_by
+        }, errors
 
-# 스케줄러 작업 조회 (관리자만)
-@app.route('/api/admin/scheduler/jobs', methods=['GET'])
+def insert_template_rows(values, created_by):
+    now = datetime.utcnow()
+    template_ids = db.session.execute(
+        db.insert(NoticeTemplate).returning(NoticeTemplate.id, sort_by_parameter_order=True),
+        [dict(value, created_at=now, updated_at=now) for value in values]
+    ).scalars().all()
+    return template_ids, ('template',)
+
+IMPORT_KINDS = {
+    'users': (validate_user_rows, insert_user_rows),
+    'workspaces': (validate_workspace_rows, insert_workspace_rows),
+    'templates': (validate_template_rows, insert_template_rows),
+}
+
+def run_import(kind, rows, created_by, dry_run=False, skip_invalid=False):
+    """행 목록을 검증 후 배치 단위로 삽입하고 행별 결과 보고서를 반환
+    
+    기본적으로 오류가 있는 행이 하나라도 있으면 아무것도 삽입하지 않으며, skip_invalid면 유효한 행만 삽입합니다.
+    행 번호는 데이터 행 기준 1부터 시작합니다 (CSV는 헤더 제외).
+    """
+    validate_rows, insert_rows = IMPORT_KINDS[kind]
+    
+    valid = []
+    errors = []
+    for index, (values, row_errors) in enumerate(validate_rows(rows, created_by), start=1):
+        if row_errors:
+            errors.append({'row': index, 'errors': row_errors})
+        else:
+            valid.append((index, values))
+    
+    report = {
+        'kind': kind,
+        'total': len(rows),
+        'valid': len(valid),
+        'imported': 0,
+        'ids': [],
+        'errors': errors,
+        'dryRun': dry_run
+    }
+    if dry_run or (errors and not skip_invalid):
+        return report
+    
+    namespaces = set()
+    for i in range(0, len(valid), IMPORT_BATCH_SIZE):
+        batch = valid[i:i + IMPORT_BATCH_SIZE]
+        try:
+            ids, batch_namespaces = insert_rows([values for _, values in batch], created_by)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.exception('일괄 가져오기 배치 실패', extra=log_fields(kind=kind, firstRow=batch[0][0], rows=len(batch)))
+            errors.extend({'row': index, 'errors': [f'저장 실패: {e}']} for index, _ in batch)
+            continue
+        report['imported'] += len(ids)
+        report['ids'].extend(ids)
+        namespaces.update(batch_namespaces)
+    
+    if namespaces:
+        cache.bump(*namespaces)
+    errors.sort(key=lambda error: error['row'])
+    logger.info('일괄 가져오기 완료', extra=log_fields(
+        kind=kind, total=report['total'], imported=report['imported'], failed=len(errors)
+    ))
+    return report
+
+@api.route('/api/admin/import/<kind>', methods=['POST'])
 @jwt_required()
-def get_scheduled_jobs():
+def import_data(kind):
+    """CSV(업로드 파일 또는 text/csv 본문) 또는 JSON 배열로 사용자/워크스페이스/템플릿 일괄 등록"""
     current_user_id = int(get_jwt_identity())
     current_user = db.session.get(User, current_user_id)
     
     if not current_user.is_admin:
         return jsonify({'message': '관리자 권한이 필요합니다.'}), 403
     
-    jobs = ScheduledJob.query.all()
-    return jsonify([{
-        'id': job.id,
-        'noticeId': job.notice_id,
-        'status': job.status,
-        'scheduledAt': job.scheduled_at.isoformat(),
-        'executedAt': job.executed_at.isoformat() if job.executed_at else None,
-        'error': job.error_message
-    } for job in jobs])
+    if kind not in IMPORT_KINDS:
+        return jsonify({'message': f'지원하지 않는 가져오기 종류입니다. ({", ".join(IMPORT_KINDS)})'}), 404
+    
+    try:
+        if 'file' in request.files:
+            upload = request.files['file']
+            rows = parse_import_rows(upload.read(), upload.filename)
+        else:
+            rows = parse_import_rows(request.get_data())
+    except (ValueError, UnicodeDecodeError) as e:
+        return jsonify({'message': f'파일을 읽을 수 없습니다: {e}'}), 400
+    
+    if not rows:
+        return jsonify({'message': '가져올 행이 없습니다.'}), 400
+    if len(rows) > IMPORT_MAX_ROWS:
+        return jsonify({'message': f'한 번에 최대 {IMPORT_MAX_ROWS}행까지 가져올 수 있습니다.'}), 400
+    
+    report = run_import(
+        kind,
+        rows,
+        current_user_id,
+        dry_run=request.args.get('dryRun') == 'true',
+        skip_invalid=request.args.get('skipInvalid') == 'true'
+    )
+    
+    if report['errors'] and not report['imported'] and not report['dryRun']:
+        return jsonify(dict(report, message='오류가 있는 행이 있어 가져오지 않았습니다.')), 400
+    return jsonify(report), 200 if report['dryRun'] else 201
+
+@api.cli.command('import-data')
+@click.argument('kind', type=click.Choice(list(IMPORT_KINDS)))
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--created-by', default='admin@day1company.co.kr', help='생성자로 기록할 관리자 이메일')
+@click.option('--dry-run', is_flag=True, help='검증만 하고 저장하지 않음')
+@click.option('--skip-invalid', is_flag=True, help='오류가 있는 행은 건너뛰고 나머지만 저장')
+def import_data_command(kind, path, created_by, dry_run, skip_invalid):
+    """CSV/JSON 파일로 사용자/워크스페이스/템플릿 일괄 등록"""
+    creator = User.query.filter_by(email=created_by).first()
+    if not creator:
+        raise click.ClickException(f'사용자를 찾을 수 없습니다: {created_by}')
+    
+    with open(path, 'rb') as f:
+        try:
+            rows = parse_import_rows(f.read(), path)
+        except (ValueError, UnicodeDecodeError) as e:
+            raise click.ClickException(f'파일을 읽을 수 없습니다: {e}')
+    
+    started = time.monotonic()
+    report = run_import(kind, rows, creator.id, dry_run=dry_run, skip_invalid=skip_invalid)
+    
+    for error in report['errors']:
+        print(f"{error['row']}행: {' / '.join(error['errors'])}")
+    if dry_run:
+        print(f"검증 완료: 전체 {report['total']}행 중 {report['valid']}행 유효")
+    elif report['errors'] and not report['imported']:
+        print(f"오류가 있는 행이 {len(report['errors'])}개 있어 가져오지 않았습니다. (--skip-invalid로 유효한 행만 저장)")
+    else:
+        print(f"{report['imported']}건을 가져왔습니다. ({time.monotonic() - started:.1f}초)")
 
 # 데이터베이스 초기화 및 관리자 계정 생성
 def init_db():
-    with app.app_context():
+    with get_app().app_context():
         db.create_all()
         
         # 관리자 계정 생성 (이미 존재하지 않는 경우)
@@ -1107,6 +4995,13 @@ def init_db():
             
         # 기본 카테고리 생성 (이미 존재하지 않는 경우)
         init_default_categories()
+        
+        # 카운터 테이블이 비어 있으면 기존 데이터로 집계
+        if not WorkspaceCounter.query.first():
+            rebuild_workspace_counters()
+        
+        # 전문 검색 색인 (없으면 생성 후 기존 데이터 색인)
+        init_search_index()
 
 def init_default_categories():
     """기본 공지 카테고리 초기화"""
@@ -1129,14 +5024,10 @@ def init_default_categories():
             db.session.add(category)
     
     db.session.commit()
+    cache.bump('category')
 
 # 템플릿 카테고리 API
-@app.route('/api/template-categories', methods=['GET'])
-@jwt_required()
-def get_template_categories():
-    current_user_id = int(get_jwt_identity())
-    workspace_id = request.args.get('workspaceId')
-    
+def load_template_categories(workspace_id):
     if workspace_id:
         # 특정 워크스페이스의 카테고리 + 전역 카테고리
         categories = NoticeCategory.query.filter(
@@ -1147,7 +5038,7 @@ def get_template_categories():
         # 전역 카테고리만
         categories = NoticeCategory.query.filter_by(workspace_id=None, is_active=True).all()
     
-    return jsonify([{
+    return [{
         'id': str(cat.id),
         'name': cat.name,
         'type': cat.type,
@@ -1156,9 +5047,17 @@ def get_template_categories():
         'isActive': cat.is_active,
         'createdAt': cat.created_at.isoformat(),
         'updatedAt': cat.updated_at.isoformat()
-    } for cat in categories])
+    } for cat in categories]
+
+@api.route('/api/template-categories', methods=['GET'])
+@jwt_required()
+def get_template_categories():
+    current_user_id = int(get_jwt_identity())
+    workspace_id = request.args.get('workspaceId')
+    
+    return jsonify(cache.get_or_load('category', workspace_id or 'global', lambda: load_template_categories(workspace_id)))
 
-@app.route('/api/template-categories', methods=['POST'])
+@api.route('/api/template-categories', methods=['POST'])
 @jwt_required()
 def create_template_category():
     current_user_id = int(get_jwt_identity())
@@ -1173,6 +5072,7 @@ def create_template_category():
     
     db.session.add(category)
     db.session.commit()
+    cache.bump('category')
     
     return jsonify({
         'id': str(category.id),
@@ -1185,7 +5085,7 @@ def create_template_category():
         'updatedAt': category.updated_at.isoformat()
     }), 201
 
-@app.route('/api/template-categories/<int:category_id>', methods=['PUT'])
+@api.route('/api/template-categories/<int:category_id>', methods=['PUT'])
 @jwt_required()
 def update_template_category(category_id):
     current_user_id = int(get_jwt_identity())
@@ -1209,6 +5109,7 @@ def update_template_category(category_id):
     
     category.updated_at = datetime.utcnow()
     db.session.commit()
+    cache.bump('category')
     
     return jsonify({
         'id': str(category.id),
@@ -1221,7 +5122,7 @@ def update_template_category(category_id):
         'updatedAt': category.updated_at.isoformat()
     })
 
-@app.route('/api/template-categories/<int:category_id>', methods=['DELETE'])
+@api.route('/api/template-categories/<int:category_id>', methods=['DELETE'])
 @jwt_required()
 def delete_template_category(category_id):
     current_user_id = int(get_jwt_identity())
@@ -1244,65 +5145,60 @@ def delete_template_category(category_id):
     category.is_active = False
     category.updated_at = datetime.utcnow()
     db.session.commit()
+    cache.bump('category')
     
     return '', 204
 
 # 공지 템플릿 API
-@app.route('/api/notice-templates', methods=['GET'])
+@api.route('/api/notice-templates', methods=['GET'])
 @jwt_required()
 def get_notice_templates():
     current_user_id = int(get_jwt_identity())
     workspace_id = request.args.get('workspaceId')
     category_id = request.args.get('categoryId')
     
+    sync_requested, since = parse_sync_watermark()
+    if since is False:
+        return jsonify({'message': 'since 값이 올바르지 않습니다.'}), 400
+    started_at = datetime.utcnow()
+    
     query = NoticeTemplate.query
+    tombstones = SyncTombstone.query.filter(SyncTombstone.entity == 'template')
     
     if workspace_id:
         query = query.filter_by(workspace_id=workspace_id)
+        tombstones = tombstones.filter(SyncTombstone.workspace_id == workspace_id)
     
     if category_id:
         query = query.filter_by(category_id=category_id)
     
-    templates = query.all()
+    if not since:
+        items = cache.get_or_load(
+            'template', f'{workspace_id}:{category_id}',
+            lambda: [serialize_template(template) for template in query.all()]
+        )
+        return jsonify(sync_response(items, [], started_at) if sync_requested else items)
     
-    return jsonify([{
-        'id': str(template.id),
-        'categoryId': str(template.category_id),
-        'name': template.name,
-        'title': template.title,
-        'content': template.content,
-        'workspaceId': str(template.workspace_id),
-        'variables': json.loads(template.variables) if template.variables else [],
-        'isDefault': template.is_default,
-        'createdBy': str(template.created_by),
-        'createdAt': template.created_at.isoformat(),
-        'updatedAt': template.updated_at.isoformat()
-    } for template in templates])
+    items = [serialize_template(template) for template in query.filter(NoticeTemplate.updated_at > since).all()]
+    deleted = [str(tombstone.entity_id) for tombstone in tombstones.filter(SyncTombstone.deleted_at > since).all()]
+    return jsonify(sync_response(items, deleted, started_at, since=since))
 
-@app.route('/api/notice-templates/<int:template_id>', methods=['GET'])
+@api.route('/api/notice-templates/<int:template_id>', methods=['GET'])
 @jwt_required()
 def get_notice_template(template_id):
     current_user_id = int(get_jwt_identity())
     
-    template = db.session.get(NoticeTemplate, template_id)
+    def load_template():
+        template = db.session.get(NoticeTemplate, template_id)
+        return serialize_template(template) if template else None
+    
+    template = cache.get_or_load('template', f'id:{template_id}', load_template)
     if not template:
         return jsonify({'message': '템플릿을 찾을 수 없습니다.'}), 404
     
-    return jsonify({
-        'id': str(template.id),
-        'categoryId': str(template.category_id),
-        'name': template.name,
-        'title': template.title,
-        'content': template.content,
-        'workspaceId': str(template.workspace_id),
-        'variables': json.loads(template.variables) if template.variables else [],
-        'isDefault': template.is_default,
-        'createdBy': str(template.created_by),
-        'createdAt': template.created_at.isoformat(),
-        'updatedAt': template.updated_at.isoformat()
-    })
+    return jsonify(template)
 
-@app.route('/api/notice-templates', methods=['POST'])
+@api.route('/api/notice-templates', methods=['POST'])
 @jwt_required()
 def create_notice_template():
     current_user_id = int(get_jwt_identity())
@@ -1314,13 +5210,14 @@ def create_notice_template():
         title=data['title'],
         content=data['content'],
         workspace_id=data['workspaceId'],
-        variables=json.dumps(data.get('variables', [])),
+        variables=data.get('variables', []),
         is_default=data.get('isDefault', False),
         created_by=current_user_id
     )
     
     db.session.add(template)
     db.session.commit()
+    cache.bump('template')
     
     return jsonify({
         'id': str(template.id),
@@ -1329,14 +5226,14 @@ def create_notice_template():
         'title': template.title,
         'content': template.content,
         'workspaceId': str(template.workspace_id),
-        'variables': json.loads(template.variables) if template.variables else [],
+        'variables': template.variables or [],
         'isDefault': template.is_default,
         'createdBy': str(template.created_by),
         'createdAt': template.created_at.isoformat(),
         'updatedAt': template.updated_at.isoformat()
     }), 201
 
-@app.route('/api/notice-templates/<int:template_id>', methods=['PUT'])
+@api.route('/api/notice-templates/<int:template_id>', methods=['PUT'])
 @jwt_required()
 def update_notice_template(template_id):
     current_user_id = int(get_jwt_identity())
@@ -1359,12 +5256,13 @@ def update_notice_template(template_id):
     if 'content' in data:
         template.content = data['content']
     if 'variables' in data:
-        template.variables = json.dumps(data['variables'])
+        template.variables = data['variables']
     if 'isDefault' in data:
         template.is_default = data['isDefault']
     
     template.updated_at = datetime.utcnow()
     db.session.commit()
+    cache.bump('template')
     
     return jsonify({
         'id': str(template.id),
@@ -1373,14 +5271,14 @@ def update_notice_template(template_id):
         'title': template.title,
         'content': template.content,
         'workspaceId': str(template.workspace_id),
-        'variables': json.loads(template.variables) if template.variables else [],
+        'variables': template.variables or [],
         'isDefault': template.is_default,
         'createdBy': str(template.created_by),
         'createdAt': template.created_at.isoformat(),
         'updatedAt': template.updated_at.isoformat()
     })
 
-@app.route('/api/notice-templates/<int:template_id>', methods=['DELETE'])
+@api.route('/api/notice-templates/<int:template_id>', methods=['DELETE'])
 @jwt_required()
 def delete_notice_template(template_id):
     current_user_id = int(get_jwt_identity())
@@ -1395,12 +5293,14 @@ def delete_notice_template(template_id):
     if not current_user.is_admin and template.created_by != current_user_id and workspace.created_by != current_user_id:
         return jsonify({'message': '권한이 없습니다.'}), 403
     
+    record_tombstone('template', template.id, workspace_id=template.workspace_id)
     db.session.delete(template)
     db.session.commit()
+    cache.bump('template')
     
     return '', 204
 
-@app.route('/api/notice-templates/<int:template_id>/preview', methods=['POST'])
+@api.route('/api/notice-templates/<int:template_id>/preview', methods=['POST'])
 @jwt_required()
 def preview_template(template_id):
     current_user_id = int(get_jwt_identity())
@@ -1464,6 +5364,222 @@ def preview_template(template_id):
         'content': content
     })
 
+@api.cli.command('init-db')
+def init_db_command():
+    """데이터베이스 테이블 생성 및 기본 데이터 입력"""
+    init_db()
+
+# 애플리케이션 팩토리
+_app = None
+_app_lock = threading.Lock()
+
+def load_config(app, config=None):
+    """기본 설정 -> 환경 변수 -> 인자 순으로 설정 적용"""
+    app.config.from_mapping(DEFAULT_CONFIG)
+    for key, cast in ENV_CONFIG_TYPES.items():
+        value = os.environ.get(f'FASTLM_{key}')
+        if value is not None:
+            app.config[key] = cast(value)
+    if os.environ.get('FASTLM_SCHEDULER_ENABLED') is not None:
+        app.config['SCHEDULER_ENABLED'] = os.environ['FASTLM_SCHEDULER_ENABLED'] == '1'
+    if os.environ.get('FASTLM_CACHE_ENABLED') is not None:
+        app.config['CACHE_ENABLED'] = os.environ['FASTLM_CACHE_ENABLED'] == '1'
+    if config:
+        app.config.update(config)
+
+def create_app(config=None):
+    """Flask 애플리케이션 생성
+    
+    설정 적용과 확장 바인딩만 수행합니다. 스케줄러는 SCHEDULER_ENABLED가 켜진 경우에만
+    시작하고, 테이블 생성/기본 데이터 입력은 init_db(또는 `flask init-db`)에서 수행합니다.
+    """
+    global _app
+    
+    app = Flask(__name__)
+    load_config(app, config)
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {'connect_args': {'timeout': app.config['DB_BUSY_TIMEOUT']}})
+    configure_logging(app)
+    
+    db.init_app(app)
+    jwt.init_app(app)
+    cors.init_app(app)
+    cache.init_app(app)
+    app.register_blueprint(api)
+    
+    # 여러 워커 프로세스가 같은 SQLite 파일에 쓰므로 WAL 모드 사용
+    if app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+        with app.app_context():
+            event.listen(db.engine, 'connect', set_sqlite_pragmas)
+    
+    _app = app
+    
+    if app.config['SCHEDULER_ENABLED']:
+        if app.config['SCHEDULER_LEADER_ELECTION']:
+            start_scheduler_election(app)
+        else:
+            start_scheduler(app)
+    
+    return app
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    # 새 DB 파일이 증분 VACUUM을 지원하도록 함 (WAL 전환 전, 테이블이 생기기 전에만 적용되고 기존 DB에서는 무시됨)
+    cursor.execute('PRAGMA auto_vacuum=INCREMENTAL')
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.close()
+
+def get_app():
+    """요청 밖(스케줄러 작업, CLI 스크립트)에서 사용할 애플리케이션. 없으면 스케줄러 없이 생성"""
+    if _app is None:
+        with _app_lock:
+            if _app is None:
+                create_app()
+    return _app
+
+def start_scheduler(app):
+    """백그라운드 스케줄러 시작 및 주기 작업 등록 (프로세스당 한 번)"""
+    if scheduler.running:
+        return
+    
+    # 동시에 몰리는 전송(예: 09:00 입실 공지)을 처리할 실행 스레드 수와 기본 misfire 정책
+    scheduler.configure(
+        executors={'default': SchedulerThreadPoolExecutor(app.config['SCHEDULER_EXECUTOR_WORKERS'])},
+        job_defaults={
+            'misfire_grace_time': app.config['SCHEDULER_MISFIRE_GRACE_TIME'],
+            'coalesce': app.config['SCHEDULER_COALESCE'],
+            'max_instances': app.config['SCHEDULER_MAX_INSTANCES']
+        }
+    )
+    scheduler.remove_listener(on_scheduler_job_missed)  # 리더 재선출로 다시 시작할 때 중복 등록 방지
+    scheduler.add_listener(on_scheduler_job_missed, EVENT_JOB_MISSED)
+    start_dispatch_workers(app)
+    scheduler.start()
+    
+    # DB에 남아 있는 대기 작업 복원 후, 다른 워커에서 추가되는 작업을 주기적으로 가져옴
+    sync_scheduler_jobs(full=True)
+    scheduler.add_job(
+        func=sync_scheduler_jobs,
+        trigger='interval',
+        seconds=app.config['SCHEDULER_SYNC_INTERVAL'],
+        id='sync_scheduler_jobs',
+        replace_existing=True,
+        coalesce=True
+    )
+    
+    # 스케줄러 작업과 DB 예약 작업의 불일치를 주기적으로 정리
+    scheduler.add_job(
+        func=reconcile_scheduler_jobs,
+        trigger='interval',
+        seconds=app.config['SCHEDULER_RECONCILE_INTERVAL'],
+        id='reconcile_scheduler_jobs',
+        replace_existing=True,
+        coalesce=True
+    )
+    
+    with app.app_context():
+        # 중단된 워크스페이스 삭제 작업 재개
+        resume_workspace_purges()
+    
+    # 오래된 공지 보관 작업 등록
+    schedule_archive_job()
+    
+    # DB 백업/유지보수 작업 등록
+    schedule_maintenance_jobs(app)
+    
+    # 오래된 이벤트 정리 작업 등록
+    scheduler.add_job(
+        func=prune_notice_events,
+        trigger='interval',
+        hours=1,
+        id='prune_notice_events',
+        replace_existing=True
+    )
+    
+    # 오래된 동기화 삭제 기록 정리 작업 등록
+    scheduler.add_job(
+        func=prune_sync_tombstones,
+        trigger='interval',
+        hours=24,
+        id='prune_sync_tombstones',
+        replace_existing=True
+    )
+
+def stop_scheduler():
+    """리더 자격을 잃었을 때 스케줄러 중지 (다른 리더와 중복 실행 방지)"""
+    if not scheduler.running:
+        return
+    scheduler.remove_all_jobs()
+    scheduler.shutdown(wait=False)
+    stop_dispatch_workers()
+
+# 스케줄러 리더 선출 (DB 임대)
+SCHEDULER_LEASE_NAME = 'scheduler'
+scheduler_owner_id = None  # 선출에 참여하는 워커 식별자 (fork 이후 워커마다 생성)
+
+def try_acquire_scheduler_lease(ttl):
+    """임대를 새로 얻거나 갱신하면 True. 다른 워커가 유효한 임대를 가지고 있으면 False"""
+    now = datetime.utcnow()
+    expires_at = now + timedelta(seconds=ttl)
+    
+    try:
+        result = db.session.execute(
+            db.update(SchedulerLease)
+            .where(SchedulerLease.name == SCHEDULER_LEASE_NAME)
+            .where((SchedulerLease.owner == scheduler_owner_id) | (SchedulerLease.expires_at < now))
+            .values(owner=scheduler_owner_id, expires_at=expires_at)
+        )
+        if result.rowcount == 0 and not db.session.get(SchedulerLease, SCHEDULER_LEASE_NAME):
+            db.session.add(SchedulerLease(name=SCHEDULER_LEASE_NAME, owner=scheduler_owner_id, expires_at=expires_at))
+            db.session.commit()
+            return True
+        db.session.commit()
+        return result.rowcount == 1
+    except Exception:
+        db.session.rollback()
+        return False
+
+def release_scheduler_lease():
+    if not scheduler_owner_id:
+        return
+    with get_app().app_context():
+        SchedulerLease.query.filter_by(name=SCHEDULER_LEASE_NAME, owner=scheduler_owner_id).delete()
+        db.session.commit()
+
+def run_scheduler_election(app):
+    """임대를 주기적으로 얻거나 갱신하고, 리더일 때만 스케줄러를 실행"""
+    ttl = app.config['SCHEDULER_LEASE_TTL']
+    while True:
+        with app.app_context():
+            is_leader = try_acquire_scheduler_lease(ttl)
+            db.session.remove()
+        
+        if is_leader and not scheduler.running:
+            scheduler_logger.info('스케줄러 리더로 선출되었습니다', extra=log_fields(owner=scheduler_owner_id))
+            start_scheduler(app)
+        elif not is_leader and scheduler.running:
+            scheduler_logger.warning('스케줄러 리더 자격을 잃었습니다', extra=log_fields(owner=scheduler_owner_id))
+            stop_scheduler()
+        
+        time.sleep(ttl / 3)
+
+def start_scheduler_election(app):
+    global scheduler_owner_id
+    scheduler_owner_id = f'{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}'
+    threading.Thread(target=run_scheduler_election, args=[app], name='scheduler-election', daemon=True).start()
+
+def __getattr__(name):
+    # 기존 `from app import app` 사용 코드 호환
+    if name == 'app':
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 if __name__ == '__main__':
+    app = create_app()
     init_db()
+    
+    # 디버그 리로더의 감시 프로세스에서는 스케줄러를 띄우지 않음 (중복 스케줄러 방지)
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_scheduler(app)
+    
     app.run(debug=True, port=5000) 
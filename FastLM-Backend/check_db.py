@@ -1,7 +1,8 @@
-from app import app, db, User
+from app import create_app, db, User
 import sys
 
 def check_database():
+    app = create_app()
     with app.app_context():
         # 모든 사용자 조회
         users = User.query.all()
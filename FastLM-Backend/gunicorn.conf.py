@@ -0,0 +1,39 @@
+"""gunicorn 설정 (운영 환경 다중 워커 실행)"""
+import multiprocessing
+import os
+import subprocess
+import sys
+
+bind = os.environ.get('FASTLM_BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('FASTLM_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+timeout = 60
+
+# gthread: 요청마다 스레드를 점유 (동시 처리 수 = 워커 × FASTLM_THREADS)
+# gevent: 웹훅 전송/SSE처럼 외부 응답을 기다리는 동안 다른 요청을 처리 (동시 처리 수 = 워커 × FASTLM_WORKER_CONNECTIONS)
+#   단, SQLite 호출과 CPU 작업(비밀번호 해시 등)은 협력 전환 없이 실행되어 그동안 워커 전체(SSE, 스케줄러 포함)가 멈춥니다.
+#   그래서 wsgi.py는 gevent 모드에서 SQLite 잠금 대기 시간을 2초로 줄입니다 (FASTLM_DB_BUSY_TIMEOUT).
+worker_class = os.environ.get('FASTLM_WORKER_CLASS', 'gthread')
+threads = int(os.environ.get('FASTLM_THREADS', 4))
+worker_connections = int(os.environ.get('FASTLM_WORKER_CONNECTIONS', 1000))
+
+# 워커별로 스케줄러/선출 스레드를 만들어야 하므로 마스터에서 앱을 미리 로드하지 않음
+preload_app = False
+
+def on_starting(server):
+    """마스터 프로세스에서 한 번만 테이블 생성 및 기본 데이터 입력
+    
+    마스터가 app 모듈을 import하면 fork된 워커에 패치 전 스레드/잠금이 남아 gevent 워커가 멈출 수 있으므로
+    별도 프로세스(`flask init-db`)에서 실행합니다.
+    """
+    subprocess.run(
+        [sys.executable, '-m', 'flask', '--app', 'app', 'init-db'],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        check=True
+    )
+
+def worker_exit(server, worker):
+    """정상 종료 시 리더 임대를 즉시 반납해 다른 워커가 바로 승계하도록 함"""
+    from app import stop_scheduler, release_scheduler_lease
+    
+    stop_scheduler()
+    release_scheduler_lease()
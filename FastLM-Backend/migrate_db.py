@@ -59,6 +59,69 @@ def migrate_database():
             else:
                 print(f"❌ selected_webhook_url 컬럼 추가 실패: {e}")
         
+        # target_webhook_urls 컬럼 추가
+        try:
+            cursor.execute('ALTER TABLE notice ADD COLUMN target_webhook_urls TEXT')
+            print("✅ target_webhook_urls 컬럼 추가 완료")
+        except sqlite3.OperationalError as e:
+            if "duplicate column name" in str(e):
+                print("⚠️ target_webhook_urls 컬럼 이미 존재")
+            else:
+                print(f"❌ target_webhook_urls 컬럼 추가 실패: {e}")
+        
+        # priority 컬럼 추가 (전송 레인 지정)
+        try:
+            cursor.execute('ALTER TABLE notice ADD COLUMN priority VARCHAR(20)')
+            print("✅ priority 컬럼 추가 완료")
+        except sqlite3.OperationalError as e:
+            if "duplicate column name" in str(e):
+                print("⚠️ priority 컬럼 이미 존재")
+            else:
+                print(f"❌ priority 컬럼 추가 실패: {e}")
+        
+        # updated_at 컬럼 추가 (변경분 동기화용)
+        try:
+            cursor.execute('ALTER TABLE notice ADD COLUMN updated_at DATETIME')
+            cursor.execute('UPDATE notice SET updated_at = COALESCE(sent_at, created_at) WHERE updated_at IS NULL')
+            print("✅ updated_at 컬럼 추가 완료")
+        except sqlite3.OperationalError as e:
+            if "duplicate column name" in str(e):
+                print("⚠️ updated_at 컬럼 이미 존재")
+            else:
+                print(f"❌ updated_at 컬럼 추가 실패: {e}")
+        
+        # ScheduledJob 테이블에 updated_at 컬럼 추가 (리더 스케줄러 동기화용)
+        print("ScheduledJob 테이블 업데이트 중...")
+        try:
+            cursor.execute('ALTER TABLE scheduled_job ADD COLUMN updated_at DATETIME')
+            cursor.execute('UPDATE scheduled_job SET updated_at = COALESCE(executed_at, CURRENT_TIMESTAMP) WHERE updated_at IS NULL')
+            print("✅ scheduled_job.updated_at 컬럼 추가 완료")
+        except sqlite3.OperationalError as e:
+            if "duplicate column name" in str(e):
+                print("⚠️ scheduled_job.updated_at 컬럼 이미 존재")
+            else:
+                print(f"❌ scheduled_job.updated_at 컬럼 추가 실패: {e}")
+        
+        # 예약 시간 대비 전송 지연 기록용 컬럼 추가
+        try:
+            cursor.execute('ALTER TABLE scheduled_job ADD COLUMN delay_seconds INTEGER')
+            print("✅ scheduled_job.delay_seconds 컬럼 추가 완료")
+        except sqlite3.OperationalError as e:
+            if "duplicate column name" in str(e):
+                print("⚠️ scheduled_job.delay_seconds 컬럼 이미 존재")
+            else:
+                print(f"❌ scheduled_job.delay_seconds 컬럼 추가 실패: {e}")
+        
+        # 선점 전 작업 상태 기록용 컬럼 추가 (중단된 작업의 카운터 보정)
+        try:
+            cursor.execute('ALTER TABLE scheduled_job ADD COLUMN claimed_from VARCHAR(20)')
+            print("✅ scheduled_job.claimed_from 컬럼 추가 완료")
+        except sqlite3.OperationalError as e:
+            if "duplicate column name" in str(e):
+                print("⚠️ scheduled_job.claimed_from 컬럼 이미 존재")
+            else:
+                print(f"❌ scheduled_job.claimed_from 컬럼 추가 실패: {e}")
+        
         # Workspace 테이블에 누락된 컬럼들 추가
         print("Workspace 테이블 업데이트 중...")
         
@@ -79,11 +142,66 @@ def migrate_database():
         except sqlite3.OperationalError as e:
             print(f"⚠️ slack_webhook_name 기본값 설정 실패: {e}")
         
+        # JSON 컬럼 값 검사 (JSON 타입 컬럼은 읽을 때 디코딩하므로 깨진 값이 있으면 해당 행 조회가 실패함)
+        print("JSON 컬럼 검사 중...")
+        for table, column in (('workspace', 'webhook_urls'), ('notice', 'form_data'), ('notice', 'variable_data'),
+                              ('notice', 'target_webhook_urls'), ('notice_template', 'variables')):
+            try:
+                cursor.execute(f"UPDATE {table} SET {column} = NULL WHERE {column} IS NOT NULL AND NOT json_valid({column})")
+                print(f"✅ {table}.{column} 검사 완료 (잘못된 값 {cursor.rowcount}건 정리)")
+            except sqlite3.OperationalError as e:
+                print(f"❌ {table}.{column} 검사 실패: {e}")
+        
+        # 인덱스 생성
+        print("인덱스 생성 중...")
+        
+        # 캘린더 조회용 (workspace_id, scheduled_at) 인덱스
+        try:
+            cursor.execute('CREATE INDEX IF NOT EXISTS ix_notice_workspace_scheduled_at ON notice (workspace_id, scheduled_at)')
+            print("✅ ix_notice_workspace_scheduled_at 인덱스 생성 완료")
+        except sqlite3.OperationalError as e:
+            print(f"❌ ix_notice_workspace_scheduled_at 인덱스 생성 실패: {e}")
+        
+        # 공지별 예약 작업 조회/삭제용 인덱스
+        try:
+            cursor.execute('CREATE INDEX IF NOT EXISTS ix_scheduled_job_notice_id ON scheduled_job (notice_id)')
+            print("✅ ix_scheduled_job_notice_id 인덱스 생성 완료")
+        except sqlite3.OperationalError as e:
+            print(f"❌ ix_scheduled_job_notice_id 인덱스 생성 실패: {e}")
+        
+        # 줌 퇴장 기록 기간 조회/내보내기용 인덱스
+        try:
+            cursor.execute('CREATE INDEX IF NOT EXISTS ix_zoom_exit_record_workspace_timestamp ON zoom_exit_record (workspace_id, timestamp)')
+            print("✅ ix_zoom_exit_record_workspace_timestamp 인덱스 생성 완료")
+        except sqlite3.OperationalError as e:
+            print(f"❌ ix_zoom_exit_record_workspace_timestamp 인덱스 생성 실패: {e}")
+        
+        # 변경분 동기화용 updated_at 인덱스
+        for table in ('workspace', 'notice', 'notice_template', 'scheduled_job'):
+            try:
+                cursor.execute(f'CREATE INDEX IF NOT EXISTS ix_{table}_updated_at ON {table} (updated_at)')
+                print(f"✅ ix_{table}_updated_at 인덱스 생성 완료")
+            except sqlite3.OperationalError as e:
+                print(f"❌ ix_{table}_updated_at 인덱스 생성 실패: {e}")
+        
         # 외래 키 제약 조건 추가 (SQLite에서는 기존 테이블에 FK 추가가 어려우므로 건너뜀)
         print("⚠️ 외래 키 제약 조건은 SQLite 제한으로 인해 건너뜀")
         
         # 변경사항 커밋
         conn.commit()
+        
+        # 증분 VACUUM 전환 (기존 DB는 VACUUM으로 파일을 다시 써야 적용됨, 실행 중 쓰기가 막히므로 점검 시간에 실행)
+        cursor.execute('PRAGMA auto_vacuum')
+        if cursor.fetchone()[0] != 2:
+            try:
+                cursor.execute('PRAGMA auto_vacuum=INCREMENTAL')
+                cursor.execute('VACUUM')
+                print("✅ auto_vacuum INCREMENTAL 전환 완료")
+            except sqlite3.OperationalError as e:
+                print(f"❌ auto_vacuum INCREMENTAL 전환 실패: {e}")
+        else:
+            print("⚠️ auto_vacuum 이미 INCREMENTAL")
+        
         print("✅ 데이터베이스 마이그레이션 완료!")
         
         # 최종 스키마 확인
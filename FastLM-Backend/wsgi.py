@@ -0,0 +1,24 @@
+"""운영 환경 WSGI 진입점
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+    FASTLM_WORKER_CLASS=gevent gunicorn -c gunicorn.conf.py wsgi:app  # 외부 호출/SSE 대기 중 스레드를 점유하지 않음
+
+워커마다 애플리케이션을 생성하고, DB 임대로 선출된 워커 한 곳에서만 스케줄러를 실행합니다.
+여러 워커가 조회 캐시를 공유하도록 기본 캐시 백엔드는 sqlite(instance/cache.db)를 사용합니다.
+"""
+import os
+
+from app import create_app
+
+config = {
+    'SCHEDULER_ENABLED': True,
+    'SCHEDULER_LEADER_ELECTION': True,
+    'CACHE_BACKEND': os.environ.get('FASTLM_CACHE_BACKEND', 'sqlite'),
+}
+
+# gevent 워커에서는 SQLite 호출이 허브를 막아 잠금을 기다리는 동안 같은 워커의 모든 요청/SSE/스케줄러가 멈추므로
+# 오래 기다리지 않고 실패시킴 (FASTLM_DB_BUSY_TIMEOUT으로 조정)
+if os.environ.get('FASTLM_WORKER_CLASS') == 'gevent' and 'FASTLM_DB_BUSY_TIMEOUT' not in os.environ:
+    config['DB_BUSY_TIMEOUT'] = 2
+
+app = create_app(config)
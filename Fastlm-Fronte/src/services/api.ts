@@ -53,6 +53,27 @@ export const authAPI = {
       throw new Error('Token verification failed');
     }
     
+    return response.json();
+  },
+
+  // 첫 화면 데이터 (사용자, 워크스페이스, 선택한 워크스페이스의 카테고리/템플릿) 한 번에 조회
+  async bootstrap(workspaceId?: string): Promise<{
+    user: User;
+    workspaces: Workspace[];
+    selectedWorkspaceId: number | null;
+    categories: NoticeCategory[];
+    templates: NoticeTemplate[];
+    watermark: string;
+  }> {
+    const params = workspaceId ? `?workspaceId=${workspaceId}` : '';
+    const response = await fetch(`${API_BASE_URL}/bootstrap${params}`, {
+      headers: getAuthHeaders()
+    });
+    
+    if (!response.ok) {
+      throw new Error('Failed to load initial data');
+    }
+    
     return response.json();
   }
 };